@@ -3,6 +3,8 @@ import time
 import sys
 import itertools
 import multiprocessing
+import os
+import tempfile
 import array, numpy, rpy2.robjects as ro
 import rpy2.robjects.packages
 from rpy2.robjects import Formula
@@ -271,3 +273,229 @@ for coef_name, sp in zip(df.rownames, speedup):
 res.append(' '.join(["=" * pad_len[x] for x in range(3)]))
 print(os.linesep.join(res))
 
+
+
+# Repeated calls to the same R function: building the R call each time
+# vs a prepared call (the call is built once and only its arguments
+# are replaced).
+def test_call(queue, n, prepared):
+    import rpy2.rinterface as module
+    module.initr()
+    rsum = module.baseenv['sum']
+    x = module.FloatSexpVector([random.random() for i in range(100)])
+    na_rm = module.BoolSexpVector([True])
+    time_beg = time.time()
+    if prepared:
+#-- prepared_call-begin
+        call = rsum.prepare((None, 'na.rm'))
+        for i in range(n):
+            res = call(x, na_rm)
+#-- prepared_call-end
+    else:
+        for i in range(n):
+            res = rsum(x, **{'na.rm': na_rm})
+    time_end = time.time()
+    queue.put(time_end - time_beg)
+
+
+n_calls = 100000
+header = ("Call", "Speedup")
+res = [' '.join(["=" * pad_len[x] for x in range(2)]),
+       ' '.join([header[x].ljust(pad_len[x]) for x in range(2)]),
+       ' '.join(["=" * pad_len[x] for x in range(2)])]
+times_call = []
+for prepared in (False, True):
+    p = multiprocessing.Process(target=test_call,
+                                args=(q, n_calls, prepared))
+    p.start()
+    times_call.append(q.get())
+    p.join()
+for label, t in zip(('call', 'prepared call'), times_call):
+    res.append(' '.join((label.ljust(pad_len[0]),
+                         ('%.2f' % (times_call[0] / t)).ljust(pad_len[1]))))
+res.append(' '.join(["=" * pad_len[x] for x in range(2)]))
+print(os.linesep.join(res))
+
+
+# Calls from R to a Python function (for example an objective function
+# called by an R optimizer).
+def test_callback(queue, n):
+    import rpy2.rinterface as module
+    module.initr()
+
+#-- callback-begin
+    @module.rternalize
+    def f(x, /):
+        return x
+
+    r_sapply = module.baseenv['sapply']
+    x = module.IntSexpVector(range(n))
+    time_beg = time.time()
+    res = r_sapply(x, f)
+    time_end = time.time()
+#-- callback-end
+    queue.put(time_end - time_beg)
+
+
+p = multiprocessing.Process(target=test_callback, args=(q, n_calls))
+p.start()
+time_callback = q.get()
+p.join()
+print('%i calls from R to Python: %.2f calls per second.' %
+      (n_calls, n_calls / time_callback))
+
+
+# Creating and dropping many Python objects mapping R objects (each
+# R object must be protected from R's garbage collection while mapped).
+def test_capsules(queue, n):
+    import rpy2.rinterface as module
+    module.initr()
+    x = module.baseenv['as.list'](module.IntSexpVector(range(n)))
+    time_beg = time.time()
+#-- capsules-begin
+    elements = [x[i] for i in range(n)]
+    del elements
+#-- capsules-end
+    time_end = time.time()
+    queue.put(time_end - time_beg)
+
+
+n_capsules = 1000000
+p = multiprocessing.Process(target=test_capsules, args=(q, n_capsules))
+p.start()
+time_capsules = q.get()
+p.join()
+print('%i R objects mapped and released: %.2f seconds.' %
+      (n_capsules, time_capsules))
+
+
+# Transfer of string vectors with repeated values (for example a column
+# of categorical labels in a data frame).
+def test_strings(queue, n):
+    import rpy2.rinterface as module
+    module.initr()
+    values = ['label_%i' % (i % 1000) for i in range(n)]
+    time_beg = time.time()
+#-- strings-begin
+    x = module.StrSexpVector(values)
+    res = x.to_list()
+#-- strings-end
+    time_end = time.time()
+    queue.put(time_end - time_beg)
+
+
+n_strings = 1000000
+p = multiprocessing.Process(target=test_strings, args=(q, n_strings))
+p.start()
+time_strings = q.get()
+p.join()
+print('%i strings to R and back: %.2f seconds.' %
+      (n_strings, time_strings))
+
+
+# Importing R packages with many symbols, with all R objects converted
+# at import time or on first access (lazy).
+def test_importr(queue, lazy):
+    from rpy2.robjects.packages import importr
+    time_beg = time.time()
+#-- importr-begin
+    for name in ('base', 'stats', 'utils', 'methods'):
+        importr(name, on_conflict='warn', lazy=lazy)
+#-- importr-end
+    time_end = time.time()
+    queue.put(time_end - time_beg)
+
+
+for lazy in (False, True):
+    p = multiprocessing.Process(target=test_importr, args=(q, lazy))
+    p.start()
+    time_importr = q.get()
+    p.join()
+    print('importr() for base, stats, utils, and methods (lazy=%s): '
+          '%.2f seconds.' % (lazy, time_importr))
+
+
+# Importing R packages with the cache of translated symbols and
+# signatures empty, and then filled.
+def test_importr_cache(queue, path):
+    from rpy2.robjects import packages_cache
+    from rpy2.robjects.packages import importr
+    packages_cache.set_cache(packages_cache.PackagesCache(path))
+    time_beg = time.time()
+#-- importr_cache-begin
+    for name in ('base', 'stats', 'utils', 'methods'):
+        importr(name, on_conflict='warn')
+#-- importr_cache-end
+    time_end = time.time()
+    queue.put(time_end - time_beg)
+
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    path = os.path.join(tmpdir, 'packages.sqlite3')
+    for cache in ('empty', 'filled'):
+        p = multiprocessing.Process(target=test_importr_cache,
+                                    args=(q, path))
+        p.start()
+        time_importr = q.get()
+        p.join()
+        print('importr() for base, stats, utils, and methods (cache %s): '
+              '%.2f seconds.' % (cache, time_importr))
+
+
+# Finding the help pages for a topic in all installed packages, with the
+# index of help pages empty, and then filled.
+def test_help_pages(queue, path):
+    import rpy2.robjects.help as rhelp
+    rhelp.set_index(rhelp.HelpIndex(path))
+    time_beg = time.time()
+#-- help_pages-begin
+    rhelp.pages('plot')
+#-- help_pages-end
+    time_end = time.time()
+    queue.put(time_end - time_beg)
+
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    path = os.path.join(tmpdir, 'help.sqlite3')
+    for index in ('empty', 'filled'):
+        p = multiprocessing.Process(target=test_help_pages,
+                                    args=(q, path))
+        p.start()
+        time_pages = q.get()
+        p.join()
+        print('help.pages() for all installed packages (index %s): '
+              '%.2f seconds.' % (index, time_pages))
+
+
+# Creating Python classes for dozens of S4 classes in an R package, and
+# then building their docstrings from the R documentation (on first
+# access).
+def test_s4classes(queue, packagename, n):
+    from rpy2.robjects import methods
+    # get_classnames() looks for the classes in the attached package.
+    ro.r('suppressPackageStartupMessages(library(%s))' % packagename)
+    classnames = methods.get_classnames(packagename)[:n]
+    time_beg = time.time()
+#-- s4classes-begin
+    classes = [
+        methods.RS4Auto_Type(name, (methods.RS4, ),
+                             {'__rname__': name,
+                              '__rpackagename__': packagename})
+        for name in classnames
+    ]
+#-- s4classes-end
+    time_classes = time.time() - time_beg
+    time_beg = time.time()
+    for cls in classes:
+        cls.__doc__
+    time_doc = time.time() - time_beg
+    queue.put((len(classes), time_classes, time_doc))
+
+
+p = multiprocessing.Process(target=test_s4classes, args=(q, 'Matrix', 36))
+p.start()
+n_classes, time_classes, time_doc = q.get()
+p.join()
+print('%i S4 classes in Matrix: %.2f seconds to create the classes, '
+      '%.2f seconds for their docstrings.' %
+      (n_classes, time_classes, time_doc))
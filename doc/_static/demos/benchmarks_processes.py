@@ -0,0 +1,111 @@
+"""Benchmarks for processes with an embedded R.
+
+The processes are started with the "spawn" method of multiprocessing,
+which imports this script in each process: the benchmarks only run
+when it is the main script."""
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+
+def _forked_ready(conn):
+    conn.send(True)
+
+
+def _cold_ready(conn):
+    import rpy2.rinterface as module
+    from rpy2.robjects.packages import importr
+    module.initr()
+    importr('stats')
+    conn.send(True)
+
+
+# Time to import rpy2's interface to R's C library (which finds the R
+# installation) in a new Python process, without and with the cache for
+# the situation.
+def test_import(n):
+    cmd = (sys.executable, '-c', 'import rpy2.rinterface_lib.openrlib')
+    res = []
+    for cache in ('false', 'true'):
+        env = dict(os.environ, RPY2_SITUATION_CACHE=cache)
+        # Fill the cache.
+        subprocess.check_call(cmd, env=env)
+        time_beg = time.time()
+#-- import-begin
+        for i in range(n):
+            subprocess.check_call(cmd, env=env)
+#-- import-end
+        res.append(time.time() - time_beg)
+    return res
+
+
+# Startup latency for processes with an embedded R ready to use: cold
+# start (a new process initializing R and importing packages) against
+# a process forked by a fork server.
+def test_startup(n):
+    from rpy2.robjects.forkserver import ForkServer
+    mp_context = multiprocessing.get_context('spawn')
+    time_beg = time.time()
+#-- startup-cold-begin
+    for i in range(n):
+        parent_conn, child_conn = mp_context.Pipe()
+        process = mp_context.Process(target=_cold_ready, args=(child_conn, ))
+        process.start()
+        parent_conn.recv()
+        process.join()
+#-- startup-cold-end
+    time_cold = time.time() - time_beg
+    with ForkServer(packages=('stats', )) as server:
+        time_beg = time.time()
+#-- startup-forked-begin
+        for i in range(n):
+            process = server.fork(_forked_ready)
+            process.conn.recv()
+            process.join()
+#-- startup-forked-end
+        time_forked = time.time() - time_beg
+    return time_cold, time_forked
+
+
+# Scaling of a pool of R worker processes (bootstrap of the median of
+# a vector moved to the workers through shared memory).
+def test_pool(n):
+    import rpy2.robjects as robjects
+    from rpy2.robjects.pool import WorkerPool
+    x = robjects.FloatVector(range(100000))
+    res = []
+    for processes in range(1, (os.cpu_count() or 1) + 1):
+        with WorkerPool(processes, packages=('stats', )) as pool:
+            time_beg = time.time()
+#-- pool-begin
+            futures = [
+                pool.submit('function(x) median(sample(x, replace=TRUE))', x)
+                for i in range(n)
+            ]
+            estimates = [f.result()[0] for f in futures]
+#-- pool-end
+            time_end = time.time()
+        res.append((processes, time_end - time_beg))
+    return res
+
+
+if __name__ == '__main__':
+    n_imports = 20
+    time_nocache, time_cache = test_import(n_imports)
+    print('Import of rpy2.rinterface_lib.openrlib: %.3f seconds '
+          '(situation not cached), %.3f seconds (cached).' %
+          (time_nocache / n_imports, time_cache / n_imports))
+
+    n_startups = 20
+    time_cold, time_forked = test_startup(n_startups)
+    print('Startup of a process with R ready: %.3f seconds (cold), '
+          '%.3f seconds (fork server).' %
+          (time_cold / n_startups, time_forked / n_startups))
+
+    n_bootstrap = 200
+    for processes, time_pool in test_pool(n_bootstrap):
+        print('%i bootstrap replicates with %i worker processes: '
+              '%.2f seconds.' % (n_bootstrap, processes, time_pool))
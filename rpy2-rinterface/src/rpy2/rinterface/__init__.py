@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import atexit
+import concurrent.futures
 import contextlib
 import contextvars
 import csv
@@ -22,9 +24,11 @@ from typing import Union
 from rpy2.rinterface_lib import openrlib
 import rpy2.rinterface_lib._rinterface_capi as _rinterface
 import rpy2.rinterface_lib.embedded as embedded
+from rpy2.rinterface_lib import executor
 import rpy2.rinterface_lib.conversion as conversion
 from rpy2.rinterface_lib.conversion import _cdata_res_to_rinterface
 import rpy2.rinterface_lib.memorymanagement as memorymanagement
+from rpy2.rinterface_lib import altrep
 from rpy2.rinterface_lib import na_values
 from rpy2.rinterface_lib.sexp import NULL
 from rpy2.rinterface_lib.sexp import NULLType
@@ -367,12 +371,23 @@ class SexpPromise(Sexp):
         return openrlib.rlib.Rf_eval(self.__sexp__._cdata, env)
 
 
+SexpVectorWithNumpyInterface_VT = typing.TypeVar(
+    'SexpVectorWithNumpyInterface_VT',
+    bound='SexpVectorWithNumpyInterface'
+)
+
+
 class SexpVectorWithNumpyInterface(SexpVector):
     """Numpy-specific API for accessing the content of a numpy array.
 
     This interface implements version 3 of Numpy's `__array_interface__`
     and is only available / possible for some of the R vectors."""
 
+    # Size of the elements, set in the concrete classes.
+    _R_SIZEOF_ELT: int
+    # Typed pointer to the data, or NULL (set in the concrete classes).
+    _R_GET_PTR_OR_NULL: typing.Callable[[typing.Any], typing.Any]
+
     @property
     @abc.abstractmethod
     def _NP_TYPESTR(self) -> str:
@@ -390,7 +405,7 @@ class SexpVectorWithNumpyInterface(SexpVector):
         the rpy2 object proxying the R object alive for the duration the
         pointer is used in Python / numpy."""
         shape = bufferprotocol.getshape(self.__sexp__._cdata)
-        data = openrlib.ffi.buffer(self._R_GET_PTR(self.__sexp__._cdata))
+        data = openrlib.ffi.buffer(self._readonly_ptr(self.__sexp__._cdata))
         strides = bufferprotocol.getstrides(self.__sexp__._cdata,
                                             shape,
                                             self._R_SIZEOF_ELT)
@@ -412,6 +427,126 @@ class SexpVectorWithNumpyInterface(SexpVector):
             )
         )
 
+    # Format of the items for memoryview.cast().
+    @property
+    @abc.abstractmethod
+    def _MV_FORMAT(self) -> str:
+        pass
+
+    def _readonly_ptr(self, cdata):
+        """Typed pointer to the data of the vector, for reading only.
+
+        R's DATAPTR() (behind _R_GET_PTR) is a writable pointer, and a
+        vector using the memory of a Python buffer would make a copy of
+        its data (see :mod:`rpy2.rinterface_lib.altrep`)."""
+        if altrep.is_buffer_backed(cdata):
+            return altrep.readonly_dataptr(cdata)
+        else:
+            return self._R_GET_PTR(cdata)
+
+    def _readonly_ptr_or_null(self, cdata):
+        # NULL for ALTREP vectors without their data in memory, which
+        # getting a pointer would expand in memory.
+        if altrep.is_buffer_backed(cdata):
+            return altrep.readonly_dataptr(cdata)
+        else:
+            return self._R_GET_PTR_OR_NULL(cdata)
+
+    def _c_memoryview(self, cdata, n: int) -> memoryview:
+        """Flat memoryview on the first n items of the vector.
+
+        Writing to it is only possible for vectors that are not using
+        the memory of a Python buffer."""
+        mview = memoryview(
+            openrlib.ffi.buffer(self._readonly_ptr(cdata),
+                                n * self._R_SIZEOF_ELT)
+        )
+        # The format is only known for the concrete classes.
+        return mview.cast(typing.cast(typing.Literal['B'], self._MV_FORMAT))
+
+    def _slice(
+            self: SexpVectorWithNumpyInterface_VT, i: slice
+    ) -> SexpVectorWithNumpyInterface_VT:
+        """Copy a slice of the vector into a new R vector.
+
+        A contiguous slice is copied with one memmove, and other slices
+        with a strided copy between memoryviews."""
+        cdata = self.__sexp__._cdata
+        n = openrlib.rlib.Rf_xlength(cdata)
+        start, stop, step = i.indices(n)
+        n_res = len(range(start, stop, step))
+        with memorymanagement.rmemory() as rmemory:
+            res = rmemory.protect(
+                openrlib.rlib.Rf_allocVector(self._R_TYPE, n_res)
+            )
+            if step == 1:
+                openrlib.ffi.memmove(self._R_GET_PTR(res),
+                                     self._readonly_ptr(cdata) + start,
+                                     n_res * self._R_SIZEOF_ELT)
+            elif n_res:
+                self._c_memoryview(res, n_res)[:] = (
+                    self._c_memoryview(cdata, n)[i]
+                )
+        return conversion._cdata_to_rinterface(res)
+
+    def view(
+            self: SexpVectorWithNumpyInterface_VT, i: slice
+    ) -> SexpVectorWithNumpyInterface_VT:
+        """Get a slice of the vector without copying the data.
+
+        The result is an R vector using the memory of this vector until
+        R needs to write to it, at which point R makes a copy of the
+        data (see :mod:`rpy2.rinterface_lib.altrep`). Changes made to
+        this vector are visible in the view until then.
+
+        This is only possible for slices with a step of 1, and vectors
+        of booleans, integers, or floats. A :class:`ValueError` is raised
+        otherwise."""
+        cdata = self.__sexp__._cdata
+        start, stop, step = i.indices(openrlib.rlib.Rf_xlength(cdata))
+        if step != 1:
+            raise ValueError('Views are only possible for slices with '
+                             'a step of 1.')
+        stop = max(start, stop)
+        # When this vector is itself using the memory of a Python buffer
+        # the view uses the same buffer, which it keeps alive.
+        mview = altrep.buffer_memoryview(cdata)
+        if mview is None:
+            mview = self._c_memoryview(cdata, stop)
+        res = altrep.new_buffer_vector(self._R_TYPE, mview[start:stop],
+                                       owner=self.__sexp__)
+        return conversion._cdata_to_rinterface(res)
+
+    @staticmethod
+    def _from_c_values(values: list) -> list:
+        """Map C values read from the vector to their Python values."""
+        return values
+
+    def _take_c(self, cdata, indices: typing.Sequence[int]) -> list:
+        # Values are read from the typed pointer to the data, in bulk
+        # when the indices are contiguous. ALTREP vectors without their
+        # data in memory (for example the compact sequence 1:1e9) are
+        # read one element at a time rather than expanded.
+        ptr = self._readonly_ptr_or_null(cdata)
+        if ptr == openrlib.ffi.NULL:
+            vector_elt = self._R_VECTOR_ELT
+            values = [vector_elt(cdata, i_c) for i_c in indices]
+        elif isinstance(indices, range) and indices.step == 1:
+            values = openrlib.ffi.unpack(ptr + indices.start, len(indices))
+        else:
+            values = [ptr[i_c] for i_c in indices]
+        return self._from_c_values(values)
+
+    def _put_values(self, values: typing.Iterable) -> typing.Sequence:
+        cast_in = self._CAST_IN
+        return [cast_in(v) for v in values]
+
+    def _put_c(self, cdata, indices: typing.Sequence[int],
+               values: typing.Sequence) -> None:
+        ptr = self._R_GET_PTR(cdata)
+        for i_c, v in zip(indices, values):
+            ptr[i_c] = v
+
 
 class ByteSexpVector(SexpVectorWithNumpyInterface):
     """Array of bytes.
@@ -422,8 +557,10 @@ class ByteSexpVector(SexpVectorWithNumpyInterface):
     _R_TYPE = openrlib.rlib.RAWSXP
     _R_SIZEOF_ELT = _rinterface.ffi.sizeof('char')
     _NP_TYPESTR = '|u1'
+    _MV_FORMAT = 'B'
 
     _R_GET_PTR = staticmethod(openrlib.RAW)
+    _R_GET_PTR_OR_NULL = staticmethod(openrlib.RAW_OR_NULL)
 
     @staticmethod
     def _CAST_IN(x: typing.Any) -> int:
@@ -441,8 +578,8 @@ class ByteSexpVector(SexpVectorWithNumpyInterface):
         return res
 
     @staticmethod
-    def _R_VECTOR_ELT(x, i: int) -> None:
-        return openrlib.RAW(x)[i]
+    def _R_VECTOR_ELT(x, i: int) -> int:
+        return openrlib.RAW_ELT(x, i)
 
     @staticmethod
     def _R_SET_VECTOR_ELT(x, i: int, val) -> None:
@@ -456,12 +593,7 @@ class ByteSexpVector(SexpVectorWithNumpyInterface):
             i_c = _rinterface._python_index_to_c(cdata, i)
             res = openrlib.RAW_ELT(cdata, i_c)
         elif isinstance(i, slice):
-            res = type(self).from_iterable(
-                [openrlib.RAW_ELT(
-                    cdata, i_c
-                ) for i_c in range(*i.indices(len(self)))
-                ]
-            )
+            res = self._slice(i)
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -491,9 +623,11 @@ class BoolSexpVector(SexpVectorWithNumpyInterface):
     _R_TYPE = openrlib.rlib.LGLSXP
     _R_SIZEOF_ELT = _rinterface.ffi.sizeof('Rboolean')
     _NP_TYPESTR = '|i'
+    _MV_FORMAT = 'i'
     _R_VECTOR_ELT = openrlib.LOGICAL_ELT
     _R_SET_VECTOR_ELT = openrlib.SET_LOGICAL_ELT
     _R_GET_PTR = staticmethod(openrlib.LOGICAL)
+    _R_GET_PTR_OR_NULL = staticmethod(openrlib.LOGICAL_OR_NULL)
 
     @staticmethod
     def _CAST_IN(x):
@@ -515,10 +649,7 @@ class BoolSexpVector(SexpVectorWithNumpyInterface):
             res = (na_values.NA_Logical  # type: ignore
                    if elt == NA_Logical else bool(elt))
         elif isinstance(i, slice):
-            res = type(self).from_iterable(
-                [openrlib.LOGICAL_ELT(cdata, i_c)
-                 for i_c in range(*i.indices(len(self)))]
-            )
+            res = self._slice(i)
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -538,6 +669,11 @@ class BoolSexpVector(SexpVectorWithNumpyInterface):
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
 
+    @staticmethod
+    def _from_c_values(values: list) -> list:
+        return [na_values.NA_Logical if elt == NA_Logical else bool(elt)
+                for elt in values]
+
     def memoryview(self) -> memoryview[int]:
         return vector_memoryview(self, 'int', 'i')
 
@@ -556,8 +692,10 @@ class IntSexpVector(SexpVectorWithNumpyInterface):
     _R_VECTOR_ELT = openrlib.INTEGER_ELT
     _R_SIZEOF_ELT = _rinterface.ffi.sizeof('int')
     _NP_TYPESTR = '|i'
+    _MV_FORMAT = 'i'
 
     _R_GET_PTR = staticmethod(openrlib.INTEGER)
+    _R_GET_PTR_OR_NULL = staticmethod(openrlib.INTEGER_OR_NULL)
     _CAST_IN = staticmethod(nullable_int)
 
     def __getitem__(self, i: Union[int, slice]) -> Union[int, 'IntSexpVector']:
@@ -568,11 +706,7 @@ class IntSexpVector(SexpVectorWithNumpyInterface):
             if res == NA_Integer:
                 res = NA_Integer
         elif isinstance(i, slice):
-            res = type(self).from_iterable(
-                [openrlib.INTEGER_ELT(
-                    cdata, i_c
-                ) for i_c in range(*i.indices(len(self)))]
-            )
+            res = self._slice(i)
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -592,6 +726,13 @@ class IntSexpVector(SexpVectorWithNumpyInterface):
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
 
+    @staticmethod
+    def _from_c_values(values: list) -> list:
+        if NA_Integer in values:
+            values = [NA_Integer if elt == NA_Integer else elt
+                      for elt in values]
+        return values
+
     def memoryview(self) -> memoryview[int]:
         return vector_memoryview(self, 'int', 'i')
 
@@ -603,9 +744,11 @@ class FloatSexpVector(SexpVectorWithNumpyInterface):
     _R_SET_VECTOR_ELT = openrlib.SET_REAL_ELT
     _R_SIZEOF_ELT = _rinterface.ffi.sizeof('double')
     _NP_TYPESTR = '|d'
+    _MV_FORMAT = 'd'
 
     _CAST_IN = staticmethod(float)
     _R_GET_PTR = staticmethod(openrlib.REAL)
+    _R_GET_PTR_OR_NULL = staticmethod(openrlib.REAL_OR_NULL)
 
     def __getitem__(
             self, i: Union[int, slice]
@@ -615,10 +758,7 @@ class FloatSexpVector(SexpVectorWithNumpyInterface):
             i_c = _rinterface._python_index_to_c(cdata, i)
             res = openrlib.REAL_ELT(cdata, i_c)
         elif isinstance(i, slice):
-            res = type(self).from_iterable(
-                [openrlib.REAL_ELT(
-                    cdata, i_c) for i_c in range(*i.indices(len(self)))]
-            )
+            res = self._slice(i)
         else:
             raise TypeError('Indices must be integers or slices, not %s' %
                             type(i))
@@ -699,6 +839,23 @@ class ComplexSexpVector(SexpVector):
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
 
+    def _take_c(self, cdata, indices: typing.Sequence[int]) -> list:
+        ptr = openrlib.COMPLEX(cdata)
+        res = []
+        for i_c in indices:
+            elt = ptr[i_c]
+            res.append(complex(elt.r, elt.i))
+        return res
+
+    def _put_values(self, values: typing.Iterable) -> typing.Sequence:
+        return [self._CAST_IN(v) for v in values]
+
+    def _put_c(self, cdata, indices: typing.Sequence[int],
+               values: typing.Sequence) -> None:
+        ptr = openrlib.COMPLEX(cdata)
+        for i_c, v in zip(indices, values):
+            ptr[i_c] = v
+
 
 class ListSexpVector(SexpVector):
     """R list.
@@ -867,6 +1024,94 @@ class LangSexpVector(SexpVector):
         return cls(_get_str2lang()(s))
 
 
+class PreparedCall:
+    """A call to an R function prepared for repeated evaluation.
+
+    The R call (a LANGSXP pairlist) with the function and the names of
+    the arguments is built once. Each call only sets the values of the
+    arguments in that pairlist before evaluating it, which saves the
+    allocation of the call and the lookup of the argument names in R's
+    symbol table.
+
+    Instances are created with :meth:`SexpClosure.prepare`. They are not
+    thread-safe, and the R function should not keep a reference to its
+    call (for example with `sys.call()` or `match.call()`) since the
+    arguments in it are reset after each evaluation.
+    """
+
+    __slots__ = ('_function', '_names', '_call', '_cells')
+
+    def __init__(self, function: 'SexpClosure',
+                 names: typing.Sequence[typing.Optional[str]]):
+        self._function = function
+        self._names = tuple(names)
+        with memorymanagement.rmemory() as rmemory:
+            call_r = rmemory.protect(
+                _rinterface.build_rcall(
+                    function.__sexp__._cdata, [],
+                    [(name, NULL) for name in self._names]
+                )
+            )
+            self._call = _rinterface.SexpCapsule(call_r)
+        # The cells of the pairlist are kept alive by the (preserved)
+        # call.
+        cells = []
+        item = openrlib.rlib.CDR(call_r)
+        for _ in self._names:
+            cells.append(item)
+            item = openrlib.rlib.CDR(item)
+        self._cells = tuple(cells)
+
+    @property
+    def names(self) -> typing.Tuple[typing.Optional[str], ...]:
+        """Names of the arguments (None for an unnamed argument)."""
+        return self._names
+
+    @property
+    def function(self) -> 'SexpClosure':
+        """R function called."""
+        return self._function
+
+    @_cdata_res_to_rinterface
+    def rcall(self, values: typing.Sequence,
+              environment: typing.Optional[SexpEnvironment] = None):
+        """Evaluate the call with the given values for its arguments.
+
+        Args:
+        - values: a sequence of values for the arguments, in the order
+          of the names the call was prepared with.
+        - environment: an optional R environment to evaluate the function.
+        """
+        if len(values) != len(self._cells):
+            raise TypeError(
+                f'The call was prepared for {len(self._cells)} arguments '
+                f'but {len(values)} were given.'
+            )
+        if environment is None:
+            environment = evaluation_context.get()
+        rlib = openrlib.rlib
+        error_occured = _rinterface.ffi.new('int *', 0)
+        with memorymanagement.rmemory() as rmemory:
+            try:
+                for item, val in zip(self._cells, values):
+                    rlib.SETCAR(item, conversion._get_cdata(val))
+                res = rmemory.protect(
+                    rlib.R_tryEval(self._call._cdata,
+                                   environment.__sexp__._cdata,
+                                   error_occured)
+                )
+            finally:
+                # Do not keep the arguments alive after the call.
+                for item in self._cells:
+                    rlib.SETCAR(item, rlib.R_NilValue)
+            if error_occured[0]:
+                raise embedded.RRuntimeError(_rinterface._geterrmessage())
+        return res
+
+    def __call__(self, *values) -> Sexp:
+        return self.rcall(values)
+
+
 class SexpClosure(Sexp):
 
     @_cdata_res_to_rinterface
@@ -918,6 +1163,41 @@ class SexpClosure(Sexp):
                 raise embedded.RRuntimeError(_rinterface._geterrmessage())
         return res
 
+    def prepare(
+            self,
+            names: typing.Sequence[typing.Optional[str]] = ()
+    ) -> PreparedCall:
+        """Prepare a call to the R function for repeated evaluation.
+
+        Args:
+        - names: a sequence with the names of the arguments the call will
+          be evaluated with. A name that is None will indicate an unnamed
+          argument.
+
+        Calling the function in a loop with the same argument names is
+        faster with a prepared call::
+
+          call = baseenv['sum'].prepare((None, 'na.rm'))
+          for x in vectors:
+              res = call(x, BoolSexpVector([True]))
+        """
+        return PreparedCall(self, names)
+
+    def submit(self, *args, **kwargs) -> concurrent.futures.Future:
+        """Call the R function in the thread running R.
+
+        The call is queued to the executor for R (see
+        :mod:`rpy2.rinterface_lib.executor`) and a future for its
+        result is returned."""
+        return executor.get_executor().submit(self, *args, **kwargs)
+
+    async def acall(self, *args, **kwargs):
+        """Call the R function in the thread running R, from asyncio.
+
+        The event loop is not blocked while the call is queued and
+        evaluated (see :meth:`submit`)."""
+        return await asyncio.wrap_future(self.submit(*args, **kwargs))
+
     @property  # type: ignore
     @_cdata_res_to_rinterface
     def closureenv(self) -> SexpEnvironment:
@@ -933,6 +1213,83 @@ class SexpS4(Sexp):
     pass
 
 
+def dataframe_from_columns(
+        columns: typing.Sequence[SexpVector],
+        names: typing.Sequence[str],
+        rownames: typing.Optional[typing.Sequence[str]] = None,
+        drop_column_names: bool = False
+) -> ListSexpVector:
+    """Create an R data frame from R vectors (its columns).
+
+    The data frame is assembled directly: an R list with the attributes
+    "names", "row.names" (in R's compact form unless `rownames` is
+    specified), and "class". Unlike R's function `data.frame()`, the
+    columns are not checked beyond their lengths, names are used
+    as they are, and no copy of the columns is made.
+
+    :param columns: R vectors, all of the same length.
+    :param names: names for the columns.
+    :param rownames: optional names for the rows.
+    :param drop_column_names: remove the attribute "names" of the columns,
+      as R's `data.frame()` does. Columns with names are copied (the
+      vectors passed may be used elsewhere in R).
+    """
+    if len(columns) != len(names):
+        raise ValueError('There must be as many names as there are columns.')
+    rlib = openrlib.rlib
+    nrows = None
+    for name, col in zip(names, columns):
+        if not isinstance(col, SexpVector):
+            raise TypeError(f'The column "{name}" is not an R vector.')
+        if (col.typeof == RTYPES.VECSXP and
+                'data.frame' in col.rclass):
+            raise ValueError(f'The column "{name}" is a data frame.')
+        n = len(col)
+        if nrows is None:
+            nrows = n
+        elif n != nrows:
+            raise ValueError(
+                f'The column "{name}" has {n} rows while the '
+                f'previous columns have {nrows} rows.'
+            )
+    if nrows is None:
+        nrows = 0 if rownames is None else len(rownames)
+    rownames_r: SexpVector
+    if rownames is None:
+        rownames_r = IntSexpVector([rlib.R_NaInt, -nrows] if nrows else [])
+    else:
+        if len(rownames) != nrows:
+            raise ValueError(
+                f'There are {len(rownames)} row names for {nrows} rows.'
+            )
+        rownames_r = StrSexpVector(rownames)
+    names_r = StrSexpVector(names)
+    class_r = StrSexpVector(('data.frame', ))
+    with memorymanagement.rmemory() as rmemory:
+        res = rmemory.protect(
+            rlib.Rf_allocVector(RTYPES.VECSXP, len(columns))
+        )
+        for i, col in enumerate(columns):
+            col_cdata = col.__sexp__._cdata
+            if drop_column_names and (
+                    rlib.Rf_getAttrib(col_cdata, rlib.R_NamesSymbol) !=
+                    rlib.R_NilValue
+            ):
+                col_cdata = rmemory.protect(
+                    rlib.Rf_shallow_duplicate(col_cdata)
+                )
+                rlib.Rf_namesgets(col_cdata, rlib.R_NilValue)
+            rlib.SET_VECTOR_ELT(res, i, col_cdata)
+        rlib.Rf_setAttrib(res, rlib.R_NamesSymbol,
+                          names_r.__sexp__._cdata)
+        rlib.Rf_setAttrib(res, rlib.R_RowNamesSymbol,
+                          rownames_r.__sexp__._cdata)
+        rlib.Rf_setAttrib(res, rlib.R_ClassSymbol,
+                          class_r.__sexp__._cdata)
+        res = ListSexpVector(_rinterface.SexpCapsule(res))
+    return res
+
+
 # TODO: clean up
 def make_extptr(obj, tag, protected):
     if protected is None:
@@ -1268,9 +1625,95 @@ def _find_first(nodes, of_type):
     )
 
 
+def _numpy_to_rvector(numpy, obj):
+    """Convert a numpy array of booleans, integers, or floats to an R vector.
+
+    Arrays of int32 or float64 values are not copied (see
+    :meth:`SexpVectorAbstract.from_memoryview`), other arrays are copied
+    in bulk. Masked values in masked arrays are NA in R. Arrays with more
+    than one dimension become R arrays. Other objects are returned
+    unchanged."""
+    if isinstance(obj, numpy.generic):
+        obj = numpy.asarray(obj)
+    elif isinstance(obj, numpy.ma.MaskedArray):
+        if not numpy.ma.is_masked(obj):
+            obj = numpy.ma.getdata(obj)
+    if not isinstance(obj, numpy.ndarray) or obj.dtype.kind not in 'biuf':
+        return obj
+    shape = obj.shape
+    values = numpy.ravel(obj, order='F')
+    if numpy.ma.is_masked(values):
+        # Masked values are NA in R. The data under the mask can be
+        # anything, so the values are copied.
+        if values.dtype.kind == 'b':
+            res = BoolSexpVector(values)
+        elif values.dtype.kind == 'f':
+            res = FloatSexpVector(values)
+        else:
+            res = IntSexpVector(values)
+    elif values.dtype.kind == 'b':
+        res = BoolSexpVector(values)
+    elif values.dtype.kind == 'f':
+        res = FloatSexpVector.from_memoryview(
+            memoryview(numpy.ascontiguousarray(values, dtype='float64')),
+            copy=False
+        )
+    elif values.dtype == numpy.int32:
+        res = IntSexpVector.from_memoryview(
+            memoryview(numpy.ascontiguousarray(values)), copy=False
+        )
+    else:
+        res = IntSexpVector(values)
+    if len(shape) > 1:
+        res.do_slot_assign('dim', IntSexpVector(shape))
+    return res
+
+
+def _vectorized(function: typing.Callable) -> typing.Callable:
+    """Wrap a Python function to take and return numpy arrays.
+
+    R vectors of integers or floats passed as arguments to the wrapped
+    function are read-only numpy views on the memory of the R vectors,
+    R vectors of booleans are copied into numpy arrays of booleans, and
+    a numpy array returned by the wrapped function is converted to an R
+    vector (see :func:`_numpy_to_rvector`). R vectors with missing values
+    are passed as numpy masked arrays with NA masked."""
+    import numpy
+
+    def to_numpy(obj):
+        if isinstance(obj, (BoolSexpVector, IntSexpVector, FloatSexpVector)):
+            # The base for the array is obj, which keeps the R object
+            # alive.
+            res = numpy.asarray(obj)
+            res.flags.writeable = False
+            if isinstance(obj, FloatSexpVector):
+                # R's NA is a NaN with the lower word 1954 (other NaN
+                # values are not missing values in R).
+                mask = numpy.isnan(res)
+                if mask.any():
+                    mask &= (res.view('uint64') & 0xFFFFFFFF) == 1954
+            else:
+                mask = res == openrlib.rlib.R_NaInt
+            if isinstance(obj, BoolSexpVector):
+                res = res != 0
+            if mask.any():
+                res = numpy.ma.MaskedArray(res, mask=mask, copy=False)
+            return res
+        else:
+            return obj
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        res = function(*(to_numpy(x) for x in args),
+                       **{k: to_numpy(v) for k, v in kwargs.items()})
+        return _numpy_to_rvector(numpy, res)
+    return wrapper
+
+
 def rternalize(
         function: typing.Optional[typing.Callable] = None, *,
-        signature: bool = False
+        signature: bool = False,
+        vectorized: bool = False
 ) -> typing.Union[SexpClosure, functools.partial]:
     """ Make a Python function callable from R.
 
@@ -1349,6 +1792,25 @@ def rternalize(
     positional-or-keyword are considered to be positional arguments in a
     function call.
 
+    With `vectorized=True`, R vectors of booleans, integers, or
+    floats are passed to the Python function as read-only numpy arrays
+    using the memory of the R vectors (no copy), and a numpy array it
+    returns is converted to an R vector in bulk (without copy for arrays
+    of `int32` or `float64`). The Python function can then be called
+    once from R with whole vectors (for example once per chunk of rows)
+    rather than once for each element (for example with `sapply()`).
+    R vectors of booleans are copied into numpy arrays of booleans.
+    R vectors with missing values (`NA`) are passed as numpy masked
+    arrays (:class:`numpy.ma.MaskedArray`) with the missing values
+    masked, and masked values in a returned masked array are `NA` in R.
+    A float NaN that is not R's `NA` (for example `NaN` in R) is not
+    masked. This requires numpy.
+
+    .. code-block:: python
+       @rternalize(vectorized=True)
+       def score(x, y):
+           return numpy.sqrt(x ** 2 + y ** 2)
+
     :param function: A Python callable object. This is a positional
     argument with a default value `None` to allow the decorator function
     without parentheses when optional argument is not wanted.
@@ -1360,10 +1822,15 @@ def rternalize(
         raise embedded.RNotReadyError('The embedded R is not yet initialized.')
 
     if function is None:
-        return functools.partial(rternalize, signature=signature)
+        return functools.partial(rternalize, signature=signature,
+                                 vectorized=vectorized)
 
     assert callable(function)
-    rpy_fun = SexpExtPtr.from_pyobject(function)
+    if vectorized:
+        function = _vectorized(function)
+    rpy_fun = SexpExtPtr.from_pyobject(
+        _rinterface.RternalizedCallable(function)
+    )
 
     if not signature:
         template = parse("""
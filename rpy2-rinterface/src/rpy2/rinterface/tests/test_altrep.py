@@ -0,0 +1,102 @@
+import array
+import pytest
+from rpy2 import rinterface
+from rpy2.rinterface_lib import altrep
+
+rinterface.initr()
+
+
+@pytest.mark.parametrize(
+    'cls,typecode,values',
+    ((rinterface.FloatSexpVector, 'd', (1.5, 2.0, -3.25)),
+     (rinterface.IntSexpVector, 'i', (1, 2, -3)))
+)
+def test_from_memoryview_nocopy(cls, typecode, values):
+    a = array.array(typecode, values)
+    x = cls.from_memoryview(memoryview(a), copy=False)
+    assert altrep.is_buffer_backed(x.__sexp__._cdata)
+    assert len(x) == len(values)
+    assert tuple(x) == values
+    # The R vector is using the memory of the Python array.
+    a[0] = 7
+    assert x[0] == 7
+
+
+def test_from_memoryview_nocopy_rcall():
+    a = array.array('d', (1.0, 2.0, 3.0))
+    x = rinterface.FloatSexpVector.from_memoryview(memoryview(a), copy=False)
+    res = rinterface.baseenv['sum'](x)
+    assert res[0] == 6.0
+
+
+def test_from_memoryview_nocopy_r_write():
+    a = array.array('d', (1.0, 2.0, 3.0))
+    x = rinterface.FloatSexpVector.from_memoryview(memoryview(a), copy=False)
+    x[1] = 5.0
+    assert tuple(x) == (1.0, 5.0, 3.0)
+    # R copied the data before writing to it.
+    assert tuple(a) == (1.0, 2.0, 3.0)
+
+
+@pytest.mark.parametrize(
+    'read',
+    (tuple, lambda x: x.take([2, 0]), lambda x: x[0:2], lambda x: x[::2],
+     lambda x: x.view(slice(0, 2)), lambda x: x.__array_interface__)
+)
+def test_from_memoryview_nocopy_read_then_write(read):
+    a = array.array('d', (1.0, 2.0, 3.0))
+    x = rinterface.FloatSexpVector.from_memoryview(memoryview(a), copy=False)
+    read(x)
+    # Reading did not make R copy the data.
+    assert altrep.buffer_memoryview(x.__sexp__._cdata) is not None
+    a[0] = 7.0
+    assert x[0] == 7.0
+    assert tuple(x) == (7.0, 2.0, 3.0)
+
+
+def test_from_memoryview_nocopy_incompatible():
+    a = array.array('f', (1.0, 2.0, 3.0))
+    with pytest.raises(ValueError):
+        rinterface.FloatSexpVector.from_memoryview(memoryview(a), copy=False)
+
+
+@pytest.mark.parametrize(
+    'cls,values',
+    ((rinterface.FloatSexpVector, [1.5, 2.0, -3.25, 4.0]),
+     (rinterface.IntSexpVector, [1, 2, -3, 4]),
+     (rinterface.BoolSexpVector, [True, False, True, True]))
+)
+def test_view(cls, values):
+    x = cls(values)
+    v = x.view(slice(1, 3))
+    assert altrep.is_buffer_backed(v.__sexp__._cdata)
+    assert type(v) is cls
+    assert list(v) == values[1:3]
+    # The view is using the memory of the parent vector.
+    x[1] = values[0]
+    assert v[0] == values[0]
+
+
+def test_view_r_write():
+    x = rinterface.FloatSexpVector([1.0, 2.0, 3.0])
+    v = x.view(slice(1, None))
+    v[0] = 5.0
+    assert tuple(v) == (5.0, 3.0)
+    # R copied the data before writing to the view.
+    assert tuple(x) == (1.0, 2.0, 3.0)
+
+
+def test_view_of_buffer_backed():
+    a = array.array('d', (1.0, 2.0, 3.0))
+    x = rinterface.FloatSexpVector.from_memoryview(memoryview(a), copy=False)
+    v = x.view(slice(1, 3))
+    del x
+    a[2] = 7.0
+    assert tuple(v) == (2.0, 7.0)
+
+
+def test_view_invalid():
+    with pytest.raises(ValueError):
+        rinterface.FloatSexpVector([1.0, 2.0, 3.0]).view(slice(None, None, 2))
+    with pytest.raises(ValueError):
+        rinterface.ByteSexpVector(b'abc').view(slice(0, 2))
@@ -1,4 +1,6 @@
+import copyreg
 import gc
+import io
 import multiprocessing
 import os
 import pickle
@@ -6,6 +8,7 @@ import pytest
 from rpy2 import rinterface
 import rpy2
 import rpy2.rinterface_lib._rinterface_capi as _rinterface
+from rpy2.rinterface_lib import serialization
 import signal
 import sys
 import subprocess
@@ -261,6 +264,28 @@ def test_rternalize_formals():
     assert list(rnames(rformals(rfun))) == ['a', 'b', 'c', 'd', 'e']
 
 
+def test_rternalize_signature_classified_once():
+    def f(a, /, b, *args, c=1, **kwargs):
+        pass
+    callable_ = _rinterface.RternalizedCallable(f)
+    assert callable_.posonly == ['a']
+    assert callable_.positionalorkw == ['b']
+    assert callable_.has_ellipsis
+    assert not callable_.positional
+
+
+@pytest.mark.parametrize('signature', (True, False))
+def test_rternalize_positional(signature):
+    def f(x, y, /, *args):
+        return x[0] - y[0] + len(args)
+    rfun = rinterface.rternalize(f, signature=signature)
+    assert rfun(3, 1)[0] == 2
+    assert rfun(3, 1, 0, 0)[0] == 4
+    assert rinterface.baseenv['sapply'](
+        rinterface.IntSexpVector([1, 2, 3]), rfun, 1
+    )[2] == 2
+
+
 def test_external_python():
     def f(x):
         return 3
@@ -410,3 +435,105 @@ def test_pickle():
         x_again = pickle.load(f)
     identical = rinterface.baseenv['identical']
     assert identical(x, x_again)[0]
+
+
+class _BaselinePickle:
+    """Pickle an R object like rpy2 did before `Sexp.__getstate__()`
+    returned a `PickledSexp` (the state was R's serialization as bytes)."""
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __reduce_ex__(self, protocol):
+        serialized = rinterface.baseenv['serialize'](self.obj, rinterface.NULL)
+        return (copyreg.__newobj__, (type(self.obj), ),
+                bytes(serialized.memoryview()))
+
+
+@pytest.mark.parametrize('protocol', (2, 4, 5))
+def test_pickle_load_baseline(protocol):
+    x = rinterface.IntSexpVector([1, 2, 3])
+    x_pickled = pickle.dumps(_BaselinePickle(x), protocol=protocol)
+    x_again = pickle.loads(x_pickled)
+    assert type(x_again) is rinterface.IntSexpVector
+    identical = rinterface.baseenv['identical']
+    assert identical(x, x_again)[0]
+
+
+@pytest.mark.parametrize('protocol', (2, 4, 5))
+def test_pickle_protocol(protocol):
+    x = rinterface.FloatSexpVector(range(100000))
+    buffers = []
+    x_pickled = pickle.dumps(x, protocol=protocol,
+                             buffer_callback=(buffers.append
+                                              if protocol >= 5 else None))
+    if protocol >= 5:
+        assert len(x_pickled) < 1000
+        assert len(buffers) > 0
+    x_again = pickle.loads(x_pickled, buffers=buffers)
+    identical = rinterface.baseenv['identical']
+    assert identical(x, x_again)[0]
+
+
+@pytest.mark.parametrize('compression', (None, 'gzip', 'bz2', 'xz'))
+@pytest.mark.parametrize('xdr', (True, False))
+def test_serialization_dump_load(compression, xdr):
+    x = rinterface.baseenv['eval'](
+        rinterface.parse('list(a=1:10, b=letters)')
+    )
+    with tempfile.TemporaryFile() as f:
+        serialization.dump(x, f, compression=compression, xdr=xdr)
+        f.seek(0)
+        x_again = rinterface.ListSexpVector(
+            serialization.load(f, compression=compression)
+        )
+    identical = rinterface.baseenv['identical']
+    assert identical(x, x_again)[0]
+
+
+class _CountingWriter(io.BytesIO):
+
+    def __init__(self):
+        super().__init__()
+        self.n_writes = 0
+
+    def write(self, data):
+        self.n_writes += 1
+        return super().write(data)
+
+
+@pytest.mark.parametrize('rcode',
+                         ('as.character(1:1e5)',
+                          'as.raw(rep(1:255, 1e3))',
+                          'list(a=1:10, b=as.raw(rep(1:255, 1e3)))'))
+def test_serialization_dump_buffered(rcode):
+    x = rinterface.baseenv['eval'](rinterface.parse(rcode))
+    f = _CountingWriter()
+    serialization.dump(x, f)
+    n_bytes = len(f.getvalue())
+    assert f.n_writes <= n_bytes // serialization.WRITE_BUFFER_SIZE + 3
+    x_again = rinterface.Sexp(serialization.loads(f.getvalue()))
+    identical = rinterface.baseenv['identical']
+    assert identical(x, x_again)[0]
+
+
+def test_serialization_load_r():
+    x = rinterface.IntSexpVector([1, 2, 3])
+    x_serialized = rinterface.baseenv['serialize'](x, rinterface.NULL)
+    x_again = rinterface.IntSexpVector(
+        serialization.loads(x_serialized.memoryview())
+    )
+    assert tuple(x_again) == (1, 2, 3)
+
+
+def test_serialization_load_truncated():
+    x = rinterface.IntSexpVector([1, 2, 3])
+    x_serialized = serialization.dumps(x)
+    with pytest.raises(EOFError):
+        serialization.loads(x_serialized[:-4])
+
+
+def test_serialization_invalid_compression():
+    x = rinterface.IntSexpVector([1, 2, 3])
+    with pytest.raises(ValueError):
+        serialization.dumps(x, compression='foo')
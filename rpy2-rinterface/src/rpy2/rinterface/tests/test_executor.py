@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import pytest
+import rpy2.rinterface as ri
+from rpy2.rinterface_lib import executor
+
+ri.initr()
+
+
+@pytest.fixture
+def r_executor():
+    res = executor.RExecutor()
+    yield res
+    res.shutdown()
+
+
+def test_submit(r_executor):
+    future = r_executor.submit(threading.current_thread)
+    assert future.result() is r_executor.thread
+    assert r_executor.thread is not threading.current_thread()
+
+
+def test_submit_error(r_executor):
+    future = r_executor.submit(ri.baseenv['stop'], ri.StrSexpVector(['x']))
+    with pytest.raises(ri.embedded.RRuntimeError):
+        future.result()
+    # The R thread is still running.
+    assert r_executor.submit(lambda: 1).result() == 1
+
+
+def test_submit_after_shutdown():
+    r_executor = executor.RExecutor()
+    r_executor.submit(lambda: None).result()
+    r_executor.shutdown()
+    with pytest.raises(RuntimeError):
+        r_executor.submit(lambda: None)
+
+
+def test_submit_c_stack(r_executor):
+    # R's check of the C stack is for the thread that initialized R.
+    ffi = ri.openrlib.ffi
+    limit = r_executor.submit(lambda: ri.openrlib.rlib.R_CStackLimit)
+    assert limit.result() == int(ffi.cast('uintptr_t', -1))
+    # Deep recursions evaluated in the R thread are not stack overflows.
+    f = ri.evalr('function(n) if (n == 0) 0 else 1 + f(n - 1)',
+                 envir=ri.globalenv)
+    ri.globalenv['f'] = f
+    assert r_executor.submit(f, ri.IntSexpVector([500])).result()[0] == 500
+
+
+def test_submit_context(r_executor):
+    env = ri.baseenv['new.env']()
+    with ri.local_context(env):
+        future = r_executor.submit(ri.evaluation_context.get)
+    assert future.result().rid == env.rid
+
+
+def test_submit_call(r_executor):
+    threads = []
+
+    def prepare(args, kwargs):
+        threads.append(threading.current_thread())
+        return [ri.IntSexpVector(x) for x in args], kwargs
+
+    def finish(res):
+        threads.append(threading.current_thread())
+        return res[0]
+
+    futures = [
+        r_executor.submit_call(ri.baseenv['sum'], ([i, i], ),
+                               prepare=prepare, finish=finish)
+        for i in range(10)
+    ]
+    assert [f.result() for f in futures] == [2 * i for i in range(10)]
+    assert r_executor.thread not in threads
+    assert threading.current_thread() not in threads
+
+
+def test_submit_call_prepare_error(r_executor):
+    def prepare(args, kwargs):
+        raise ValueError('no conversion')
+
+    future = r_executor.submit_call(ri.baseenv['sum'], (1, ),
+                                    prepare=prepare)
+    with pytest.raises(ValueError):
+        future.result()
+
+
+def test_closure_acall():
+    res = asyncio.run(
+        ri.baseenv['sum'].acall(ri.IntSexpVector([1, 2, 3]))
+    )
+    assert res[0] == 6
+
+
+def test_closure_acall_concurrent():
+    rsum = ri.baseenv['sum']
+
+    async def calls():
+        return await asyncio.gather(
+            *(rsum.acall(ri.IntSexpVector([i, 1])) for i in range(5))
+        )
+
+    assert [x[0] for x in asyncio.run(calls())] == [1, 2, 3, 4, 5]
@@ -186,3 +186,24 @@ def test_call_in_context_nested(use_rlock):
             assert tuple(get('foo')) == (456, )
         assert tuple(get('foo')) == (123, )
     assert 'foo' not in ls()
+
+
+def test_prepare():
+    rsum = rinterface.baseenv['sum']
+    call = rsum.prepare((None, 'na.rm'))
+    assert call.names == (None, 'na.rm')
+    na_rm = rinterface.BoolSexpVector([True])
+    for i in range(3):
+        x = rinterface.IntSexpVector([1, 2, i, rinterface.NA_Integer])
+        assert call(x, na_rm)[0] == 3 + i
+
+
+def test_prepare_error():
+    fun = rinterface.baseenv['eval'](
+        rinterface.parse('function(x) stop("boom")')
+    )
+    call = fun.prepare(('x', ))
+    with pytest.raises(rinterface.embedded.RRuntimeError):
+        call(rinterface.IntSexpVector([1]))
+    with pytest.raises(TypeError):
+        call()
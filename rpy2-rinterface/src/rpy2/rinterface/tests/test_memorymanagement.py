@@ -1,4 +1,5 @@
 import pytest
+import threading
 from rpy2 import rinterface
 from rpy2.rinterface import memorymanagement
 
@@ -32,3 +33,72 @@ def test_rmemory_manager_unprotect_invalid():
         with pytest.raises(ValueError):
             rmemory.unprotect(2)
     assert rmemory.count == 0
+
+
+def test_deferred_releases():
+    queue = memorymanagement.release_queue
+    enabled = queue.enabled
+    queue.enabled = True
+    try:
+        x = rinterface.IntSexpVector([1, 2, 3])
+        x_rid = x.rid
+        del x
+        # The R object is still protected until the queue is drained.
+        assert x_rid in dict(rinterface._rinterface.protected_rids())
+        assert len(queue) >= 1
+        assert queue.metrics().depth >= 1
+        released = memorymanagement.flush_releases()
+        assert released >= 1
+        assert len(queue) == 0
+        assert x_rid not in dict(rinterface._rinterface.protected_rids())
+        metrics = queue.metrics()
+        assert metrics.drains >= 1
+        assert metrics.released >= released
+    finally:
+        queue.enabled = enabled
+        memorymanagement.flush_releases()
+
+
+def test_deferred_releases_drained_before_evaluation():
+    queue = memorymanagement.release_queue
+    enabled = queue.enabled
+    queue.enabled = True
+    try:
+        x = rinterface.IntSexpVector([1, 2, 3])
+        x_rid = x.rid
+        del x
+        drains = queue.metrics().drains
+        rinterface.baseenv['sum'](rinterface.IntSexpVector([1]))
+        assert queue.metrics().drains > drains
+        assert x_rid not in dict(rinterface._rinterface.protected_rids())
+    finally:
+        queue.enabled = enabled
+        memorymanagement.flush_releases()
+
+
+def test_release_deferred_when_r_busy():
+    queue = memorymanagement.release_queue
+    locked = threading.Event()
+    done = threading.Event()
+
+    def hold_r():
+        with rinterface.openrlib.rlock:
+            locked.set()
+            done.wait()
+
+    x = rinterface.IntSexpVector([1, 2, 3])
+    x_rid = x.rid
+    thread = threading.Thread(target=hold_r)
+    thread.start()
+    locked.wait()
+    try:
+        depth = len(queue)
+        del x
+        # R's lock is held by the other thread: the release is deferred.
+        assert len(queue) == depth + 1
+        assert x_rid in dict(rinterface._rinterface.protected_rids())
+    finally:
+        done.set()
+        thread.join()
+    memorymanagement.flush_releases()
+    assert x_rid not in dict(rinterface._rinterface.protected_rids())
@@ -273,5 +273,52 @@ def test_charsxp_nchar():
     assert cs.nchar() == 0
 
 
+def test_preservation_pool_grow_gctorture():
+    rlib = rinterface.openrlib.rlib
+    pool = rinterface._rinterface._PreservationPool(block_size=4)
+    values = [rinterface.IntSexpVector([i]) for i in range(4)]
+    for x in values:
+        pool.add(x.__sexp__._cdata, x.rid)
+    gctorture = rinterface.baseenv['gctorture']
+    gctorture(True)
+    try:
+        # Not protected until it is in the pool, and the pool grows.
+        cdata = rlib.Rf_ScalarInteger(42)
+        addr = rinterface._rinterface.get_rid(cdata)
+        pool.add(cdata, addr)
+        rlib.Rf_ScalarInteger(0)
+    finally:
+        gctorture(False)
+    assert len(pool._blocks) == 2
+    slot = pool._slots[addr]
+    obj = rlib.VECTOR_ELT(pool._blocks[slot // 4], slot % 4)
+    assert obj == cdata
+    assert rinterface._rinterface._TYPEOF(obj) == rlib.INTSXP
+    assert rlib.INTEGER_ELT(obj, 0) == 42
+    pool.remove(addr)
+    for x in values:
+        pool.remove(x.rid)
+
+
 def test_missingtype():
     assert not rinterface.MissingArg
+
+
+def test_preservation_pool():
+    pool = rinterface._rinterface._PreservationPool(block_size=4)
+    values = [rinterface.IntSexpVector([i]) for i in range(10)]
+    for x in values:
+        pool.add(x.__sexp__._cdata, x.rid)
+    assert len(pool) == 10
+    assert len(pool._blocks) == 3
+    for x in values[:5]:
+        pool.remove(x.rid)
+    assert len(pool) == 5
+    x = rinterface.IntSexpVector([10])
+    pool.add(x.__sexp__._cdata, x.rid)
+    # A free slot is reused.
+    assert len(pool._blocks) == 3
+    gc.collect()
+    rinterface.baseenv['gc']()
+    for x in values[5:]:
+        assert pool._slots[x.rid] is not None
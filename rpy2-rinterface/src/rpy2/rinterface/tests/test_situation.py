@@ -0,0 +1,90 @@
+import os
+import pytest
+
+from rpy2 import situation
+
+
+@pytest.fixture
+def r_home(tmp_path, monkeypatch):
+    r_home = tmp_path / 'R'
+    (r_home / 'bin').mkdir(parents=True)
+    (r_home / 'bin' / 'R').write_text('#!/bin/sh\n')
+    if os.name == 'nt':
+        (r_home / 'bin' / 'x64').mkdir()
+        (r_home / 'bin' / 'x64' / 'R.exe').write_text('')
+    monkeypatch.setenv('R_HOME', str(r_home))
+    monkeypatch.setenv(situation.ENVVAR_CACHE_DIR, str(tmp_path / 'cache'))
+    monkeypatch.delenv(situation.ENVVAR_SITUATION_CACHE, raising=False)
+    return r_home
+
+
+@pytest.fixture
+def calls(r_home, monkeypatch):
+    res = []
+
+    def from_subprocess(with_r_version=True):
+        res.append(with_r_version)
+        return situation.Situation(
+            str(r_home), '/usr/lib/R/lib',
+            'R version 4.4.0' if with_r_version else None,
+            '/usr/lib/R/libR.so'
+        )
+
+    monkeypatch.setattr(situation, '_situation_from_subprocess',
+                        from_subprocess)
+    return res
+
+
+def test_get_cache_dir(monkeypatch):
+    monkeypatch.setenv(situation.ENVVAR_CACHE_DIR, 'foo')
+    assert situation.get_cache_dir() == 'foo'
+    monkeypatch.delenv(situation.ENVVAR_CACHE_DIR)
+    assert situation.get_cache_dir().endswith('rpy2')
+
+
+def test_get_situation_cached(r_home, calls):
+    res = situation.get_situation()
+    assert res.r_home == str(r_home)
+    assert res.r_version == 'R version 4.4.0'
+    assert calls == [True]
+    assert situation.get_situation() == res
+    assert len(calls) == 1
+
+
+def test_get_situation_no_cache(calls):
+    situation.get_situation(use_cache=False)
+    situation.get_situation(use_cache=False)
+    # No subprocess for the R version when the cache is not written.
+    assert calls == [False, False]
+
+
+def test_get_situation_cache_disabled(calls, monkeypatch):
+    monkeypatch.setenv(situation.ENVVAR_SITUATION_CACHE, 'false')
+    situation.get_situation()
+    situation.get_situation()
+    assert calls == [False, False]
+
+
+def test_get_situation_invalidated(r_home, calls, monkeypatch):
+    situation.get_situation()
+    # A reinstalled R.
+    r_exec = situation._situation_cache_key()['r_exec']
+    st = os.stat(r_exec)
+    os.utime(r_exec, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    situation.get_situation()
+    assert len(calls) == 2
+    # An other LD_LIBRARY_PATH.
+    monkeypatch.setenv('LD_LIBRARY_PATH', '/foo')
+    situation.get_situation()
+    assert len(calls) == 3
+
+
+def test_get_situation_corrupted(calls):
+    situation.get_situation()
+    path = situation.get_situation_cache_path(
+        situation._situation_cache_key()
+    )
+    with open(path, 'w') as fh:
+        fh.write('{not json')
+    situation.get_situation()
+    assert len(calls) == 2
@@ -1,7 +1,11 @@
 import os
 import pytest
+import threading
+import time
 import rpy2.rinterface
 import rpy2.rinterface_lib.embedded
+import rpy2.rinterface_lib.executor
+import rpy2.rinterface_lib.openrlib
 from threading import Thread
 
 
@@ -45,3 +49,60 @@ def test_threading_initr_simple():
         thread.start()
         thread.join()
     assert not thread.exception
+
+
+def test_gil_released_during_evaluation():
+    rpy2.rinterface.initr()
+    started = threading.Event()
+
+    def evaluate():
+        started.set()
+        rpy2.rinterface.baseenv['Sys.sleep'](
+            rpy2.rinterface.FloatSexpVector([1.0])
+        )
+
+    thread = ThreadWithExceptions(target=evaluate)
+    thread.start()
+    started.wait()
+    # This thread runs Python code while R is evaluating in the other one.
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < 0.2:
+        pass
+    assert thread.is_alive()
+    thread.join()
+    assert not thread.exception
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'),
+                    reason='Requires os.fork().')
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+def test_fork_does_not_wait_for_r():
+    rpy2.rinterface.initr()
+    openrlib = rpy2.rinterface_lib.openrlib
+    executor = rpy2.rinterface_lib.executor
+    executor.get_executor()
+    holding = threading.Event()
+    evaluated = []
+
+    def evaluate():
+        with openrlib.rlock:
+            holding.set()
+            time.sleep(.5)
+            evaluated.append(time.time())
+
+    thread = Thread(target=evaluate)
+    thread.start()
+    holding.wait()
+    pid = os.fork()
+    if pid == 0:
+        # The locks and the executor are new in the child process.
+        ok = (openrlib.rlock.acquire(blocking=False) and
+              openrlib.lock.acquire(blocking=False) and
+              executor._executor is None)
+        os._exit(0 if ok else 1)
+    fork_time = time.time()
+    thread.join()
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    # Forking did not wait for the thread holding R's lock.
+    assert fork_time < evaluated[0]
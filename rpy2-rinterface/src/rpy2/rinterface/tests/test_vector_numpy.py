@@ -75,3 +75,131 @@ def test_array_shape_len3():
         for j in range(2):
             for k in range(3):
                 assert extract(rarray, i+1, j+1, k+1)[0] == npyarray[i, j, k]
+
+
+def test_from_list_bulk_with_na():
+    x = rinterface.IntSexpVector([1, rinterface.NA_Integer, 3])
+    assert x[0] == 1
+    assert x[1] is rinterface.NA_Integer
+    assert x[2] == 3
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+@pytest.mark.parametrize(
+    'cls,values,dtype',
+    ((rinterface.IntSexpVector, [1, 2, 3], 'int64'),
+     (rinterface.FloatSexpVector, [1.5, 2.0, 3.25], 'float64'),
+     (rinterface.BoolSexpVector, [True, False, True], 'bool'))
+)
+def test_from_ndarray_bulk(cls, values, dtype):
+    x = cls.from_object(numpy.array(values, dtype=dtype)[::-1])
+    assert tuple(x) == tuple(reversed(values))
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+@pytest.mark.parametrize(
+    'cls,values,na',
+    ((rinterface.IntSexpVector, [1, 2, 3], rinterface.NA_Integer),
+     (rinterface.FloatSexpVector, [1.5, 2.0, 3.25], rinterface.NA_Real),
+     (rinterface.BoolSexpVector, [True, False, True], rinterface.NA_Logical))
+)
+def test_from_masked_array_bulk(cls, values, na):
+    a = numpy.ma.masked_array(values, mask=[False, True, False])
+    x = cls.from_iterable(a)
+    assert x[0] == values[0]
+    assert x[1] is na
+    assert x[2] == values[2]
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+def test_rternalize_vectorized():
+    @rinterface.rternalize(vectorized=True)
+    def f(x, y):
+        assert isinstance(x, numpy.ndarray)
+        assert not x.flags.writeable
+        return x * 2 + y
+
+    x = rinterface.FloatSexpVector([1.0, 2.0, 3.0])
+    res = f(x, rinterface.IntSexpVector([1, 1, 1]))
+    assert isinstance(res, rinterface.FloatSexpVector)
+    assert tuple(res) == (3.0, 5.0, 7.0)
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+def test_rternalize_vectorized_bool():
+    @rinterface.rternalize(vectorized=True)
+    def f(x):
+        assert x.dtype == numpy.bool_
+        assert not isinstance(x, numpy.ma.MaskedArray)
+        return ~x
+
+    res = f(rinterface.BoolSexpVector([True, False]))
+    assert isinstance(res, rinterface.BoolSexpVector)
+    assert tuple(res) == (False, True)
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+@pytest.mark.parametrize(
+    'rcode,data,mask',
+    (('c(TRUE, NA, FALSE)', [True, False, False], [False, True, False]),
+     ('c(1L, NA, 3L)', [1, 0, 3], [False, True, False]),
+     ('c(1, NA, NaN)', [1.0, 0.0, 0.0], [False, True, False]))
+)
+def test_rternalize_vectorized_na(rcode, data, mask):
+    x = rinterface.baseenv['eval'](rinterface.parse(rcode))
+    seen = []
+
+    @rinterface.rternalize(vectorized=True)
+    def f(x):
+        seen.append(x)
+        return x
+
+    res = f(x)
+    x_numpy = seen[0]
+    assert isinstance(x_numpy, numpy.ma.MaskedArray)
+    assert tuple(numpy.ma.getmaskarray(x_numpy)) == tuple(mask)
+    if x.typeof == rinterface.RTYPES.LGLSXP:
+        assert x_numpy.dtype == numpy.bool_
+    assert tuple(x_numpy.compressed()) == tuple(
+        v for v, m in zip(data, mask) if not m
+    )
+    if x.typeof == rinterface.RTYPES.REALSXP:
+        # NaN is not R's NA and is not masked.
+        assert numpy.isnan(x_numpy.data[2])
+    assert isinstance(res, type(x))
+    is_na = rinterface.baseenv['is.na']
+    assert tuple(is_na(res)) == tuple(mask)
+    identical = rinterface.baseenv['identical']
+    assert identical(x, res)[0]
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+def test_rternalize_vectorized_na_arithmetic():
+    @rinterface.rternalize(vectorized=True)
+    def f(x):
+        return x * 2
+
+    res = f(rinterface.IntSexpVector([1, rinterface.NA_Integer, 3]))
+    assert isinstance(res, rinterface.IntSexpVector)
+    assert res[0] == 2
+    assert res[1] is rinterface.NA_Integer
+    assert res[2] == 6
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+@pytest.mark.parametrize(
+    'value,cls',
+    ((numpy.array([True, False]) if has_numpy else None,
+      rinterface.BoolSexpVector),
+     (numpy.array([1, 2], dtype='int32') if has_numpy else None,
+      rinterface.IntSexpVector),
+     (numpy.array([1, 2], dtype='int64') if has_numpy else None,
+      rinterface.IntSexpVector),
+     (numpy.array([[1.5, 2], [3, 4]]) if has_numpy else None,
+      rinterface.FloatSexpVector))
+)
+def test_rternalize_vectorized_result(value, cls):
+    f = rinterface.rternalize(lambda: value, vectorized=True)
+    res = f()
+    assert isinstance(res, cls)
+    assert tuple(res) == tuple(numpy.ravel(value, order='F'))
@@ -90,3 +90,56 @@ def test_non_asciil():
     sexp = ri.evalr('c("ěščřžýáíé", "abc", "百折不撓")')
     assert all(isinstance(x, str) for x in sexp)
     
+
+
+def test_init_repeated_values():
+    seq = ['foo', 'bar', None, 'foo', 'bar'] * 3
+    v = ri.StrSexpVector(seq)
+    assert v.to_list() == [ri.NA_Character if x is None else x for x in seq]
+    # R has one CHARSXP for each distinct string.
+    assert v.get_charsxp(0).rid == v.get_charsxp(3).rid
+
+
+def test_to_list():
+    v = ri.StrSexpVector(['a', 'b', ri.NA_Character, 'a'])
+    res = v.to_list()
+    assert res == ['a', 'b', ri.NA_Character, 'a']
+    assert res[0] is res[3]
+
+
+def test_to_buffers():
+    v = ri.StrSexpVector(['ab', 'c', ri.NA_Character, 'ë', ''])
+    buffers = v.to_buffers()
+    assert tuple(buffers.offsets) == (0, 2, 3, 3, 5, 5)
+    assert buffers.data == 'abcë'.encode('utf-8')
+    assert tuple(buffers.na) == (0, 0, 1, 0, 0)
+
+
+def test_from_buffers():
+    v = ri.StrSexpVector(['ab', 'c', ri.NA_Character, 'ë', ''])
+    res = ri.StrSexpVector.from_buffers(*v.to_buffers())
+    assert res.to_list() == v.to_list()
+    res = ri.StrSexpVector.from_buffers([0, 1, 3], b'abc')
+    assert tuple(res) == ('a', 'bc')
+
+
+@pytest.mark.parametrize(
+    'offsets,data',
+    (([0, 1, 4], b'abc'),
+     ([0, 2, 1], b'abc'),
+     ([0, 1], b'a\x00'),
+     ([0, 1, 2], b'a'))
+)
+def test_from_buffers_invalid(offsets, data):
+    with pytest.raises(ValueError):
+        ri.StrSexpVector.from_buffers(offsets, data)
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip('numpy')
+    v = ri.StrSexpVector(['a', 'b', ri.NA_Character])
+    res = v.to_numpy()
+    assert res.dtype == numpy.dtype(object)
+    assert tuple(res) == ('a', 'b', None)
+    v2 = ri.StrSexpVector(numpy.array(['a', 'b', 'a']))
+    assert tuple(v2) == ('a', 'b', 'a')
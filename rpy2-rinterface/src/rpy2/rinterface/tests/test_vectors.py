@@ -135,6 +135,111 @@ def test_invalid_not_vector_rtype():
         ri.vector([1, ], ri.RTYPES.ENVSXP)
 
 
+@pytest.mark.parametrize(
+    'cls,values',
+    ((ri.BoolSexpVector, [True, False, True, ri.NA_Logical]),
+     (ri.IntSexpVector, [1, 2, ri.NA_Integer, 4]),
+     (ri.FloatSexpVector, [1.5, 2.5, 3.5, 4.5]),
+     (ri.ComplexSexpVector, [1+2j, 3+4j, 5+6j, 7+8j]),
+     (ri.ByteSexpVector, [1, 2, 3, 4]),
+     (ri.StrSexpVector, ['a', 'b', ri.NA_Character, 'd']))
+)
+def test_take(cls, values):
+    v = cls(values)
+    assert v.take([3, 0, -3]) == [values[3], values[0], values[1]]
+    assert v.take(range(1, 3)) == values[1:3]
+    assert v.take(range(3, -1, -2)) == [values[3], values[1]]
+    assert v.take(slice(None, None, 2)) == values[::2]
+    assert v.to_list() == values
+    assert list(v) == [v[i] for i in range(len(v))]
+    with pytest.raises(IndexError):
+        v.take([0, len(values)])
+
+
+def test_take_list():
+    v = ri.ListSexpVector([ri.IntSexpVector([1]), ri.StrSexpVector(['a'])])
+    res = v.take([1, 0])
+    assert len(res) == 2
+    assert tuple(res[0]) == ('a', )
+    assert tuple(res[1]) == (1, )
+
+
+def test_take_numpy():
+    numpy = pytest.importorskip('numpy')
+    v = ri.IntSexpVector(range(10))
+    assert v.take(numpy.array([9, -1, 0])) == [9, 9, 0]
+    with pytest.raises(IndexError):
+        v.take(numpy.array([10]))
+    with pytest.raises(TypeError):
+        v.take(numpy.array([1.0]))
+
+
+@pytest.mark.parametrize(
+    'cls,values,new_values',
+    ((ri.BoolSexpVector, [True, False, True], [False, True]),
+     (ri.IntSexpVector, [1, 2, 3], [4, 5]),
+     (ri.FloatSexpVector, [1.5, 2.5, 3.5], [4.5, 5.5]),
+     (ri.ComplexSexpVector, [1+2j, 3+4j, 5+6j], [7+8j, 9+10j]),
+     (ri.ByteSexpVector, [1, 2, 3], [4, 5]),
+     (ri.StrSexpVector, ['a', 'b', 'c'], ['d', 'e']))
+)
+def test_put(cls, values, new_values):
+    v = cls(values)
+    v.put([2, 0], new_values)
+    assert v.to_list() == [new_values[1], values[1], new_values[0]]
+    with pytest.raises(ValueError):
+        v.put([0], new_values)
+    with pytest.raises(IndexError):
+        v.put([0, 3], new_values)
+
+
+def test_put_list():
+    v = ri.ListSexpVector([ri.IntSexpVector([1]), ri.StrSexpVector(['a'])])
+    v.put(range(2), [ri.StrSexpVector(['b']), ri.IntSexpVector([2])])
+    assert tuple(v[0]) == ('b', )
+    assert tuple(v[1]) == (2, )
+
+
+@pytest.mark.parametrize(
+    'cls,values',
+    ((ri.BoolSexpVector, [True, False, True, ri.NA_Logical, False]),
+     (ri.IntSexpVector, [1, 2, ri.NA_Integer, 4, 5]),
+     (ri.FloatSexpVector, [1.5, 2.5, 3.5, 4.5, 5.5]),
+     (ri.ByteSexpVector, [1, 2, 3, 4, 5]))
+)
+@pytest.mark.parametrize(
+    'i',
+    (slice(1, 4), slice(None, None, 2), slice(None, None, -1),
+     slice(4, 0, -3), slice(3, 1), slice(None))
+)
+def test_getslice_numeric(cls, values, i):
+    v = cls(values)
+    res = v[i]
+    assert type(res) is cls
+    assert list(res) == values[i]
+
+
+def test_iter_chunked():
+    n = ri.IntSexpVector._ITER_CHUNK_SIZE * 2 + 3
+    v = ri.IntSexpVector(range(n))
+    assert list(v) == list(range(n))
+
+
+@pytest.mark.parametrize('rcode', ('1:1e6', 'as.numeric(1:1e6)'))
+def test_take_compact_sequence(rcode):
+    v = ri.evalr(rcode)
+    cdata = v.__sexp__._cdata
+    # A compact sequence (ALTREP) has no data in memory.
+    if ri.openrlib.rlib.DATAPTR_OR_NULL(cdata) != ri.openrlib.ffi.NULL:
+        pytest.skip('Not a compact sequence.')
+    assert v.take([0, 999999]) == [1, 1000000]
+    assert v.take(range(2)) == [1, 2]
+    it = iter(v)
+    assert [next(it) for i in range(3)] == [1, 2, 3]
+    # It was not expanded in memory.
+    assert ri.openrlib.rlib.DATAPTR_OR_NULL(cdata) == ri.openrlib.ffi.NULL
+
+
 _instantiate_without_initr = textwrap.dedent(
     """
     import rpy2.rinterface as rinterface
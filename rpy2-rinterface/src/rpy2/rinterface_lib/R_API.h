@@ -164,6 +164,7 @@ void R_dot_Last(void);
 
 /* src/include/Rinlinedfunc.h */
 void* DATAPTR(SEXP x);
+const void *(DATAPTR_OR_NULL)(SEXP x);
 
 /* include/Rinternals.h */
 SEXP (TAG)(SEXP e);
@@ -270,6 +271,7 @@ R_xlen_t Rf_xlength(SEXP);
 SEXP R_lsInternal(SEXP, Rboolean);
 
 SEXP Rf_duplicate(SEXP s);
+SEXP Rf_shallow_duplicate(SEXP s);
 
 SEXP Rf_defineVar(SEXP sym, SEXP s, SEXP env);
 
@@ -344,7 +346,9 @@ void SET_HASHTAB(SEXP x, SEXP v);
 
 extern SEXP R_ClassSymbol;
 extern SEXP R_NameSymbol;
+extern SEXP R_NamesSymbol;
 extern SEXP R_DimSymbol;
+extern SEXP R_RowNamesSymbol;
 
 /* include/Rinternals.h */
 Rboolean (Rf_isSymbol)(SEXP s);
@@ -524,3 +528,92 @@ int R_registerRoutines(DllInfo *info,
 DllInfo *R_getEmbeddingDllInfo(void);
 
 void *R_ExternalPtrAddr(SEXP s);
+
+/* include/Rinternals.h: serialization to persistent streams */
+typedef void *R_pstream_data_t;
+
+typedef enum {
+    R_pstream_any_format,
+    R_pstream_ascii_format,
+    R_pstream_binary_format,
+    R_pstream_xdr_format,
+    R_pstream_asciihex_format
+} R_pstream_format_t;
+
+typedef struct R_outpstream_st *R_outpstream_t;
+struct R_outpstream_st {
+    R_pstream_data_t data;
+    R_pstream_format_t type;
+    int version;
+    void (*OutChar)(R_outpstream_t, int);
+    void (*OutBytes)(R_outpstream_t, void *, int);
+    SEXP (*OutPersistHookFunc)(SEXP, SEXP);
+    SEXP OutPersistHookData;
+};
+
+typedef struct R_inpstream_st *R_inpstream_t;
+struct R_inpstream_st {
+    R_pstream_data_t data;
+    R_pstream_format_t type;
+    int (*InChar)(R_inpstream_t);
+    void (*InBytes)(R_inpstream_t, void *, int);
+    SEXP (*InPersistHookFunc)(SEXP, SEXP);
+    SEXP InPersistHookData;
+    /* R_CODESET_MAX + 1 */
+    char native_encoding[64];
+    void *nat2nat_obj;
+    void *nat2utf8_obj;
+};
+
+void R_InitInPStream(R_inpstream_t stream, R_pstream_data_t data,
+                     R_pstream_format_t type,
+                     int (*InChar)(R_inpstream_t),
+                     void (*InBytes)(R_inpstream_t, void *, int),
+                     SEXP (*phook)(SEXP, SEXP), SEXP pdata);
+void R_InitOutPStream(R_outpstream_t stream, R_pstream_data_t data,
+                      R_pstream_format_t type, int version,
+                      void (*OutChar)(R_outpstream_t, int),
+                      void (*OutBytes)(R_outpstream_t, void *, int),
+                      SEXP (*phook)(SEXP, SEXP), SEXP pdata);
+void R_Serialize(SEXP s, R_outpstream_t ops);
+SEXP R_Unserialize(R_inpstream_t ips);
+
+/* include/R_ext/Altrep.h */
+typedef struct {
+    SEXP ptr;
+} R_altrep_class_t;
+
+SEXP R_new_altrep(R_altrep_class_t aclass, SEXP data1, SEXP data2);
+R_altrep_class_t R_make_altinteger_class(const char *cname, const char *pname,
+                                         DllInfo *info);
+R_altrep_class_t R_make_altreal_class(const char *cname, const char *pname,
+                                      DllInfo *info);
+R_altrep_class_t R_make_altlogical_class(const char *cname, const char *pname,
+                                         DllInfo *info);
+Rboolean R_altrep_inherits(SEXP x, R_altrep_class_t cls);
+SEXP R_altrep_data1(SEXP x);
+SEXP R_altrep_data2(SEXP x);
+void R_set_altrep_data2(SEXP x, SEXP v);
+
+typedef R_xlen_t (*R_altrep_Length_method_t)(SEXP);
+typedef SEXP (*R_altrep_Duplicate_method_t)(SEXP, Rboolean);
+typedef void *(*R_altvec_Dataptr_method_t)(SEXP, Rboolean);
+typedef const void *(*R_altvec_Dataptr_or_null_method_t)(SEXP);
+typedef int (*R_altinteger_Elt_method_t)(SEXP, R_xlen_t);
+typedef double (*R_altreal_Elt_method_t)(SEXP, R_xlen_t);
+typedef int (*R_altlogical_Elt_method_t)(SEXP, R_xlen_t);
+
+void R_set_altrep_Length_method(R_altrep_class_t cls,
+                                R_altrep_Length_method_t fun);
+void R_set_altrep_Duplicate_method(R_altrep_class_t cls,
+                                   R_altrep_Duplicate_method_t fun);
+void R_set_altvec_Dataptr_method(R_altrep_class_t cls,
+                                 R_altvec_Dataptr_method_t fun);
+void R_set_altvec_Dataptr_or_null_method(
+    R_altrep_class_t cls, R_altvec_Dataptr_or_null_method_t fun);
+void R_set_altinteger_Elt_method(R_altrep_class_t cls,
+                                 R_altinteger_Elt_method_t fun);
+void R_set_altreal_Elt_method(R_altrep_class_t cls,
+                              R_altreal_Elt_method_t fun);
+void R_set_altlogical_Elt_method(R_altrep_class_t cls,
+                                 R_altlogical_Elt_method_t fun);
@@ -5,6 +5,7 @@ import enum
 import inspect
 import logging
 from typing import Tuple
+import types
 import typing
 import warnings
 from rpy2.rinterface_lib import ffi_proxy
@@ -25,6 +26,11 @@ _MAX_INT: int = 2**32-1
 
 _R_PRESERVED = dict()  # type: typing.Dict[int, int]
 _PY_PASSENGER = dict()
+# Callables called with the R ID of an object when rpy2 stops
+# protecting it from collection (see `_release()`). This lets caches
+# indexed by R ID drop entries for objects that R may now collect (and
+# whose address may then be reused).
+_RELEASE_HOOKS: typing.List[typing.Callable[[int], None]] = []
 
 FFI_MODE = ffi_proxy.get_ffi_mode(openrlib._rinterface_cffi)
 
@@ -57,12 +63,82 @@ def is_cdata_sexp(obj: typing.Any) -> bool:
         return False
 
 
+class _PreservationPool:
+    """Protection of R objects from R's garbage collection.
+
+    R_PreserveObject() and R_ReleaseObject() in R's C API keep the
+    preserved objects in a linked list, and releasing an object is linear
+    in the number of preserved objects. The pool stores the R objects in
+    the slots of R lists (blocks) preserved with R_PreserveObject(), and
+    keeps track of the free slots. Adding or removing an object is then
+    constant time, and the pool grows by adding blocks without copying
+    the existing ones."""
+
+    __slots__ = ('block_size', '_blocks', '_free', '_slots')
+
+    def __init__(self, block_size: int = 2 ** 14):
+        self.block_size = block_size
+        # R lists (VECSXP) with the objects.
+        self._blocks: typing.List[FFI.CData] = []
+        # Free slots, as indices across blocks.
+        self._free: typing.List[int] = []
+        # Slot used for each object, indexed by R ID.
+        self._slots: typing.Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _grow(self) -> None:
+        rlib = openrlib.rlib
+        block = rlib.Rf_allocVector(rlib.VECSXP, self.block_size)
+        rlib.R_PreserveObject(block)
+        offset = len(self._blocks) * self.block_size
+        self._blocks.append(block)
+        # Slots are taken from the end of the list of free slots.
+        self._free.extend(range(offset + self.block_size - 1,
+                                offset - 1, -1))
+
+    def add(self, cdata: FFI.CData, addr: int) -> None:
+        """Protect the R object with R ID addr."""
+        if not self._free:
+            # Allocating a new block can trigger R's garbage collection,
+            # and the object is not protected yet.
+            openrlib.rlib.Rf_protect(cdata)
+            try:
+                self._grow()
+            finally:
+                openrlib.rlib.Rf_unprotect(1)
+        slot = self._free.pop()
+        openrlib.rlib.SET_VECTOR_ELT(
+            self._blocks[slot // self.block_size],
+            slot % self.block_size,
+            cdata
+        )
+        self._slots[addr] = slot
+
+    def remove(self, addr: int) -> None:
+        """Stop protecting the R object with R ID addr."""
+        slot = self._slots.pop(addr)
+        openrlib.rlib.SET_VECTOR_ELT(
+            self._blocks[slot // self.block_size],
+            slot % self.block_size,
+            openrlib.rlib.R_NilValue
+        )
+        self._free.append(slot)
+
+
+_PRESERVATION_POOL = _PreservationPool()
+
+
 def _preserve(cdata: FFI.CData) -> int:
     addr = int(ffi.cast('uintptr_t', cdata))
-    count = _R_PRESERVED.get(addr, 0)
-    if count == 0:
-        openrlib.rlib.R_PreserveObject(cdata)
-    _R_PRESERVED[addr] = count + 1
+    # The GIL is released while R is running (cffi releases it around
+    # calls to C functions), and an other thread may be evaluating R code.
+    with openrlib.rlock:
+        count = _R_PRESERVED.get(addr, 0)
+        if count == 0:
+            _PRESERVATION_POOL.add(cdata, addr)
+        _R_PRESERVED[addr] = count + 1
     return addr
 
 
@@ -71,11 +147,35 @@ def _release(cdata: FFI.CData) -> None:
     count = _R_PRESERVED[addr] - 1
     if count == 0:
         del _R_PRESERVED[addr]
-        openrlib.rlib.R_ReleaseObject(cdata)
+        _PRESERVATION_POOL.remove(addr)
+        for hook in _RELEASE_HOOKS:
+            hook(addr)
     else:
         _R_PRESERVED[addr] = count
 
 
+memorymanagement.release_queue.release = _release
+
+
+def _release_or_defer(cdata: FFI.CData) -> None:
+    """Release the R object, or defer the release if R is busy.
+
+    Capsules are finalized in whatever thread runs Python's garbage
+    collection. If R's lock is held by an other thread (for example
+    evaluating R code), the release is added to the queue of deferred
+    releases rather than waiting for R."""
+    release_queue = memorymanagement.release_queue
+    if release_queue.enabled:
+        release_queue.enqueue(cdata)
+    elif openrlib.rlock.acquire(blocking=False):
+        try:
+            _release(cdata)
+        finally:
+            openrlib.rlock.release()
+    else:
+        release_queue.enqueue(cdata)
+
+
 @ffi_proxy.callback(ffi_proxy._capsule_finalizer_def,
                     openrlib._rinterface_cffi)
 def _capsule_finalizer(cdata: FFI.CData) -> None:
@@ -140,7 +240,7 @@ class SexpCapsule(CapsuleBase):
 
     def __del__(self):
         try:
-            _release(self._cdata)
+            _release_or_defer(self._cdata)
         except Exception as e:
             # _release can be None while capsules when Python is terminating
             # and R is being shutdown, resulting in a race condition when
@@ -163,7 +263,7 @@ class SexpCapsuleWithPassenger(SexpCapsule):
 
     def __del__(self):
         addr = get_rid(self._cdata)
-        _release(self._cdata)
+        _release_or_defer(self._cdata)
         if addr not in _PY_PASSENGER:
             del _PY_PASSENGER[addr]
 
@@ -222,10 +322,11 @@ def findvar_in_frame(rho, symbol):
         'struct RPY2_sym_env_data *',
         [symbol, rho, openrlib.rlib.R_NilValue]
     )
-    _ = openrlib.rlib.R_ToplevelExec(
-        openrlib.rlib._exec_findvar_in_frame,
-        exec_data
-    )
+    with openrlib.rlock:
+        _ = openrlib.rlib.R_ToplevelExec(
+            openrlib.rlib._exec_findvar_in_frame,
+            exec_data
+        )
     if _ != openrlib.rlib.TRUE:
         raise embedded.RRuntimeError(
             'R C-API Rf_findVarInFrame()'
@@ -495,111 +596,184 @@ def unserialize(cdata: FFI.CData, cdata_env: FFI.CData) -> FFI.CData:
         return res
 
 
-@ffi_proxy.callback(ffi_proxy._evaluate_in_r_def,
-                    openrlib._rinterface_cffi)
-def _evaluate_in_r(rargs: FFI.CData) -> FFI.CData:
-    # An uncaught exception in the boby of this function would
-    # result in a segfault. we wrap it in a try-except an report
-    # exceptions as logs.
-
-    rlib = openrlib.rlib
-    try:
-        rargs = rlib.CDR(rargs)
-        cdata = rlib.CAR(rargs)
-        if (_TYPEOF(cdata) != rlib.EXTPTRSXP):
-            # TODO: also check tag
-            #    (rlib.R_ExternalPtrTag(sexp) == '.Python')
-            logger.error('The fist item is not an R external pointer.')
-            return rlib.R_NilValue
-        handle = rlib.R_ExternalPtrAddr(cdata)
-        func = ffi.from_handle(handle)
-        pyargs = []
-        pykwargs = {}
-        # R and Python function definitions differ. In R all arguments
-        # are optionally named, that is like "positional or keyword" arguments
-        # in Python. "positional or keyword" happens to be default for
-        # arguments without a default *unless* the ellipsis `*args` is used,
-        # in which case all arguments prior to it become positional-only.
-        # We will want to skip naming positional-only arguments although R
-        # might.
-        # TODO: Extraction information by inspecting the signature of the
-        # Python function will be done for each call. This is a performance burden.
-        # Is there a way to do it at "rternalization" time and access the result at
-        # call time?
-        # TODO: An other optimization would be to have a streamlined path for
-        # function that only have POSITIONAL_ONLY parameters (or may be
-        # POSITIONAL_ONLY and/or KEYWORD_ONLY).
-        pyfunc_params_iter = inspect.signature(func).parameters.items()
-        py_posonly = []
-        py_has_ellipsis = False
-        py_positionalorkw = []
-        for paramname, paramval in pyfunc_params_iter:
+class RternalizedCallable:
+    """A Python callable made callable from R, with its signature.
+
+    R and Python function definitions differ. In R all arguments
+    are optionally named, that is like "positional or keyword" arguments
+    in Python. "positional or keyword" happens to be default for
+    arguments without a default *unless* the ellipsis `*args` is used,
+    in which case all arguments prior to it become positional-only.
+    We will want to skip naming positional-only arguments although R
+    might.
+
+    The parameters of the callable are classified accordingly once,
+    when creating the instance, rather than for each call from R. The
+    R symbols for the names of arguments that can be passed by position
+    are also kept to match the names in an R call without having to
+    decode them."""
+
+    __slots__ = ('function', 'posonly', 'positionalorkw', 'has_ellipsis',
+                 'positional', 'posonly_symbols', 'positionalorkw_symbols')
+
+    def __init__(self, function: typing.Callable):
+        self.function = function
+        self.posonly: typing.List[str] = []
+        self.positionalorkw: typing.List[str] = []
+        self.has_ellipsis = False
+        # Only positional arguments can be passed to the callable.
+        self.positional = True
+        try:
+            params = inspect.signature(function).parameters
+        except ValueError:
+            # No signature available (for example for some builtins).
+            # All arguments named in R are passed as named arguments.
+            params = types.MappingProxyType({})
+            self.positional = False
+        for paramname, paramval in params.items():
             if paramval.kind is inspect.Parameter.POSITIONAL_ONLY:
-                py_posonly.append(paramname)
-            elif (paramval.kind is inspect.Parameter.VAR_POSITIONAL
-                  or
-                  paramval.kind is inspect.Parameter.VAR_KEYWORD):
-                py_has_ellipsis = True
+                self.posonly.append(paramname)
+            elif paramval.kind is inspect.Parameter.VAR_POSITIONAL:
+                self.has_ellipsis = True
+            elif paramval.kind is inspect.Parameter.VAR_KEYWORD:
+                self.has_ellipsis = True
+                self.positional = False
             elif paramval.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
-                py_positionalorkw.append(paramname)
+                self.positionalorkw.append(paramname)
+                self.positional = False
             else:
                 # KEYWORD_ONLY from now on.
+                self.positional = False
                 break
+        # Symbols are never collected by R.
+        rlib = openrlib.rlib
+        self.posonly_symbols = tuple(
+            rlib.Rf_install(conversion._str_to_cchar(x))
+            for x in self.posonly
+        )
+        self.positionalorkw_symbols = tuple(
+            rlib.Rf_install(conversion._str_to_cchar(x))
+            for x in self.positionalorkw
+        )
+
+    def __call__(self, *args, **kwargs):
+        return self.function(*args, **kwargs)
+
+    def _positional_args(self, rargs: FFI.CData) -> typing.Optional[list]:
+        """Python arguments for an R call to a positional callable.
+
+        The R arguments must be unnamed or named like the positional-only
+        parameter at their position. Otherwise None is returned and the
+        call must go through `_args()`."""
+        rlib = openrlib.rlib
+        posonly_symbols = self.posonly_symbols
+        n_posonly = len(posonly_symbols)
+        pyargs = []
+        rarg_i = 0
+        while rargs != rlib.R_NilValue:
+            tag = rlib.TAG(rargs)
+            if (
+                    tag != rlib.R_NilValue and
+                    (rarg_i >= n_posonly or tag != posonly_symbols[rarg_i])
+            ):
+                return None
+            pyargs.append(conversion._cdata_to_rinterface(rlib.CAR(rargs)))
+            rargs = rlib.CDR(rargs)
+            rarg_i += 1
+        return pyargs
+
+    def _args(self, rargs: FFI.CData) -> typing.Tuple[list, dict]:
+        """Python arguments and named arguments for an R call."""
+        rlib = openrlib.rlib
+        posonly_symbols = self.posonly_symbols
+        positionalorkw_symbols = self.positionalorkw_symbols
+        n_posonly = len(posonly_symbols)
+        n_positional = n_posonly + len(positionalorkw_symbols)
+        pyargs = []
+        pykwargs = {}
         rarg_i = -1
-        rargs = rlib.CDR(rargs)
         while rargs != rlib.R_NilValue:
             rarg_i += 1
             cdata = rlib.CAR(rargs)
-            if rlib.Rf_isNull(rlib.TAG(rargs)):
+            tag = rlib.TAG(rargs)
+            if rlib.Rf_isNull(tag):
                 # Unnamed argument
                 pyargs.append(conversion._cdata_to_rinterface(cdata))
+            elif rarg_i < n_posonly:
+                if posonly_symbols[rarg_i] == tag:
+                    # This is an unnamed argument and names are matching.
+                    pyargs.append(conversion._cdata_to_rinterface(cdata))
+                else:
+                    # The R call is considering the parameter as a named one
+                    # and the position is not conserved. This is can lead
+                    # to unnoticed issues, and difficult to debug ones when
+                    # they are. It is better to report the issue here.
+                    raise RuntimeError(
+                        'Parameter name mismatch. R call considering the argument '
+                        f'"{self.posonly[rarg_i]}" as a position-independent '
+                        'keyword argument while it is positional-only '
+                        'in the rternalized Python function.'
+                    )
+            elif self.has_ellipsis and rarg_i < n_positional:
+                if positionalorkw_symbols[rarg_i - n_posonly] == tag:
+                    # This is considered an unnamed argument and names are matching.
+                    pyargs.append(conversion._cdata_to_rinterface(cdata))
+                else:
+                    # The R call is considering the parameter as a named one
+                    # and the position is not conserved. This is can lead
+                    # to unnoticed issues, and difficult to debug ones when
+                    # they are. It is better to report the issue here.
+                    raise RuntimeError(
+                        'Parameter name mismatch. R call considering the argument '
+                        f'"{self.positionalorkw[rarg_i - n_posonly]}" as a '
+                        'position-independent '
+                        'keyword argument while it is positional-or-keyword '
+                        'followed by an positional ellipsis `*args` in the '
+                        'rternalized Python function.'
+                    )
             else:
                 # Named arguments
-                rname = rlib.PRINTNAME(rlib.TAG(rargs))
+                rname = rlib.PRINTNAME(tag)
                 name = conversion._cchar_to_str(
                     rlib.R_CHAR(rname),
                     conversion._R_ENC_PY[openrlib.rlib.Rf_getCharCE(rname)]
                 )
-                if rarg_i < len(py_posonly):
-                    if py_posonly[rarg_i] == name:
-                        # This is an unnamed argument and names are matching.
-                        pyargs.append(conversion._cdata_to_rinterface(cdata))
-                    else:
-                        # The R call is considering the parameter as a named one
-                        # and the position is not conserved. This is can lead
-                        # to unnoticed issues, and difficult to debug ones when
-                        # they are. It is better to report the issue here.
-                        raise RuntimeError(
-                            'Parameter name mismatch. R call considering the argument '
-                            f'"{py_posonly[rarg_i]}" as a position-independent '
-                            'keyword argument while it is positional-only '
-                            'in the rternalized Python function.'
-                        )
-                elif (
-                        py_has_ellipsis
-                        and
-                        (rarg_i < (len(py_posonly) + len(py_positionalorkw)))
-                ):
-                    if py_positionalorkw[rarg_i - len(py_posonly)] == name:
-                        # This is considered an unnamed argument and names are matching.
-                        pyargs.append(conversion._cdata_to_rinterface(cdata))
-                    else:
-                        # The R call is considering the parameter as a named one
-                        # and the position is not conserved. This is can lead
-                        # to unnoticed issues, and difficult to debug ones when
-                        # they are. It is better to report the issue here.
-                        raise RuntimeError(
-                            'Parameter name mismatch. R call considering the argument '
-                            f'"{py_posonly[rarg_i]}" as a position-independent '
-                            'keyword argument while it is positional-or-keyword '
-                            'followed by an positional ellipsis `*args` in the '
-                            'rternalized Python function.'
-                        )
-                else:
-                    pykwargs[name] = conversion._cdata_to_rinterface(cdata)
+                pykwargs[name] = conversion._cdata_to_rinterface(cdata)
             rargs = rlib.CDR(rargs)
+        return pyargs, pykwargs
+
+
+@ffi_proxy.callback(ffi_proxy._evaluate_in_r_def,
+                    openrlib._rinterface_cffi)
+def _evaluate_in_r(rargs: FFI.CData) -> FFI.CData:
+    # An uncaught exception in the boby of this function would
+    # result in a segfault. we wrap it in a try-except an report
+    # exceptions as logs.
 
-        res = func(*pyargs, **pykwargs)
+    rlib = openrlib.rlib
+    try:
+        rargs = rlib.CDR(rargs)
+        cdata = rlib.CAR(rargs)
+        if (_TYPEOF(cdata) != rlib.EXTPTRSXP):
+            # TODO: also check tag
+            #    (rlib.R_ExternalPtrTag(sexp) == '.Python')
+            logger.error('The fist item is not an R external pointer.')
+            return rlib.R_NilValue
+        handle = rlib.R_ExternalPtrAddr(cdata)
+        func = ffi.from_handle(handle)
+        if not isinstance(func, RternalizedCallable):
+            # External pointer to a Python callable not created with
+            # `rternalize()`.
+            func = RternalizedCallable(func)
+        rargs = rlib.CDR(rargs)
+        pyargs = None
+        if func.positional:
+            pyargs = func._positional_args(rargs)
+        if pyargs is None:
+            pyargs, pykwargs = func._args(rargs)
+            res = func.function(*pyargs, **pykwargs)
+        else:
+            res = func.function(*pyargs)
         # The object is whatever the "rternalized" function `func`
         # is returning and we need to cast that result into a SEXP
         # that R's C API can handle. At the same time we need to ensure
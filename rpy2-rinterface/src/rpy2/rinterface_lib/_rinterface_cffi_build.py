@@ -251,7 +251,20 @@ def createbuilder_api():
                 ffi_proxy._yesnocancel_def,
                 ffi_proxy._parsevector_wrap_def,
                 ffi_proxy._handler_def,
-                ffi_proxy._exec_findvar_in_frame_def
+                ffi_proxy._exec_findvar_in_frame_def,
+                ffi_proxy._altrep_length_def,
+                ffi_proxy._altrep_duplicate_def,
+                ffi_proxy._altrep_dataptr_def,
+                ffi_proxy._altrep_dataptr_or_null_def,
+                ffi_proxy._altrep_integer_elt_def,
+                ffi_proxy._altrep_real_elt_def,
+                ffi_proxy._altrep_finalizer_def,
+                ffi_proxy._serialize_exec_def,
+                ffi_proxy._unserialize_exec_def,
+                ffi_proxy._outchar_def,
+                ffi_proxy._outbytes_def,
+                ffi_proxy._inchar_def,
+                ffi_proxy._inbytes_def
         ])
 
     # Subset of R headers we expose through cffi.
@@ -0,0 +1,310 @@
+"""R vectors using the memory of Python buffers (no copy).
+
+R's ALTREP framework ("alternative representations") lets code define
+how the data in an R vector are stored and accessed. The ALTREP classes
+defined here expose the memory of a contiguous Python buffer (for example
+a numpy array) as an R vector of booleans, integers, or floats.
+
+The Python object exporting the buffer is kept alive as long as R has
+a reference to the vector. R never writes into the Python buffer: a
+request for a writable pointer to the data (for example when the vector
+is modified in place) materializes a regular R vector holding a copy of
+the data and the ALTREP vector uses that copy from then on.
+"""
+
+import logging
+import typing
+from rpy2.rinterface_lib import ffi_proxy
+from rpy2.rinterface_lib import memorymanagement
+from rpy2.rinterface_lib import openrlib
+import rpy2.rinterface_lib._rinterface_capi as _rinterface
+
+from _cffi_backend import FFI  # type: ignore
+
+
+logger = logging.getLogger(__name__)
+
+ffi = openrlib.ffi
+
+# C type and compatible Python buffer formats for each R type that
+# can be backed by a Python buffer.
+_BUFFER_TYPES = {
+    openrlib.rlib.LGLSXP: ('int *', ('i', 'l')),
+    openrlib.rlib.INTSXP: ('int *', ('i', 'l')),
+    openrlib.rlib.REALSXP: ('double *', ('d', )),
+}
+
+# ALTREP classes, created on demand (see _altrep_class()).
+_ALTREP_CLASSES: typing.Dict[int, FFI.CData] = {}
+
+# Python buffers backing R vectors, indexed by the R ID of the external
+# pointer used as the "data1" of each ALTREP vector. An entry is removed
+# when R collects the external pointer, or when the R vector materializes
+# its own copy of the data.
+_BUFFERS: typing.Dict[int, '_Buffer'] = {}
+
+
+class _Buffer:
+    """A Python buffer backing an R vector."""
+
+    __slots__ = ('mview', 'cbuffer', 'ptr', 'length', 'nbytes', 'owner')
+
+    def __init__(self, mview: memoryview, ctype: str,
+                 owner: typing.Any = None):
+        self.mview = mview
+        self.owner = owner
+        self.cbuffer = ffi.from_buffer(mview)
+        self.ptr = ffi.cast(ctype, self.cbuffer)
+        self.length = len(mview)
+        self.nbytes = mview.nbytes
+
+
+def is_compatible(rtype: int, mview: memoryview) -> bool:
+    """Can the memoryview back an R vector of type `rtype` ?"""
+    if rtype not in _BUFFER_TYPES:
+        return False
+    ctype, formats = _BUFFER_TYPES[rtype]
+    return (
+        mview.contiguous and
+        mview.ndim <= 1 and
+        mview.format.lstrip('@=') in formats and
+        mview.itemsize == ffi.sizeof(ctype[:-2])
+    )
+
+
+def _data1_rid(x: FFI.CData) -> int:
+    return _rinterface.get_rid(openrlib.rlib.R_altrep_data1(x))
+
+
+def _materialized(x: FFI.CData) -> typing.Optional[FFI.CData]:
+    """R vector materialized for an ALTREP vector, or None."""
+    data2 = openrlib.rlib.R_altrep_data2(x)
+    if data2 == openrlib.rlib.R_NilValue:
+        return None
+    else:
+        return data2
+
+
+def _readonly_ptr(x: FFI.CData) -> FFI.CData:
+    data2 = _materialized(x)
+    if data2 is None:
+        return _BUFFERS[_data1_rid(x)].ptr
+    else:
+        ctype = _BUFFER_TYPES[_rinterface._TYPEOF(x)][0]
+        return ffi.cast(ctype, openrlib.rlib.DATAPTR(data2))
+
+
+def _length(x: FFI.CData) -> int:
+    data2 = _materialized(x)
+    if data2 is None:
+        return _BUFFERS[_data1_rid(x)].length
+    else:
+        return openrlib.rlib.Rf_xlength(data2)
+
+
+@ffi_proxy.callback(ffi_proxy._altrep_length_def,
+                    openrlib._rinterface_cffi)
+def _altrep_length(x: FFI.CData) -> int:
+    try:
+        return _length(x)
+    except Exception as e:
+        logger.error('%s: ALTREP length %s' % (type(e).__name__, e))
+        return 0
+
+
+@ffi_proxy.callback(ffi_proxy._altrep_duplicate_def,
+                    openrlib._rinterface_cffi)
+def _altrep_duplicate(x: FFI.CData, deep: int) -> FFI.CData:
+    # The duplicate is a regular R vector with a copy of the data.
+    rlib = openrlib.rlib
+    try:
+        rtype = _rinterface._TYPEOF(x)
+        n = _length(x)
+        res = rlib.Rf_allocVector(rtype, n)
+        ffi.memmove(rlib.DATAPTR(res), _readonly_ptr(x),
+                    n * ffi.sizeof(_BUFFER_TYPES[rtype][0][:-2]))
+        return res
+    except Exception as e:
+        logger.error('%s: ALTREP duplicate %s' % (type(e).__name__, e))
+        return ffi.NULL
+
+
+@ffi_proxy.callback(ffi_proxy._altrep_dataptr_def,
+                    openrlib._rinterface_cffi)
+def _altrep_dataptr(x: FFI.CData, writeable: int) -> FFI.CData:
+    rlib = openrlib.rlib
+    try:
+        data2 = _materialized(x)
+        if data2 is None:
+            rid = _data1_rid(x)
+            buffer = _BUFFERS[rid]
+            if not writeable:
+                return buffer.ptr
+            # R wants to write: materialize a copy and let go of the
+            # Python buffer.
+            data2 = rlib.Rf_allocVector(_rinterface._TYPEOF(x),
+                                        buffer.length)
+            ffi.memmove(rlib.DATAPTR(data2), buffer.ptr, buffer.nbytes)
+            rlib.R_set_altrep_data2(x, data2)
+            del _BUFFERS[rid]
+        return rlib.DATAPTR(data2)
+    except Exception as e:
+        logger.error('%s: ALTREP dataptr %s' % (type(e).__name__, e))
+        return ffi.NULL
+
+
+@ffi_proxy.callback(ffi_proxy._altrep_dataptr_or_null_def,
+                    openrlib._rinterface_cffi)
+def _altrep_dataptr_or_null(x: FFI.CData) -> FFI.CData:
+    try:
+        return _readonly_ptr(x)
+    except Exception as e:
+        logger.error('%s: ALTREP dataptr_or_null %s' % (type(e).__name__, e))
+        return ffi.NULL
+
+
+@ffi_proxy.callback(ffi_proxy._altrep_integer_elt_def,
+                    openrlib._rinterface_cffi)
+def _altrep_integer_elt(x: FFI.CData, i: int) -> int:
+    try:
+        return _readonly_ptr(x)[i]
+    except Exception as e:
+        logger.error('%s: ALTREP integer_elt %s' % (type(e).__name__, e))
+        return openrlib.rlib.R_NaInt
+
+
+@ffi_proxy.callback(ffi_proxy._altrep_real_elt_def,
+                    openrlib._rinterface_cffi)
+def _altrep_real_elt(x: FFI.CData, i: int) -> float:
+    try:
+        return _readonly_ptr(x)[i]
+    except Exception as e:
+        logger.error('%s: ALTREP real_elt %s' % (type(e).__name__, e))
+        return openrlib.rlib.R_NaReal
+
+
+@ffi_proxy.callback(ffi_proxy._altrep_finalizer_def,
+                    openrlib._rinterface_cffi)
+def _altrep_finalizer(extptr: FFI.CData) -> None:
+    _BUFFERS.pop(_rinterface.get_rid(extptr), None)
+
+
+def _c_callback(name: str, callback):
+    # ABI and API modes differs in what is the exact callback object to be
+    # passed to C code.
+    if hasattr(openrlib._rinterface_cffi, 'lib'):
+        return getattr(openrlib._rinterface_cffi.lib, name)
+    else:
+        return callback
+
+
+def _altrep_class(rtype: int) -> FFI.CData:
+    """Get the ALTREP class for R vectors of type `rtype`.
+
+    The class is created and registered with R on first use."""
+    res = _ALTREP_CLASSES.get(rtype)
+    if res is not None:
+        return res
+    rlib = openrlib.rlib
+    dllinfo = rlib.R_getEmbeddingDllInfo()
+    if rtype == rlib.REALSXP:
+        res = rlib.R_make_altreal_class(b'rpy2_buffer_real', b'rpy2',
+                                        dllinfo)
+        rlib.R_set_altreal_Elt_method(
+            res, _c_callback('_altrep_real_elt', _altrep_real_elt)
+        )
+    elif rtype == rlib.INTSXP:
+        res = rlib.R_make_altinteger_class(b'rpy2_buffer_integer', b'rpy2',
+                                           dllinfo)
+        rlib.R_set_altinteger_Elt_method(
+            res, _c_callback('_altrep_integer_elt', _altrep_integer_elt)
+        )
+    elif rtype == rlib.LGLSXP:
+        res = rlib.R_make_altlogical_class(b'rpy2_buffer_logical', b'rpy2',
+                                           dllinfo)
+        rlib.R_set_altlogical_Elt_method(
+            res, _c_callback('_altrep_integer_elt', _altrep_integer_elt)
+        )
+    else:
+        raise ValueError(
+            f'No ALTREP class for R vectors of type {rtype}.'
+        )
+    rlib.R_set_altrep_Length_method(
+        res, _c_callback('_altrep_length', _altrep_length)
+    )
+    rlib.R_set_altrep_Duplicate_method(
+        res, _c_callback('_altrep_duplicate', _altrep_duplicate)
+    )
+    rlib.R_set_altvec_Dataptr_method(
+        res, _c_callback('_altrep_dataptr', _altrep_dataptr)
+    )
+    rlib.R_set_altvec_Dataptr_or_null_method(
+        res, _c_callback('_altrep_dataptr_or_null', _altrep_dataptr_or_null)
+    )
+    _ALTREP_CLASSES[rtype] = res
+    return res
+
+
+def new_buffer_vector(rtype: int, mview: 'memoryview[typing.Any]',
+                      owner: typing.Any = None) -> FFI.CData:
+    """Create an R vector of type `rtype` using the memory of a buffer.
+
+    The memoryview must be contiguous and its items must have the
+    C representation used by R for the vector type. If not the case
+    a :class:`ValueError` is raised.
+
+    The optional `owner` is kept alive along with the memoryview. This
+    is for memory the memoryview does not hold a reference to (for
+    example the memory of an other R vector).
+
+    The result is not protected from R's garbage collection."""
+    if not is_compatible(rtype, mview):
+        raise ValueError(
+            f'The memoryview (format "{mview.format}", itemsize '
+            f'{mview.itemsize}) cannot back an R vector of type {rtype}.'
+        )
+    rlib = openrlib.rlib
+    buffer = _Buffer(mview, _BUFFER_TYPES[rtype][0], owner=owner)
+    with memorymanagement.rmemory() as rmemory:
+        extptr = rmemory.protect(
+            rlib.R_MakeExternalPtr(ffi.NULL,
+                                   rlib.R_NilValue,
+                                   rlib.R_NilValue)
+        )
+        rlib.R_RegisterCFinalizer(
+            extptr, _c_callback('_altrep_finalizer', _altrep_finalizer)
+        )
+        _BUFFERS[_rinterface.get_rid(extptr)] = buffer
+        res = rlib.R_new_altrep(_altrep_class(rtype), extptr,
+                                rlib.R_NilValue)
+    return res
+
+
+def is_buffer_backed(cdata: FFI.CData) -> bool:
+    """Is the R object an R vector using the memory of a Python buffer ?
+
+    This remains True after the vector materialized its own copy
+    of the data."""
+    return any(
+        openrlib.rlib.R_altrep_inherits(cdata, cls)
+        for cls in _ALTREP_CLASSES.values()
+    )
+
+
+def readonly_dataptr(cdata: FFI.CData) -> FFI.CData:
+    """Get a typed pointer to the data of an R vector using the memory
+    of a Python buffer, for reading only.
+
+    Unlike R's DATAPTR() (a writable pointer), this does not make the
+    vector materialize its own copy of the data."""
+    return _readonly_ptr(cdata)
+
+
+def buffer_memoryview(cdata: FFI.CData) -> typing.Optional[memoryview]:
+    """Get the memoryview of the Python buffer an R vector is using.
+
+    None is returned if the R vector is not using the memory of a Python
+    buffer, or no longer is (it materialized its own copy of the data)."""
+    if not is_buffer_backed(cdata) or _materialized(cdata) is not None:
+        return None
+    return _BUFFERS[_data1_rid(cdata)].mview
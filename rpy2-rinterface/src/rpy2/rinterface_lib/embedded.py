@@ -19,6 +19,9 @@ logger.info('Default options to initialize R: {}'.format(', '.join(_options)))
 _DEFAULT_C_STACK_LIMIT: int = -1
 _DEFAULT_R_INTERACTIVE: bool = True
 rpy2_embeddedR_isinitialized = 0x00
+# ID of the process that initialized R (child processes created with
+# fork() share R's temporary directory with it).
+_initr_pid: typing.Optional[int] = None
 
 
 class Is_RStart(Protocol):
@@ -175,8 +178,9 @@ def _setinitialized() -> None:
 
     This may result in a later segfault if used with the embedded R has not
     been initialized. You should not have to use it."""
-    global rpy2_embeddedR_isinitialized
+    global rpy2_embeddedR_isinitialized, _initr_pid
     rpy2_embeddedR_isinitialized = RPY_R_Status.INITIALIZED.value
+    _initr_pid = os.getpid()
 
 
 def isready() -> bool:
@@ -343,8 +347,11 @@ def endr(fatal: int) -> None:
         rlib.R_RunExitFinalizers()
         logger.debug('Rf_KillAllDevices()')
         rlib.Rf_KillAllDevices()
-        logger.debug('R_CleanTempDir()')
-        rlib.R_CleanTempDir()
+        if _initr_pid == os.getpid():
+            logger.debug('R_CleanTempDir()')
+            rlib.R_CleanTempDir()
+        else:
+            logger.debug('Forked process. Not cleaning R temporary directory.')
         logger.debug('R_gc')
         rlib.R_gc()
         logger.debug('Rf_endEmbeddedR(fatal)')
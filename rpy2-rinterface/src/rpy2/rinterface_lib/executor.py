@@ -0,0 +1,290 @@
+"""Executor running calls to the embedded R on a dedicated thread.
+
+The embedded R should be driven from one thread. Rather than having
+Python threads contend for R's lock, calls can be queued from any thread
+to an :class:`RExecutor` that owns the embedded R (and initializes it in
+its thread if not already done). Calls return
+:class:`concurrent.futures.Future` objects, which asyncio code can await
+without blocking its event loop::
+
+  res = await baseenv['sum'].acall(IntSexpVector([1, 2, 3]))
+
+Calls with conversions (:meth:`RExecutor.submit_call`) are pipelined:
+the arguments and the result are converted in a second thread, so that
+converting for a call overlaps with the evaluation in R of the previous
+one. Conversions creating or reading R objects still hold R's lock, and
+only the Python part of conversions runs concurrently with R.
+
+The context (:mod:`contextvars`) of the thread submitting a call, for
+example the conversion rules or the evaluation environment, is the
+context the call runs in.
+
+R checks the usage of the C stack against the stack of the thread that
+initialized it. The executor disables that check (sets `R_CStackLimit`
+to `(uintptr_t)-1`) before running its first call, as :func:`initr`
+does by default.
+"""
+
+import concurrent.futures
+import contextvars
+import logging
+import os
+import queue
+import threading
+import typing
+
+logger = logging.getLogger(__name__)
+
+
+class _WorkItem(object):
+
+    __slots__ = ('future', 'context', 'fn', 'args', 'kwargs',
+                 'prepare', 'finish')
+
+    def __init__(self, future: concurrent.futures.Future,
+                 fn: typing.Callable, args, kwargs,
+                 prepare: typing.Optional[typing.Callable] = None,
+                 finish: typing.Optional[typing.Callable] = None):
+        self.future = future
+        self.context = contextvars.copy_context()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.prepare = prepare
+        self.finish = finish
+
+    def run(self, fn: typing.Callable,
+            *args, **kwargs) -> typing.Tuple[bool, typing.Any]:
+        """Run a step in the context of the submitter.
+
+        Returns whether the step succeeded and its result. If it failed,
+        the exception is set for the future."""
+        try:
+            return (True, self.context.run(fn, *args, **kwargs))
+        except BaseException as e:
+            self.future.set_exception(e)
+            return (False, None)
+
+
+# Sentinel to stop the threads.
+_STOP = object()
+# Steps for the conversion thread.
+_PREPARE = object()
+_FINISH = object()
+
+
+class RExecutor(concurrent.futures.Executor):
+    """Executor running functions on a thread dedicated to R.
+
+    :param initr: initialize the embedded R in the R thread if it is not
+      initialized yet.
+    """
+
+    def __init__(self, initr: bool = True):
+        self._initr = initr
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._conversion_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: typing.Optional[threading.Thread] = None
+        self._conversion_thread: typing.Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    @property
+    def thread(self) -> typing.Optional[threading.Thread]:
+        """Thread running R (None until the first call is submitted)."""
+        return self._thread
+
+    def _start(self) -> None:
+        # The caller must hold self._lock.
+        if self._shutdown:
+            raise RuntimeError('Cannot submit calls after shutdown.')
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run_r, name='rpy2-R', daemon=True
+            )
+            self._thread.start()
+
+    def _start_conversion(self) -> None:
+        # The caller must hold self._lock.
+        if self._conversion_thread is None:
+            self._conversion_thread = threading.Thread(
+                target=self._run_conversion, name='rpy2-R-conversion',
+                daemon=True
+            )
+            self._conversion_thread.start()
+
+    def _run_r(self) -> None:
+        if self._initr:
+            from rpy2 import rinterface
+            try:
+                if not rinterface.embedded.isready():
+                    rinterface.initr()
+            except BaseException as e:
+                logger.error('Unable to initialize R: %s', str(e))
+                self._fail(e)
+                return
+        self._disable_c_stack_check()
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            # Calls with conversions are already running.
+            if item.finish is None and \
+               not item.future.set_running_or_notify_cancel():
+                continue
+            ok, res = item.run(item.fn, *item.args, **item.kwargs)
+            if not ok:
+                continue
+            if item.finish is None:
+                item.future.set_result(res)
+            else:
+                self._conversion_queue.put((_FINISH, item, res))
+
+    @staticmethod
+    def _disable_c_stack_check() -> None:
+        # R checks the usage of the C stack against the stack of the
+        # thread that initialized it, and calls from an other thread
+        # would be seen as stack overflows. The check is disabled (as
+        # initr() does by default).
+        from rpy2.rinterface_lib import embedded
+        from rpy2.rinterface_lib import openrlib
+        if not embedded.isready():
+            return
+        with openrlib.rlock:
+            openrlib.rlib.R_CStackLimit = openrlib.ffi.cast('uintptr_t', -1)
+
+    def _fail(self, exc: BaseException) -> None:
+        """Fail the calls submitted to the R thread, until shutdown."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            if not item.future.done():
+                item.future.set_exception(exc)
+
+    def _run_conversion(self) -> None:
+        while True:
+            task = self._conversion_queue.get()
+            if task is _STOP:
+                break
+            step, item, value = task
+            if step is _PREPARE:
+                if not item.future.set_running_or_notify_cancel():
+                    continue
+                if item.prepare is not None:
+                    ok, prepared = item.run(item.prepare,
+                                            item.args, item.kwargs)
+                    if not ok:
+                        continue
+                    item.args, item.kwargs = prepared
+                self._queue.put(item)
+            else:
+                ok, res = item.run(item.finish, value)
+                if ok:
+                    item.future.set_result(res)
+
+    def is_r_thread(self) -> bool:
+        """Is the current thread the thread running R ?"""
+        return threading.current_thread() is self._thread
+
+    def submit(self, fn, /, *args, **kwargs) -> concurrent.futures.Future:
+        """Run `fn(*args, **kwargs)` in the R thread.
+
+        Calling the `result()` of the future from the R thread itself
+        would wait forever. Functions running in the R thread should call
+        other functions directly."""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        item = _WorkItem(future, fn, args, kwargs)
+        with self._lock:
+            self._start()
+            self._queue.put(item)
+        return future
+
+    def submit_call(
+            self, fn: typing.Callable,
+            args: typing.Sequence = (),
+            kwargs: typing.Optional[typing.Mapping] = None,
+            prepare: typing.Optional[typing.Callable] = None,
+            finish: typing.Optional[typing.Callable] = None
+    ) -> concurrent.futures.Future:
+        """Run `fn(*args, **kwargs)` in the R thread, with conversions.
+
+        `prepare(args, kwargs)` returns the arguments (args, kwargs) for
+        `fn`, and `finish(res)` the result of the future. Both run in the
+        conversion thread, in the order the calls are submitted."""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        item = _WorkItem(future, fn, tuple(args), dict(kwargs or {}),
+                         prepare=prepare,
+                         finish=finish or (lambda res: res))
+        with self._lock:
+            self._start()
+            self._start_conversion()
+            self._conversion_queue.put((_PREPARE, item, None))
+        return future
+
+    def shutdown(self, wait: bool = True, *,
+                 cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                for q in (self._queue, self._conversion_queue):
+                    self._cancel_pending(q)
+            if self._thread is not None:
+                self._queue.put(_STOP)
+            if self._conversion_thread is not None:
+                self._conversion_queue.put(_STOP)
+        if wait:
+            for thread in (self._thread, self._conversion_thread):
+                if thread is not None and \
+                   thread is not threading.current_thread():
+                    thread.join()
+
+    @staticmethod
+    def _cancel_pending(q: queue.SimpleQueue) -> None:
+        pending = []
+        while True:
+            try:
+                task = q.get_nowait()
+            except queue.Empty:
+                break
+            item = task[1] if isinstance(task, tuple) else task
+            if item is not _STOP and item.future.cancel():
+                continue
+            pending.append(task)
+        for task in pending:
+            q.put(task)
+
+
+_executor: typing.Optional[RExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> RExecutor:
+    """Get the executor for R used by `acall()` and `submit()` methods.
+
+    It is created the first time this function is called."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = RExecutor()
+        return _executor
+
+
+def set_executor(executor: typing.Optional[RExecutor]) -> None:
+    """Set the executor for R used by `acall()` and `submit()` methods.
+
+    With None, a new executor is created the next time one is needed."""
+    global _executor
+    with _executor_lock:
+        _executor = executor
+
+
+def _after_fork_in_child() -> None:
+    # The threads of the executor do not exist in a child process.
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
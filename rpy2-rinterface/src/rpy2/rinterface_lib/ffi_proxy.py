@@ -126,3 +126,57 @@ _handler_def: SignatureDefinition = SignatureDefinition(
 _exec_findvar_in_frame_def: SignatureDefinition = SignatureDefinition(
     '_exec_findvar_in_frame',
     'void', ('void *data', ))
+
+# ALTREP class methods for R vectors backed by Python buffers.
+_altrep_length_def: SignatureDefinition = SignatureDefinition(
+    '_altrep_length',
+    'R_xlen_t', ('SEXP', ))
+
+_altrep_duplicate_def: SignatureDefinition = SignatureDefinition(
+    '_altrep_duplicate',
+    'SEXP', ('SEXP', 'Rboolean'))
+
+_altrep_dataptr_def: SignatureDefinition = SignatureDefinition(
+    '_altrep_dataptr',
+    'void *', ('SEXP', 'Rboolean'))
+
+_altrep_dataptr_or_null_def: SignatureDefinition = SignatureDefinition(
+    '_altrep_dataptr_or_null',
+    'const void *', ('SEXP', ))
+
+_altrep_integer_elt_def: SignatureDefinition = SignatureDefinition(
+    '_altrep_integer_elt',
+    'int', ('SEXP', 'R_xlen_t'))
+
+_altrep_real_elt_def: SignatureDefinition = SignatureDefinition(
+    '_altrep_real_elt',
+    'double', ('SEXP', 'R_xlen_t'))
+
+_altrep_finalizer_def: SignatureDefinition = SignatureDefinition(
+    '_altrep_finalizer',
+    'void', ('SEXP', ))
+
+# Serialization of R objects to, and from, Python streams.
+_serialize_exec_def: SignatureDefinition = SignatureDefinition(
+    '_serialize_exec',
+    'void', ('void *data', ))
+
+_unserialize_exec_def: SignatureDefinition = SignatureDefinition(
+    '_unserialize_exec',
+    'void', ('void *data', ))
+
+_outchar_def: SignatureDefinition = SignatureDefinition(
+    '_outchar',
+    'void', ('R_outpstream_t', 'int'))
+
+_outbytes_def: SignatureDefinition = SignatureDefinition(
+    '_outbytes',
+    'void', ('R_outpstream_t', 'void *', 'int'))
+
+_inchar_def: SignatureDefinition = SignatureDefinition(
+    '_inchar',
+    'int', ('R_inpstream_t', ))
+
+_inbytes_def: SignatureDefinition = SignatureDefinition(
+    '_inbytes',
+    'void', ('R_inpstream_t', 'void *', 'int'))
@@ -1,6 +1,8 @@
 """Interface to and utilities for R's memory management."""
 
+import collections
 import contextlib
+import time
 import typing
 from . import openrlib
 from _cffi_backend import FFI  # type: ignore
@@ -44,10 +46,114 @@ class ProtectionTracker(object):
         self._counter = 0
 
 
+class ReleaseQueueMetrics(typing.NamedTuple):
+    """Metrics for a :class:`ReleaseQueue`."""
+    depth: int
+    max_depth: int
+    drains: int
+    released: int
+    drain_time: float
+    last_drain_time: float
+
+
+class ReleaseQueue(object):
+    """Releases of R objects deferred to safe points.
+
+    When enabled, Python objects mapping R objects (capsules) do not
+    release the R object when they are finalized, which can happen in
+    any thread running Python's garbage collection. They add the R
+    object to the queue instead, and the queue is drained (the R objects
+    are released) in batches holding R's lock once:
+
+    - before evaluations in R (when entering :func:`rmemory`),
+    - when the queue reaches `threshold` R objects and R's lock is
+      not held by an other thread,
+    - when calling :func:`flush_releases`.
+    """
+
+    def __init__(self, threshold: int = 10000) -> None:
+        self.enabled = False
+        self.threshold = threshold
+        # Function releasing an R object (set by _rinterface_capi).
+        self.release: typing.Optional[
+            typing.Callable[[FFI.CData], None]
+        ] = None
+        self._queue: typing.Deque[FFI.CData] = collections.deque()
+        self._max_depth = 0
+        self._drains = 0
+        self._released = 0
+        self._drain_time = 0.0
+        self._last_drain_time = 0.0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def enqueue(self, cdata: FFI.CData) -> None:
+        """Add an R object to release."""
+        queue = self._queue
+        queue.append(cdata)
+        depth = len(queue)
+        if depth > self._max_depth:
+            self._max_depth = depth
+        if depth >= self.threshold:
+            self.drain(blocking=False)
+
+    def drain(self, blocking: bool = True) -> int:
+        """Release the R objects in the queue.
+
+        If not blocking and R's lock is held by an other thread, the
+        queue is not drained. Returns the number of R objects released."""
+        release = self.release
+        if release is None:
+            # The function is set when rpy2.rinterface is imported, before
+            # any R object can be enqueued.
+            return 0
+        if not openrlib.rlock.acquire(blocking=blocking):
+            return 0
+        try:
+            t0 = time.perf_counter()
+            queue = self._queue
+            n = 0
+            while queue:
+                release(queue.popleft())
+                n += 1
+            t = time.perf_counter() - t0
+        finally:
+            openrlib.rlock.release()
+        self._drains += 1
+        self._released += n
+        self._drain_time += t
+        self._last_drain_time = t
+        return n
+
+    def metrics(self) -> ReleaseQueueMetrics:
+        """Depth of the queue (current and maximum), number of drains,
+        number of R objects released, and time spent draining (total and
+        last drain, in seconds)."""
+        return ReleaseQueueMetrics(
+            len(self._queue), self._max_depth, self._drains,
+            self._released, self._drain_time, self._last_drain_time
+        )
+
+
+# Deferred releases of R objects (disabled by default).
+release_queue = ReleaseQueue()
+
+
+def flush_releases() -> int:
+    """Release the R objects with a deferred release.
+
+    Returns the number of R objects released. See :class:`ReleaseQueue`.
+    """
+    return release_queue.drain()
+
+
 @contextlib.contextmanager
 def rmemory() -> typing.Iterator[ProtectionTracker]:
     pt = ProtectionTracker()
     with openrlib.rlock:
+        if release_queue._queue:
+            release_queue.drain()
         try:
             yield pt
         finally:
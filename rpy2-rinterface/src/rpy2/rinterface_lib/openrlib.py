@@ -26,17 +26,31 @@ ffi = _rinterface_cffi.ffi
 
 # TODO: Separate the functions in the module from the side-effect of
 # finding R_HOME and opening the shared library.
-R_HOME = rpy2.situation.get_r_home()
+# The situation is cached across processes (finding it runs R).
+_situation = rpy2.situation.get_situation()
+R_HOME = _situation.r_home
 if os.name != 'nt':
     # not relevant for Windows? (https://stackoverflow.com/questions/72575015)
-    LD_LIBRARY_PATH = (
-        rpy2.situation.r_ld_library_path_from_subprocess(R_HOME)
-        if R_HOME is not None
-        else '')
+    LD_LIBRARY_PATH = _situation.ld_library_path
 lock = threading.Lock()
 rlock = threading.RLock()
 
 
+def _after_fork_in_child() -> None:
+    # Only the thread that called fork() exists in the child process, and
+    # locks held by other threads at the time would never be released.
+    # Forking does not wait for R: a process forking while an other
+    # thread is evaluating R code gets a copy of R in that state (the
+    # fork server forks from a process without other threads).
+    global lock, rlock
+    lock = threading.Lock()
+    rlock = threading.RLock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
 def _dlopen_rlib(r_home: typing.Optional[str]):
     """Open R's shared C library.
 
@@ -69,6 +83,9 @@ def _get_symbol_or_fallback(symbol: str, fallback: typing.Any):
 
 
 DATAPTR = rlib.DATAPTR
+# NULL for ALTREP vectors without their data in memory (for example
+# compact sequences), rather than expanding them in memory.
+DATAPTR_OR_NULL = rlib.DATAPTR_OR_NULL
 
 
 def _LOGICAL(x):
@@ -78,6 +95,10 @@ def _LOGICAL(x):
 LOGICAL = rlib.LOGICAL
 
 
+def LOGICAL_OR_NULL(x):
+    return ffi.cast('int *', DATAPTR_OR_NULL(x))
+
+
 def _INTEGER(x):
     return ffi.cast('int *', DATAPTR(x))
 
@@ -85,6 +106,10 @@ def _INTEGER(x):
 INTEGER = rlib.INTEGER
 
 
+def INTEGER_OR_NULL(x):
+    return ffi.cast('int *', DATAPTR_OR_NULL(x))
+
+
 def _RAW(x):
     return ffi.cast('Rbyte *', DATAPTR(x))
 
@@ -92,6 +117,10 @@ def _RAW(x):
 RAW = rlib.RAW
 
 
+def RAW_OR_NULL(x):
+    return ffi.cast('Rbyte *', DATAPTR_OR_NULL(x))
+
+
 def _REAL(robj):
     return ffi.cast('double *', DATAPTR(robj))
 
@@ -99,6 +128,10 @@ def _REAL(robj):
 REAL = rlib.REAL
 
 
+def REAL_OR_NULL(x):
+    return ffi.cast('double *', DATAPTR_OR_NULL(x))
+
+
 def _COMPLEX(robj):
     return ffi.cast('Rcomplex *', DATAPTR(robj))
 
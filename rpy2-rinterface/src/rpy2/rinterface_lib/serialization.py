@@ -0,0 +1,440 @@
+"""Serialization of R objects to, and from, Python streams.
+
+R's serialization (the one used by R's functions `serialize()` and
+`saveRDS()`) writes to, and reads from, "persistent streams" defined by
+callbacks. The callbacks defined here write the serialized R object
+directly to a Python file-like object, and read it back from one. There
+is no intermediate R raw vector or Python `bytes` with the complete
+serialization, which would otherwise double or triple the memory needed.
+R writes small pieces at a time (for example the length and the bytes of
+each string in a character vector), so the writes are accumulated in a
+buffer of :data:`WRITE_BUFFER_SIZE` bytes before reaching the file object.
+
+The stream can optionally be compressed (see :data:`COMPRESSIONS`).
+
+Pickling R objects with protocol 5 or higher (see :pep:`574`)
+uses out-of-band buffers (:class:`pickle.PickleBuffer`) for the
+serialized R object. The buffers can be transmitted without copy by
+libraries that support them (for example Dask, or :mod:`multiprocessing`
+with shared memory).
+"""
+
+import bz2
+import gzip
+import io
+import logging
+import lzma
+import pickle
+import typing
+from rpy2.rinterface_lib import altrep
+from rpy2.rinterface_lib import embedded
+from rpy2.rinterface_lib import ffi_proxy
+from rpy2.rinterface_lib import memorymanagement
+from rpy2.rinterface_lib import openrlib
+import rpy2.rinterface_lib._rinterface_capi as _rinterface
+
+from _cffi_backend import FFI  # type: ignore
+
+
+logger = logging.getLogger(__name__)
+
+ffi = openrlib.ffi
+
+# Version of R's serialization format (version 3 requires R >= 3.5).
+SERIALIZATION_VERSION = 3
+
+# Size of the buffer accumulating R's writes when serializing.
+WRITE_BUFFER_SIZE = 2 ** 16
+
+# Size of the buffers with the serialized R object when pickling.
+PICKLE_CHUNK_SIZE = 2 ** 26
+
+# Compression used for the serialized R objects when pickling. None
+# for no compression, or a key in COMPRESSIONS.
+pickle_compression: typing.Optional[str] = None
+
+
+def _zstd_writer(fileobj):
+    import zstandard  # type: ignore
+    return zstandard.ZstdCompressor().stream_writer(fileobj, closefd=False)
+
+
+def _zstd_reader(fileobj):
+    import zstandard  # type: ignore
+    return zstandard.ZstdDecompressor().stream_reader(fileobj, closefd=False)
+
+
+def _lz4_writer(fileobj):
+    import lz4.frame  # type: ignore
+    return lz4.frame.LZ4FrameFile(fileobj, mode='wb')
+
+
+def _lz4_reader(fileobj):
+    import lz4.frame  # type: ignore
+    return lz4.frame.LZ4FrameFile(fileobj, mode='rb')
+
+
+# Compressions available for serialized R objects. Values are pairs of
+# functions wrapping a binary file object into a file object writing
+# (resp. reading) compressed data. Closing the wrapping file objects does
+# not close the wrapped ones. The compressions "zstd" and "lz4" require
+# the Python packages zstandard and lz4 respectively.
+COMPRESSIONS: typing.Dict[str, typing.Tuple[typing.Callable,
+                                            typing.Callable]] = {
+    'gzip': (lambda f: gzip.GzipFile(fileobj=f, mode='wb'),
+             lambda f: gzip.GzipFile(fileobj=f, mode='rb')),
+    'bz2': (lambda f: bz2.BZ2File(f, mode='wb'),
+            lambda f: bz2.BZ2File(f, mode='rb')),
+    'xz': (lambda f: lzma.LZMAFile(f, mode='wb'),
+           lambda f: lzma.LZMAFile(f, mode='rb')),
+    'zstd': (_zstd_writer, _zstd_reader),
+    'lz4': (_lz4_writer, _lz4_reader),
+}
+
+
+def _compression(
+        name: str
+) -> typing.Tuple[typing.Callable, typing.Callable]:
+    try:
+        return COMPRESSIONS[name]
+    except KeyError:
+        raise ValueError(
+            f'Unknown compression "{name}". The compression must be one '
+            f'of {tuple(COMPRESSIONS.keys())}.'
+        )
+
+
+class _Stream:
+    """State of a stream R writes to, or reads from."""
+
+    __slots__ = ('fileobj', 'cdata', 'error', 'buffer', 'n_buffered')
+
+    def __init__(self, fileobj, cdata=None, buffer_size: int = 0):
+        self.fileobj = fileobj
+        # The R object to serialize, or the unserialized R object.
+        self.cdata = cdata
+        # Exception raised by the Python file object. R cannot be
+        # interrupted from the callbacks, so the exception is raised
+        # once R returns.
+        self.error: typing.Optional[Exception] = None
+        # Bytes written by R and not yet written to the file object.
+        self.buffer = memoryview(bytearray(buffer_size))
+        self.n_buffered = 0
+
+    def write(self, buf: FFI.CData, n: int) -> None:
+        if self.n_buffered + n > len(self.buffer):
+            self.flush()
+            if n >= len(self.buffer):
+                self.fileobj.write(ffi.buffer(buf, n))
+                return
+        ffi.memmove(self.buffer[self.n_buffered:], buf, n)
+        self.n_buffered += n
+
+    def flush(self) -> None:
+        if self.n_buffered:
+            self.fileobj.write(self.buffer[:self.n_buffered])
+            self.n_buffered = 0
+
+
+@ffi_proxy.callback(ffi_proxy._outchar_def,
+                    openrlib._rinterface_cffi)
+def _outchar(stream: FFI.CData, c: int) -> None:
+    state = ffi.from_handle(stream.data)
+    if state.error is not None:
+        return
+    try:
+        if state.n_buffered == len(state.buffer):
+            state.flush()
+        state.buffer[state.n_buffered] = c
+        state.n_buffered += 1
+    except Exception as e:
+        state.error = e
+
+
+@ffi_proxy.callback(ffi_proxy._outbytes_def,
+                    openrlib._rinterface_cffi)
+def _outbytes(stream: FFI.CData, buf: FFI.CData, n: int) -> None:
+    state = ffi.from_handle(stream.data)
+    if state.error is not None:
+        return
+    try:
+        state.write(buf, n)
+    except Exception as e:
+        state.error = e
+
+
+def _readinto(fileobj, mview: memoryview) -> int:
+    """Read into the memoryview until it is full or the stream ends."""
+    n = 0
+    while n < len(mview):
+        if hasattr(fileobj, 'readinto'):
+            n_read = fileobj.readinto(mview[n:])
+        else:
+            data = fileobj.read(len(mview) - n)
+            n_read = len(data)
+            mview[n:(n + n_read)] = data
+        if not n_read:
+            break
+        n += n_read
+    return n
+
+
+@ffi_proxy.callback(ffi_proxy._inchar_def,
+                    openrlib._rinterface_cffi)
+def _inchar(stream: FFI.CData) -> int:
+    state = ffi.from_handle(stream.data)
+    if state.error is not None:
+        return -1
+    try:
+        data = state.fileobj.read(1)
+        if not data:
+            raise EOFError('End of stream reached while unserializing.')
+        return data[0]
+    except Exception as e:
+        state.error = e
+        return -1
+
+
+@ffi_proxy.callback(ffi_proxy._inbytes_def,
+                    openrlib._rinterface_cffi)
+def _inbytes(stream: FFI.CData, buf: FFI.CData, n: int) -> None:
+    state = ffi.from_handle(stream.data)
+    mview = memoryview(ffi.buffer(buf, n))
+    if state.error is None:
+        try:
+            n_read = _readinto(state.fileobj, mview)
+            if n_read < n:
+                raise EOFError('End of stream reached while unserializing.')
+            return
+        except Exception as e:
+            state.error = e
+    # R cannot be interrupted from here. Zeros are what R reads from
+    # now on, which quickly ends the unserialization.
+    ffi.memmove(buf, bytes(n), n)
+
+
+@ffi_proxy.callback(ffi_proxy._serialize_exec_def,
+                    openrlib._rinterface_cffi)
+def _serialize_exec(data: FFI.CData) -> None:
+    state, stream = ffi.from_handle(data)
+    openrlib.rlib.R_Serialize(state.cdata, stream)
+
+
+@ffi_proxy.callback(ffi_proxy._unserialize_exec_def,
+                    openrlib._rinterface_cffi)
+def _unserialize_exec(data: FFI.CData) -> None:
+    state, stream = ffi.from_handle(data)
+    state.cdata = openrlib.rlib.R_Unserialize(stream)
+
+
+def _dump_cdata(cdata: FFI.CData, fileobj, xdr: bool = True) -> None:
+    rlib = openrlib.rlib
+    state = _Stream(fileobj, cdata, buffer_size=WRITE_BUFFER_SIZE)
+    state_handle = ffi.new_handle(state)
+    stream = ffi.new('struct R_outpstream_st *')
+    rlib.R_InitOutPStream(
+        stream, state_handle,
+        rlib.R_pstream_xdr_format if xdr else rlib.R_pstream_binary_format,
+        SERIALIZATION_VERSION,
+        altrep._c_callback('_outchar', _outchar),
+        altrep._c_callback('_outbytes', _outbytes),
+        ffi.NULL, rlib.R_NilValue
+    )
+    exec_handle = ffi.new_handle((state, stream))
+    with memorymanagement.rmemory():
+        ok = rlib.R_ToplevelExec(
+            altrep._c_callback('_serialize_exec', _serialize_exec),
+            exec_handle
+        )
+    if state.error is not None:
+        raise state.error
+    if ok != rlib.TRUE:
+        raise embedded.RRuntimeError(
+            'Error while serializing the R object: %s' %
+            _rinterface._geterrmessage()
+        )
+    state.flush()
+
+
+def _load_cdata(fileobj) -> FFI.CData:
+    """Unserialize an R object from a file object.
+
+    The R object returned is *not* protected from R's garbage
+    collection."""
+    rlib = openrlib.rlib
+    state = _Stream(fileobj)
+    state_handle = ffi.new_handle(state)
+    stream = ffi.new('struct R_inpstream_st *')
+    rlib.R_InitInPStream(
+        stream, state_handle,
+        rlib.R_pstream_any_format,
+        altrep._c_callback('_inchar', _inchar),
+        altrep._c_callback('_inbytes', _inbytes),
+        ffi.NULL, rlib.R_NilValue
+    )
+    exec_handle = ffi.new_handle((state, stream))
+    with memorymanagement.rmemory():
+        ok = rlib.R_ToplevelExec(
+            altrep._c_callback('_unserialize_exec', _unserialize_exec),
+            exec_handle
+        )
+    if state.error is not None:
+        raise state.error
+    if ok != rlib.TRUE:
+        raise embedded.RRuntimeError(
+            'Error while unserializing an R object: %s' %
+            _rinterface._geterrmessage()
+        )
+    return state.cdata
+
+
+def dump(obj, fileobj, compression: typing.Optional[str] = None,
+         xdr: bool = True) -> None:
+    """Serialize an R object to a binary file object.
+
+    Args:
+    - obj: an R object (an rpy2 object with a `__sexp__` attribute).
+    - fileobj: a Python file object open for writing bytes (only its
+      method `write()` is used).
+    - compression: None, or the name of a compression in
+      :data:`COMPRESSIONS`.
+    - xdr: use R's portable XDR format (big-endian), like R's
+      `serialize()` does by default. Otherwise the native binary format
+      is used. It is faster to write and read but can only be read on
+      platforms with the same endianness.
+    """
+    if compression is None:
+        _dump_cdata(obj.__sexp__._cdata, fileobj, xdr=xdr)
+    else:
+        writer = _compression(compression)[0](fileobj)
+        try:
+            _dump_cdata(obj.__sexp__._cdata, writer, xdr=xdr)
+        finally:
+            writer.close()
+
+
+def load(fileobj, compression: typing.Optional[str] = None
+         ) -> _rinterface.SexpCapsule:
+    """Unserialize an R object from a binary file object.
+
+    The serialization can be the one from :func:`dump`, or from R's
+    function `serialize()`. The format (XDR or binary) is detected.
+
+    Args:
+    - fileobj: a Python file object open for reading bytes.
+    - compression: None, or the name of the compression in
+      :data:`COMPRESSIONS` used when dumping the object.
+    Returns:
+    A capsule for the R object (to build an rpy2 object from).
+    """
+    if compression is not None:
+        fileobj = _compression(compression)[1](fileobj)
+    with memorymanagement.rmemory() as rmemory:
+        cdata = rmemory.protect(_load_cdata(fileobj))
+        res = _rinterface.SexpCapsule(cdata)
+    return res
+
+
+def dumps(obj, compression: typing.Optional[str] = None,
+          xdr: bool = True) -> bytes:
+    """Serialize an R object to bytes. See :func:`dump`."""
+    fileobj = io.BytesIO()
+    dump(obj, fileobj, compression=compression, xdr=xdr)
+    return fileobj.getvalue()
+
+
+def loads(data, compression: typing.Optional[str] = None
+          ) -> _rinterface.SexpCapsule:
+    """Unserialize an R object from an object with the buffer
+    protocol (for example :class:`bytes`). See :func:`load`."""
+    return load(_ChunksReader((data, )), compression=compression)
+
+
+class _ChunksWriter(io.RawIOBase):
+    """Binary file object writing into a sequence of bytearrays.
+
+    Each bytearray has at most `chunk_size` bytes."""
+
+    def __init__(self, chunk_size: int = PICKLE_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.chunks: typing.List[bytearray] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        mview = memoryview(data).cast('B')
+        n = len(mview)
+        i = 0
+        while i < n:
+            if not self.chunks or len(self.chunks[-1]) == self.chunk_size:
+                self.chunks.append(bytearray())
+            chunk = self.chunks[-1]
+            j = min(n, i + self.chunk_size - len(chunk))
+            chunk += mview[i:j]
+            i = j
+        return n
+
+
+class _ChunksReader(io.RawIOBase):
+    """Binary file object reading from a sequence of buffers."""
+
+    def __init__(self, chunks: typing.Iterable):
+        self._chunks = iter(chunks)
+        self._current = memoryview(b'')
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while self._pos == len(self._current):
+            try:
+                self._current = memoryview(next(self._chunks)).cast('B')
+            except StopIteration:
+                return 0
+            self._pos = 0
+        mview = memoryview(b).cast('B')
+        n = min(len(mview), len(self._current) - self._pos)
+        mview[:n] = self._current[self._pos:(self._pos + n)]
+        self._pos += n
+        return n
+
+
+def _unpickle(compression: typing.Optional[str], *chunks
+              ) -> _rinterface.SexpCapsule:
+    return load(_ChunksReader(chunks), compression=compression)
+
+
+class PickledSexp:
+    """The state of a pickled R object.
+
+    The R object is serialized when pickled rather than when the state
+    is created. With pickle protocol 5 or higher, the serialization
+    is in out-of-band buffers (:class:`pickle.PickleBuffer`) of at most
+    :data:`PICKLE_CHUNK_SIZE` bytes."""
+
+    __slots__ = ('capsule', )
+
+    def __init__(self, capsule: _rinterface.CapsuleBase):
+        self.capsule = capsule
+
+    @property
+    def __sexp__(self) -> _rinterface.CapsuleBase:
+        return self.capsule
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            writer = _ChunksWriter()
+            dump(self, writer, compression=pickle_compression)
+            return (
+                _unpickle,
+                (pickle_compression,
+                 *(pickle.PickleBuffer(x) for x in writer.chunks))
+            )
+        else:
+            return (
+                loads,
+                (dumps(self, compression=pickle_compression),
+                 pickle_compression)
+            )
@@ -1,11 +1,15 @@
 """Base definitions for R objects."""
 
 import abc
+import array
 import collections.abc
 from collections import OrderedDict
 import enum
 import itertools
+import operator
+import sys
 import typing
+from rpy2.rinterface_lib import altrep
 from rpy2.rinterface_lib import embedded
 from rpy2.rinterface_lib import memorymanagement
 from rpy2.rinterface_lib import openrlib
@@ -15,6 +19,8 @@ from rpy2.rinterface_lib._rinterface_capi import SupportsSEXP
 from rpy2.rinterface_lib import conversion
 from rpy2.rinterface_lib.conversion import _cdata_res_to_rinterface
 from rpy2.rinterface_lib import na_values
+from rpy2.rinterface_lib import serialization
+from rpy2.rinterface_lib import strings
 
 
 class Singleton(type):
@@ -130,19 +136,22 @@ class Sexp(SupportsSEXP):
             _rinterface.get_rid(self.__sexp__._cdata)
         ]
 
-    def __getstate__(self) -> bytes:
-        with memorymanagement.rmemory() as rmemory:
-            ser = rmemory.protect(
-                _rinterface.serialize(
-                    self.__sexp__._cdata,
-                    globalenv.__sexp__._cdata)
-            )
-            n = openrlib.rlib.Rf_xlength(ser)
-            res = bytes(_rinterface.ffi.buffer(openrlib.rlib.RAW(ser), n))
-        return res
+    def __getstate__(self) -> 'serialization.PickledSexp':
+        # The R object is serialized when the state is pickled (see
+        # rpy2.rinterface_lib.serialization).
+        return serialization.PickledSexp(self.__sexp__)
 
-    def __setstate__(self, state: bytes) -> None:
-        self._sexpobject = unserialize(state)
+    def __setstate__(
+            self,
+            state: typing.Union['_rinterface.SexpCapsule',
+                                'serialization.PickledSexp',
+                                bytes]
+    ) -> None:
+        if isinstance(state, _rinterface.SexpCapsule):
+            # Unpickled state.
+            self._sexpobject = state
+        else:
+            self._sexpobject = unserialize(state)
 
     @property
     def rclass(self) -> 'StrSexpVector':
@@ -520,6 +529,238 @@ def _populate_r_vector(iterable, r_vector, set_elt, cast_value) -> None:
         set_elt(r_vector, i, cast_value(v))
 
 
+# Type codes (as in the module `array`) for the C arrays in R atomic
+# vectors that can be populated in bulk.
+_BULK_TYPECODES = {
+    openrlib.rlib.LGLSXP: 'i',
+    openrlib.rlib.INTSXP: 'i',
+    openrlib.rlib.REALSXP: 'd'
+}
+
+
+def _bulk_values_array(iterable, rtype: int):
+    """Values in a Python sequence as an array.array for an R vector type.
+
+    This only requires Python's standard library. None is returned if
+    the values cannot be mapped to the C type for the R vector without
+    a per-element conversion."""
+    typecode = _BULK_TYPECODES[rtype]
+    source: typing.Union[list, tuple, range, memoryview]
+    if isinstance(iterable, (list, tuple, range)):
+        source = iterable
+    else:
+        try:
+            mview = memoryview(iterable)
+        except TypeError:
+            return None
+        if mview.ndim != 1:
+            return None
+        source = mview
+    try:
+        values = array.array(typecode, source)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if rtype == openrlib.rlib.LGLSXP:
+        # R logical vectors can only contain FALSE (0), TRUE (1), or NA.
+        if not set(values).issubset((0, 1, openrlib.rlib.R_NaInt)):
+            return None
+    return values
+
+
+def _bulk_values_numpy(numpy, iterable, rtype: int, na_aware: bool):
+    """Values and NA mask from a numpy (or pandas) array for an R vector type.
+
+    Returns a tuple (values, mask) with values a contiguous numpy array
+    with the C type for the R vector, and mask either None or a boolean
+    array flagging NA values. None is returned if the conversion is not
+    possible without a per-element conversion."""
+    mask = None
+    if isinstance(iterable, numpy.ma.MaskedArray):
+        mask = numpy.ma.getmaskarray(iterable)
+        values = numpy.ma.getdata(iterable)
+    elif hasattr(iterable, 'isna') and hasattr(iterable, 'to_numpy'):
+        # pandas Series, Index, or extension arrays.
+        dtype = iterable.dtype
+        if isinstance(dtype, numpy.dtype) and dtype.kind != 'O':
+            values = iterable.to_numpy()
+            if na_aware and dtype.kind == 'f':
+                mask = numpy.isnan(values)
+        elif isinstance(dtype, numpy.dtype):
+            if not na_aware:
+                return None
+            mask = numpy.asarray(iterable.isna(), dtype=bool)
+            values = numpy.where(mask, 0, iterable.to_numpy())
+            try:
+                values = values.astype(
+                    'float64' if rtype == openrlib.rlib.REALSXP else 'int64'
+                )
+            except (TypeError, ValueError, OverflowError):
+                return None
+        else:
+            # Extension arrays (nullable integers, booleans, or floats).
+            mask = numpy.asarray(iterable.isna(), dtype=bool)
+            filler: typing.Union[bool, int, float]
+            if dtype.kind == 'b':
+                filler_dtype, filler = 'bool', False
+            elif dtype.kind in 'iu':
+                filler_dtype, filler = 'int64', 0
+            elif dtype.kind == 'f':
+                filler_dtype, filler = 'float64', 0.0
+            else:
+                return None
+            values = iterable.to_numpy(dtype=filler_dtype, na_value=filler)
+    else:
+        values = numpy.asarray(iterable)
+    if values.ndim != 1:
+        return None
+
+    kind = values.dtype.kind
+    if rtype == openrlib.rlib.REALSXP:
+        if kind not in 'biuf':
+            return None
+        if na_aware and kind == 'f':
+            mask = (numpy.isnan(values) if mask is None
+                    else (mask | numpy.isnan(values)))
+        values = values.astype('float64', copy=False)
+    elif rtype == openrlib.rlib.INTSXP:
+        if kind == 'f':
+            nan_mask = numpy.isnan(values)
+            mask = nan_mask if mask is None else (mask | nan_mask)
+        elif kind not in 'biu':
+            return None
+        if kind != 'b':
+            iinfo = numpy.iinfo('int32')
+            defined = values if mask is None else values[~mask]
+            if len(defined) and (
+                    not numpy.all(numpy.isfinite(defined))
+                    or defined.min() < iinfo.min
+                    or defined.max() > iinfo.max
+            ):
+                return None
+            if kind == 'f':
+                values = numpy.where(mask, 0, values)
+        values = values.astype('int32', copy=False)
+    elif rtype == openrlib.rlib.LGLSXP:
+        if kind in 'iuf':
+            na_mask = values == openrlib.rlib.R_NaInt
+            mask = na_mask if mask is None else (mask | na_mask)
+            values = values != 0
+        elif kind != 'b':
+            return None
+        values = values.astype('int32')
+    else:
+        return None
+    return numpy.ascontiguousarray(values), mask
+
+
+def _bulk_populate_r_vector(iterable, r_vector,
+                            na_aware: bool = False) -> bool:
+    """Populate an R atomic vector in bulk.
+
+    The values are copied into the R vector with a single memmove,
+    followed by a vectorized write of NA values when the Python
+    object has missing values (numpy masked arrays, pandas nullable
+    arrays, or any NA-like value when na_aware is True).
+
+    :param iterable: A Python sequence with as many elements as the R vector.
+    :param r_vector: The R vector (cffi pointer) to populate.
+    :param na_aware: Map Python missing values (None, pandas.NA, float NaN)
+      to R NAs.
+    :return: True if the vector was populated, False if the caller
+      should fall back to a per-element population."""
+    rtype = _rinterface._TYPEOF(r_vector)
+    if rtype not in _BULK_TYPECODES:
+        return False
+    n = openrlib.rlib.Rf_xlength(r_vector)
+    if n == 0:
+        return True
+    mask = None
+    # numpy is an optional dependency. If the object to convert is a
+    # numpy or pandas array the module is necessarily already imported.
+    numpy = sys.modules.get('numpy')
+    if (
+            numpy is not None
+            and
+            not isinstance(iterable, (list, tuple, range, array.array))
+            and
+            hasattr(iterable, '__array__')
+    ):
+        _ = _bulk_values_numpy(numpy, iterable, rtype, na_aware)
+        if _ is None:
+            return False
+        values, mask = _
+    else:
+        values = _bulk_values_array(iterable, rtype)
+        if values is None:
+            return False
+    if len(values) != n:
+        return False
+    dest_ptr = openrlib.DATAPTR(r_vector)
+    nbytes = n * values.itemsize
+    _rinterface.ffi.memmove(dest_ptr, _rinterface.ffi.from_buffer(values),
+                            nbytes)
+    if mask is not None and mask.any():
+        # A mask is only obtained from numpy (or pandas) arrays.
+        assert numpy is not None
+        dest = numpy.frombuffer(_rinterface.ffi.buffer(dest_ptr, nbytes),
+                                dtype=values.dtype)
+        dest[mask] = (openrlib.rlib.R_NaReal
+                      if rtype == openrlib.rlib.REALSXP
+                      else openrlib.rlib.R_NaInt)
+    return True
+
+
+def _populate_r_vector_bulk(iterable, r_vector, set_elt, cast_value,
+                            fallback=_populate_r_vector,
+                            na_aware: bool = False) -> None:
+    """Populate an R vector in bulk when possible, or element-wise.
+
+    This has the signature expected for `populate_func` in
+    :meth:`SexpVectorAbstract.from_iterable`, with additional
+    optional parameters for the function to fall back to when a bulk
+    population is not possible, and whether Python missing values
+    should be mapped to R NAs (see :func:`_bulk_populate_r_vector`)."""
+    if not _bulk_populate_r_vector(iterable, r_vector, na_aware=na_aware):
+        fallback(iterable, r_vector, set_elt, cast_value)
+
+
+def _c_indices(indices, size: int) -> typing.Sequence[int]:
+    """Compute C indices for a collection of Python-style indices.
+
+    The indices can be a range, a slice, a numpy array of integers,
+    or an iterable of integers. Negative indices are relative to the
+    end of the vector, as with Python sequences. A range of valid
+    indices is returned as it is.
+
+    Raises an exception IndexError if an index is out of bounds."""
+    if isinstance(indices, slice):
+        return range(*indices.indices(size))
+    if isinstance(indices, range):
+        if len(indices) == 0:
+            return indices
+        first, last = indices[0], indices[-1]
+        if min(first, last) >= 0 and max(first, last) < size:
+            return indices
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and isinstance(indices, numpy.ndarray):
+        if indices.dtype.kind not in 'iu':
+            raise TypeError(
+                'Indices must be integers, not %s' % indices.dtype)
+        indices = numpy.where(indices < 0, indices + size, indices).ravel()
+        if indices.size and (indices.min() < 0 or indices.max() >= size):
+            raise IndexError('index out of range')
+        return indices.tolist()
+    res = []
+    for i in indices:
+        i = operator.index(i)
+        if i < 0:
+            i = size + i
+        if i >= size or i < 0:
+            raise IndexError('index out of range')
+        res.append(i)
+    return res
+
+
 class SexpVectorAbstract(SupportsSEXP, typing.Generic[VT],
                          metaclass=abc.ABCMeta):
 
@@ -559,11 +800,19 @@ class SexpVectorAbstract(SupportsSEXP, typing.Generic[VT],
                       populate_func=None,
                       set_elt=None,
                       cast_value=None) -> VT:
-        """Create an R vector/array from an iterable."""
+        """Create an R vector/array from an iterable.
+
+        Unless a custom `populate_func` or `cast_value` is specified,
+        R vectors of booleans, integers, or floats are populated in bulk
+        when the iterable allows it (lists, tuples, buffer-protocol
+        objects, numpy or pandas arrays)."""
         if not embedded.isready():
             raise embedded.RNotReadyError('Embedded R is not ready to use.')
         if populate_func is None:
-            populate_func = _populate_r_vector
+            if cast_value is None:
+                populate_func = _populate_r_vector_bulk
+            else:
+                populate_func = _populate_r_vector
         if set_elt is None:
             set_elt = cls._R_SET_VECTOR_ELT
         if cast_value is None:
@@ -600,19 +849,30 @@ class SexpVectorAbstract(SupportsSEXP, typing.Generic[VT],
 
     @classmethod
     @_cdata_res_to_rinterface
-    def from_memoryview(cls, mview: memoryview) -> VT:
+    def from_memoryview(cls, mview: memoryview, copy: bool = True) -> VT:
         """Create an R vector/array from a memoryview.
 
         The memoryview must be contiguous, and the C representation
         for the vector must be compatible between R and Python. If
         not the case, a :class:`ValueError` exception with will be
-        raised."""
+        raised.
+
+        With `copy=False`, the R vector uses the memory of the
+        memoryview rather than a copy of it (only for R vectors of
+        booleans, integers, or floats). R copies the data the first time
+        it needs to write to the vector, but changes made from Python
+        to the memory are visible in R until then. See
+        :mod:`rpy2.rinterface_lib.altrep`."""
         if not embedded.isready():
             raise embedded.RNotReadyError('Embedded R is not ready to use.')
         if not mview.contiguous:
             raise ValueError('The memory view must be contiguous.')
         if not cls._check_C_compatible(mview):
             cls._raise_incompatible_C_size(mview)
+        if not copy:
+            # _R_TYPE is an int in concrete classes.
+            return altrep.new_buffer_vector(typing.cast(int, cls._R_TYPE),
+                                            mview)
 
         r_vector = None
         n = len(mview)
@@ -712,9 +972,90 @@ class SexpVectorAbstract(SupportsSEXP, typing.Generic[VT],
         finally:
             openrlib.lock.release()
 
+    # Number of items fetched at a time when iterating over the vector.
+    _ITER_CHUNK_SIZE = 2 ** 12
+
+    def _take_c(self, cdata, indices: typing.Sequence[int]) -> list:
+        """Get the items at C indices (already checked) as Python objects.
+
+        The caller must hold the lock."""
+        return [
+            conversion._cdata_to_rinterface(self._R_VECTOR_ELT(cdata, i_c))
+            for i_c in indices
+        ]
+
+    def _put_c(self, cdata, indices: typing.Sequence[int],
+               values: typing.Sequence) -> None:
+        """Set the items at C indices (already checked).
+
+        The values are R objects. The caller must hold the lock."""
+        for i_c, v in zip(indices, values):
+            self._R_SET_VECTOR_ELT(cdata, i_c, v.__sexp__._cdata)
+
+    def _put_values(self, values: typing.Iterable) -> typing.Sequence:
+        # Python objects are converted before the lock is acquired
+        # because the conversion uses it.
+        return [
+            v if isinstance(v, Sexp)
+            else conversion._cdata_to_rinterface(
+                    conversion._python_to_cdata(v)
+            )
+            for v in values
+        ]
+
+    def take(self, indices) -> list:
+        """Get the items at the given indices.
+
+        The indices can be a range, a slice, a numpy array of integers,
+        or any iterable of integers. Negative indices are relative to
+        the end of the vector.
+
+        The items are returned in a Python list. The lock is acquired
+        only once for all items."""
+        if self._R_VECTOR_ELT is None:
+            raise NotImplementedError(
+                'take() is not implemented for %s.' % type(self).__name__)
+        cdata = self.__sexp__._cdata
+        with openrlib.lock:
+            indices_c = _c_indices(indices,
+                                   openrlib.rlib.Rf_xlength(cdata))
+            return self._take_c(cdata, indices_c)
+
+    def put(self, indices, values: typing.Iterable) -> None:
+        """Set the items at the given indices.
+
+        The indices can be anything accepted by :meth:`take`, and there
+        must be as many values as there are indices. The lock is acquired
+        only once for all items."""
+        if self._R_SET_VECTOR_ELT is None:
+            raise NotImplementedError(
+                'put() is not implemented for %s.' % type(self).__name__)
+        cdata = self.__sexp__._cdata
+        values = self._put_values(values)
+        with openrlib.lock:
+            indices_c = _c_indices(indices,
+                                   openrlib.rlib.Rf_xlength(cdata))
+            if len(indices_c) != len(values):
+                raise ValueError(
+                    'The number of values (%i) does not match the number '
+                    'of indices (%i).' % (len(values), len(indices_c))
+                )
+            self._put_c(cdata, indices_c, values)
+
+    def to_list(self) -> list:
+        """Get all items in the vector as a Python list."""
+        return self.take(range(len(self)))
+
     def __iter__(self) -> typing.Iterator[typing.Union[Sexp, VT, typing.Any]]:
-        for i in range(len(self)):
-            yield self[i]
+        n = len(self)
+        if self._R_VECTOR_ELT is None:
+            # R objects that are linked lists rather than arrays.
+            for i in range(n):
+                yield self[i]
+            return
+        chunk_size = self._ITER_CHUNK_SIZE
+        for start in range(0, n, chunk_size):
+            yield from self.take(range(start, min(start + chunk_size, n)))
 
     def index(self, item: typing.Any) -> int:
         for i, e in enumerate(self):
@@ -768,6 +1109,59 @@ class StrSexpVector(SexpVector):
     _R_SET_VECTOR_ELT = openrlib.rlib.SET_STRING_ELT
     _CAST_IN = _as_charsxp_cdata
 
+    @classmethod
+    def from_iterable(cls, iterable,
+                      populate_func=None,
+                      set_elt=None,
+                      cast_value=None) -> 'StrSexpVector':
+        """Create an R vector of strings from an iterable.
+
+        Unless a custom `populate_func` or `cast_value` is specified,
+        each distinct Python string is encoded only once (see
+        :func:`rpy2.rinterface_lib.strings.populate_r_vector`)."""
+        if populate_func is None and cast_value is None:
+            populate_func = strings.populate_r_vector
+        return super().from_iterable(iterable,
+                                     populate_func=populate_func,
+                                     set_elt=set_elt,
+                                     cast_value=cast_value)
+
+    @classmethod
+    @_cdata_res_to_rinterface
+    def from_buffers(cls, offsets, data, na=None) -> 'StrSexpVector':
+        """Create an R vector of strings from buffers.
+
+        The buffers are UTF-8 encoded data, the offsets of the strings
+        in it, and optionally flags for NA strings (see
+        :class:`rpy2.rinterface_lib.strings.StringBuffers`)."""
+        if not embedded.isready():
+            raise embedded.RNotReadyError('Embedded R is not ready to use.')
+        n = max(len(offsets) - 1, 0)
+        with memorymanagement.rmemory() as rmemory:
+            r_vector = rmemory.protect(
+                openrlib.rlib.Rf_allocVector(cls._R_TYPE, n)
+            )
+            strings.populate_r_vector_from_buffers(offsets, data, na,
+                                                   r_vector)
+        return r_vector
+
+    def to_buffers(self) -> strings.StringBuffers:
+        """Get the strings as UTF-8 encoded data, the offsets of the
+        strings in it, and flags for NA strings."""
+        return strings.to_buffers(self.__sexp__._cdata)
+
+    def to_numpy(self, dtype: typing.Any = object):
+        """Get the strings as a numpy array.
+
+        NA strings are None. See
+        :func:`rpy2.rinterface_lib.strings.to_numpy` for the
+        possible dtypes."""
+        return strings.to_numpy(self.__sexp__._cdata, dtype=dtype)
+
+    def to_list(self) -> list:
+        return strings.to_list(self.__sexp__._cdata,
+                               na_value=na_values.NA_Character)
+
     def __getitem__(
             self,
             i: typing.Union[int, slice]
@@ -848,6 +1242,39 @@ class StrSexpVector(SexpVector):
             raise TypeError('Indices must be integers or slices, '
                             'not %s' % type(i))
 
+    def _take_c(self, cdata, indices: typing.Sequence[int]) -> list:
+        rlib = openrlib.rlib
+        na_string = rlib.R_NaString
+        r_enc_py = conversion._R_ENC_PY
+        res: typing.List[typing.Any] = []
+        for i_c in indices:
+            elt = rlib.STRING_ELT(cdata, i_c)
+            if elt == na_string:
+                res.append(na_values.NA_Character)
+            else:
+                res.append(
+                    conversion._cchar_to_str(
+                        rlib.R_CHAR(elt), r_enc_py[rlib.Rf_getCharCE(elt)]
+                    )
+                )
+        return res
+
+    def _put_values(self, values: typing.Iterable) -> typing.Sequence:
+        # Strings are turned into R objects when set (see _put_c()).
+        return list(values)
+
+    def _put_c(self, cdata, indices: typing.Sequence[int],
+               values: typing.Sequence) -> None:
+        for i_c, v in zip(indices, values):
+            if v is None:
+                v_cdata = openrlib.rlib.R_NaString
+            elif isinstance(v, Sexp):
+                v_cdata = v.__sexp__._cdata
+            else:
+                v_cdata = _as_charsxp_cdata(v if isinstance(v, str)
+                                            else str(v))
+            self._R_SET_VECTOR_ELT(cdata, i_c, v_cdata)
+
     def get_charsxp(self, i: int) -> CharSexp:
         """Get the R CharSexp objects for the index i."""
         i_c = _rinterface._python_index_to_c(self.__sexp__._cdata, i)
@@ -995,18 +1422,15 @@ def rclass_set(
 
 
 def unserialize(state):
-    n = len(state)
-    with memorymanagement.rmemory() as rmemory:
-        cdata = rmemory.protect(
-            openrlib.rlib.Rf_allocVector(openrlib.rlib.RAWSXP, n))
-        _rinterface.ffi.memmove(
-            openrlib.rlib.RAW(cdata), state, n)
-        ser = rmemory.protect(
-            _rinterface.unserialize(cdata,
-                                    globalenv.__sexp__._cdata)
-        )
-        res = _rinterface.SexpCapsule(ser)
-    return res
+    """Unserialize an R object.
+
+    The state can be a serialized R object (in an object with the buffer
+    protocol, such as :class:`bytes`), or the state of an R object as
+    returned by `Sexp.__getstate__()` (which gives a copy of the object).
+    """
+    if isinstance(state, serialization.PickledSexp):
+        state = serialization.dumps(state)
+    return serialization.loads(state)
 
 
 class NAIntegerType(int, metaclass=Singleton):
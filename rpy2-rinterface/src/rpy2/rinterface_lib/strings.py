@@ -0,0 +1,195 @@
+"""Bulk transfer of strings between R vectors and Python.
+
+Each string in an R vector is a CHARSXP, and R keeps only one CHARSXP
+for each distinct string (R's global CHARSXP cache). Moving the strings
+one at a time requires a lookup, an encoding check, and a decoding (or
+encoding) for each element.
+
+The functions in this module transfer all the strings in an R vector in
+one pass, decoding (or encoding) each distinct string only once:
+
+- from R to Python, as a list of Python strings, a numpy array, or
+  a pair of buffers with the UTF-8 data and the offsets of the strings
+  in it (the layout used by Apache Arrow for strings).
+
+- from Python to R, from a sequence of Python strings or from such
+  a pair of buffers.
+"""
+
+import array
+import codecs
+import sys
+import typing
+from rpy2.rinterface_lib import conversion
+from rpy2.rinterface_lib import openrlib
+
+from _cffi_backend import FFI  # type: ignore
+
+ffi = openrlib.ffi
+
+
+class StringBuffers(typing.NamedTuple):
+    """Strings in an R vector as buffers.
+
+    Unless `na[i]` is true (the string is NA), the string at index `i`
+    is `data[offsets[i]:offsets[i+1]]` encoded in UTF-8. There are
+    n+1 offsets for n strings."""
+    offsets: array.array
+    data: bytes
+    na: bytearray
+
+
+def _is_utf8(encoding: str) -> bool:
+    return codecs.lookup(encoding).name in ('utf-8', 'ascii')
+
+
+def _charsxp_bytes(elt: FFI.CData) -> bytes:
+    rlib = openrlib.rlib
+    return ffi.unpack(rlib.R_CHAR(elt), rlib.Rf_xlength(elt))
+
+
+def _string_elts(cdata: FFI.CData) -> list:
+    # The caller must hold the lock.
+    return ffi.unpack(openrlib._STRING_PTR(cdata),
+                      openrlib.rlib.Rf_xlength(cdata))
+
+
+def to_list(cdata: FFI.CData,
+            na_value: typing.Any = None) -> typing.List[typing.Any]:
+    """Get the strings in an R vector as a list of Python strings.
+
+    NA strings are `na_value`. Repeated strings are decoded once and
+    are the same Python object in the list."""
+    rlib = openrlib.rlib
+    na_string = rlib.R_NaString
+    r_enc_py = conversion._R_ENC_PY
+    cache: typing.Dict[FFI.CData, str] = {}
+    res: typing.List[typing.Any] = []
+    with openrlib.lock:
+        for elt in _string_elts(cdata):
+            if elt == na_string:
+                res.append(na_value)
+                continue
+            s = cache.get(elt)
+            if s is None:
+                s = _charsxp_bytes(elt).decode(
+                    r_enc_py[rlib.Rf_getCharCE(elt)]
+                )
+                cache[elt] = s
+            res.append(s)
+    return res
+
+
+def to_numpy(cdata: FFI.CData, dtype: typing.Any = object):
+    """Get the strings in an R vector as a numpy array.
+
+    NA strings are None. The default `dtype` is `object`. The dtype
+    can also be a numpy `StringDType` (numpy >= 2.0), which must then
+    have `na_object=None` if there are NA strings, or None to let numpy
+    infer it (fixed-width unicode unless there are NA strings)."""
+    import numpy  # type: ignore
+    return numpy.array(to_list(cdata, na_value=None), dtype=dtype)
+
+
+def to_buffers(cdata: FFI.CData) -> StringBuffers:
+    """Get the strings in an R vector as buffers (see StringBuffers)."""
+    rlib = openrlib.rlib
+    na_string = rlib.R_NaString
+    r_enc_py = conversion._R_ENC_PY
+    cache: typing.Dict[FFI.CData, bytes] = {}
+    chunks = []
+    offsets = array.array('q', (0, ))
+    pos = 0
+    with openrlib.lock:
+        elts = _string_elts(cdata)
+        na = bytearray(len(elts))
+        for i, elt in enumerate(elts):
+            if elt == na_string:
+                na[i] = 1
+            else:
+                b = cache.get(elt)
+                if b is None:
+                    b = _charsxp_bytes(elt)
+                    encoding = r_enc_py[rlib.Rf_getCharCE(elt)]
+                    if not _is_utf8(encoding):
+                        b = b.decode(encoding).encode('utf-8')
+                    cache[elt] = b
+                chunks.append(b)
+                pos += len(b)
+            offsets.append(pos)
+    return StringBuffers(offsets, b''.join(chunks), na)
+
+
+def populate_r_vector(iterable, r_vector, set_elt, cast_value) -> None:
+    """Populate an R vector of strings.
+
+    This has the signature expected for `populate_func` in
+    :meth:`rpy2.rinterface_lib.sexp.SexpVectorAbstract.from_iterable`.
+    Python strings are encoded and turned into R strings once for each
+    distinct value, None is an NA string, and other objects are cast
+    with `cast_value`."""
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and isinstance(iterable, numpy.ndarray):
+        # Python strings rather than numpy scalars.
+        iterable = iterable.tolist()
+    rlib = openrlib.rlib
+    na_string = rlib.R_NaString
+    ce_utf8 = rlib.CE_UTF8
+    cache: typing.Dict[str, FFI.CData] = {}
+    for i, v in enumerate(iterable):
+        if isinstance(v, str):
+            # The R strings in the cache are protected from R's garbage
+            # collection as soon as they are in the R vector.
+            charsxp = cache.get(v)
+            if charsxp is None:
+                if '\x00' in v:
+                    charsxp = cast_value(v)
+                else:
+                    b = v.encode('utf-8')
+                    charsxp = rlib.Rf_mkCharLenCE(b, len(b), ce_utf8)
+                cache[v] = charsxp
+        elif v is None:
+            charsxp = na_string
+        else:
+            charsxp = cast_value(v)
+        set_elt(r_vector, i, charsxp)
+
+
+def populate_r_vector_from_buffers(
+        offsets, data, na, r_vector: FFI.CData
+) -> None:
+    """Populate an R vector of strings from buffers (see StringBuffers).
+
+    `offsets` and `na` can be any sequence or 1-dimensional buffer
+    (for example a numpy array), and `na` can also be None when there
+    are no NA strings. The R strings are made directly from the memory
+    of `data`."""
+    rlib = openrlib.rlib
+    n = rlib.Rf_xlength(r_vector)
+    if not isinstance(offsets, (list, tuple, range)):
+        offsets = memoryview(offsets).tolist()
+    if na is not None and not isinstance(na, (list, tuple)):
+        na = memoryview(na).tolist()
+    if not isinstance(data, bytes):
+        data = memoryview(data).cast('B').tobytes()
+    if len(offsets) != n + 1 or (na is not None and len(na) != n):
+        raise ValueError('There must be n+1 offsets and n NA flags '
+                         'for n strings.')
+    if b'\x00' in data:
+        raise ValueError('R strings cannot contain null bytes.')
+    na_string = rlib.R_NaString
+    ce_utf8 = rlib.CE_UTF8
+    size = len(data)
+    ptr = ffi.cast('char *', ffi.from_buffer(data))
+    for i in range(n):
+        if na is not None and na[i]:
+            charsxp = na_string
+        else:
+            start = offsets[i]
+            end = offsets[i + 1]
+            if not 0 <= start <= end <= size:
+                raise ValueError(
+                    'Invalid offsets for string %i: %i, %i' % (i, start, end)
+                )
+            charsxp = rlib.Rf_mkCharLenCE(ptr + start, end - start, ce_utf8)
+        rlib.SET_STRING_ELT(r_vector, i, charsxp)
@@ -6,11 +6,17 @@ R version, rpy2 version, etc...).
 
 import argparse
 import enum
+import hashlib
+import json
 import logging
 import os
+import platform
 import shlex
+import shutil
 import subprocess
 import sys
+import tempfile
+import typing
 from typing import Optional
 import warnings
 
@@ -22,6 +28,8 @@ else:
     r_version_folder = 'i386'
 
 ENVVAR_CFFI_TYPE: str = 'RPY2_CFFI_MODE'
+ENVVAR_CACHE_DIR: str = 'RPY2_CACHE_DIR'
+ENVVAR_SITUATION_CACHE: str = 'RPY2_SITUATION_CACHE'
 
 
 class CFFI_MODE(enum.Enum):
@@ -49,8 +57,8 @@ def assert_python_version():
         raise RuntimeError(msg)
 
 
-def r_version_from_subprocess():
-    cmd = ('R', '--version')
+def r_version_from_subprocess(r_exec: str = 'R'):
+    cmd = (r_exec, '--version')
     logger.debug('Looking for R version with: {}'.format(' '.join(cmd)))
     try:
         tmp = subprocess.check_output(cmd,
@@ -58,11 +66,11 @@ def r_version_from_subprocess():
     except Exception as e:  # FileNotFoundError, WindowsError, etc
         logger.error(f'Unable to determine the R version: {e}')
         return None
-    r_version = tmp.decode('ascii', 'ignore').split(os.linesep)
-    if r_version[0].startswith('WARNING'):
-        r_version = r_version[1]
+    lines = tmp.decode('ascii', 'ignore').split(os.linesep)
+    if lines[0].startswith('WARNING'):
+        r_version = lines[1]
     else:
-        r_version = r_version[0].strip()
+        r_version = lines[0].strip()
     logger.info(f'R version found: {r_version}')
     return r_version
 
@@ -219,6 +227,161 @@ def get_r_home() -> Optional[str]:
     return r_home
 
 
+def get_cache_dir() -> str:
+    """Get the directory for data cached by rpy2.
+
+    This is the environment variable RPY2_CACHE_DIR if defined, and
+    otherwise a directory "rpy2" in the user's cache directory."""
+    res = os.environ.get(ENVVAR_CACHE_DIR)
+    if not res:
+        if os.name == 'nt':
+            base = (os.environ.get('LOCALAPPDATA') or
+                    os.path.join(os.path.expanduser('~'),
+                                 'AppData', 'Local'))
+        elif sys.platform == 'darwin':
+            base = os.path.join(os.path.expanduser('~'),
+                                'Library', 'Caches')
+        else:
+            base = (os.environ.get('XDG_CACHE_HOME') or
+                    os.path.join(os.path.expanduser('~'), '.cache'))
+        res = os.path.join(base, 'rpy2')
+    return res
+
+
+class Situation(typing.NamedTuple):
+    """R installation used by rpy2."""
+    r_home: Optional[str]
+    ld_library_path: str
+    r_version: Optional[str]
+    rlib_path: Optional[str]
+
+
+def _situation_cache_enabled() -> bool:
+    value = os.environ.get(ENVVAR_SITUATION_CACHE, '')
+    return value.lower() not in ('0', 'false', 'no', 'off')
+
+
+def _situation_cache_key() -> Optional[dict]:
+    """Key for the cached situation (None if there is no R executable).
+
+    The key is the path of the R executable and its modification time,
+    with the environment variables the situation depends on."""
+    r_home = os.environ.get('R_HOME')
+    r_exec: Optional[str]
+    if r_home:
+        r_exec = get_r_exec(r_home)
+    else:
+        r_exec = shutil.which('R')
+        if r_exec is None:
+            return None
+    if os.name == 'nt' and not r_exec.lower().endswith('.exe'):
+        r_exec += '.exe'
+    r_exec = os.path.realpath(r_exec)
+    try:
+        mtime_ns = os.stat(r_exec).st_mtime_ns
+    except OSError:
+        return None
+    return {'r_exec': r_exec,
+            'mtime_ns': mtime_ns,
+            'R_HOME': r_home or None,
+            'LD_LIBRARY_PATH': os.environ.get('LD_LIBRARY_PATH')}
+
+
+def get_situation_cache_path(key: dict) -> str:
+    """Get the path of the file caching the situation for a key."""
+    digest = hashlib.sha256(
+        json.dumps(key, sort_keys=True).encode('utf-8')
+    ).hexdigest()[:16]
+    return os.path.join(get_cache_dir(), f'situation-{digest}.json')
+
+
+def _read_situation_cache(path: str, key: dict) -> Optional[Situation]:
+    try:
+        with open(path, encoding='utf-8') as fh:
+            data = json.load(fh)
+        if data.get('key') != key:
+            return None
+        res = Situation(**data['situation'])
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f'Unable to use the situation cache {path}: {e}')
+        return None
+    if res.r_home is None or not os.path.isdir(res.r_home):
+        return None
+    return res
+
+
+def _write_situation_cache(path: str, key: dict,
+                           situation: Situation) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path),
+                                        suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+                json.dump({'key': key,
+                           'situation': situation._asdict()}, fh)
+            # Atomic, for processes starting concurrently.
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f'Unable to write the situation cache {path}: {e}')
+
+
+def _situation_from_subprocess(with_r_version: bool = True) -> Situation:
+    r_home = get_r_home()
+    if r_home is None:
+        return Situation(None, '', None, None)
+    if os.name == 'nt':
+        ld_library_path = ''
+    else:
+        ld_library_path = r_ld_library_path_from_subprocess(r_home)
+    try:
+        rlib_path = get_rlib_path(r_home, platform.system())
+    except ValueError:
+        rlib_path = None
+    if with_r_version:
+        r_version = r_version_from_subprocess(get_r_exec(r_home))
+    else:
+        r_version = None
+    return Situation(r_home, ld_library_path, r_version, rlib_path)
+
+
+def get_situation(use_cache: Optional[bool] = None) -> Situation:
+    """Get R's home directory, LD_LIBRARY_PATH, version, and library path.
+
+    Finding them requires to run R in subprocesses, and the result is
+    cached in a file in :func:`get_cache_dir`. The cache is for the R
+    executable (R in R_HOME if defined, or in the PATH otherwise) and its
+    modification time, and for the values of R_HOME and LD_LIBRARY_PATH.
+    A new R executable, a reinstalled one, or other values for the
+    environment variables invalidate the cache.
+
+    :param use_cache: use the cache. If None, the cache is used unless
+      the environment variable RPY2_SITUATION_CACHE is "0", "false",
+      "no", or "off".
+    :return: a :class:`Situation`. Finding the R version requires one
+      more subprocess, and it is only done when writing the cache. The
+      attribute r_version is None when the cache is not used.
+    """
+    if use_cache is None:
+        use_cache = _situation_cache_enabled()
+    key = _situation_cache_key() if use_cache else None
+    if key is None:
+        return _situation_from_subprocess(with_r_version=False)
+    path = get_situation_cache_path(key)
+    res = _read_situation_cache(path, key)
+    if res is None:
+        logger.info(f'Situation not cached in {path}.')
+        res = _situation_from_subprocess()
+        if res.r_home is not None:
+            _write_situation_cache(path, key, res)
+    else:
+        logger.info(f'Situation read from the cache {path}.')
+    return res
+
+
 def get_r_exec(r_home: str) -> str:
     """Get the path of the R executable/binary.
 
@@ -453,6 +616,13 @@ def iter_info():
     yield 'Directory for the R shared library:'
     yield get_r_libnn(r_home)
 
+    yield make_bold('Situation cache:')
+    yield f'  Environment variable: {ENVVAR_SITUATION_CACHE}'
+    yield f'  Enabled: {_situation_cache_enabled()}'
+    key = _situation_cache_key()
+    if key is not None:
+        yield f'  Path: {get_situation_cache_path(key)}'
+
     yield make_bold('CFFI extension type')
     yield f'  Environment variable: {ENVVAR_CFFI_TYPE}'
     yield f'  Value: {get_cffi_mode()}'
@@ -0,0 +1,652 @@
+"""This module handles the conversion of data structures between R objects
+handled by rpy2 and Apache Arrow arrays (as pyarrow objects).
+
+The conversion uses the Arrow C Data Interface
+(https://arrow.apache.org/docs/format/CDataInterface.html):
+
+- R vectors of booleans, integers, floats, and strings, factors, dates
+  (class "Date"), times (class "POSIXct"), and data frames are exported
+  as Arrow arrays (record batches for data frames). NA values are nulls
+  (in the validity bitmap), and factors are dictionary-encoded arrays.
+
+- Arrow arrays, chunked arrays, record batches, and tables are imported
+  as R vectors and data frames.
+
+The Arrow buffers for integers and floats can be the memory of the R vectors
+(see `zerocopy_rpy2py`), and R vectors can use the memory of Arrow buffers
+(see `zerocopy_py2rpy`) when the Arrow types match the R types and the
+arrays do not have nulls.
+
+With pyarrow installed, the converter can be used like the other ones:
+
+>>> from rpy2.robjects import default_converter
+>>> from rpy2.robjects.conversion import localconverter
+>>> from rpy2.robjects import arrow2ri
+>>> with localconverter(default_converter + arrow2ri.converter):
+...     ...
+
+The functions `export_to_c` and `import_from_c` exchange R objects with
+other producers or consumers of the C Data Interface.
+"""
+
+import itertools
+import logging
+import typing
+import cffi  # type: ignore
+import numpy  # type: ignore
+import pyarrow  # type: ignore
+
+import rpy2.robjects as ro
+import rpy2.robjects.conversion as conversion
+import rpy2.rinterface as rinterface
+from rpy2.rinterface_lib import altrep
+from rpy2.rinterface_lib import conversion as _conversion
+from rpy2.rinterface_lib import openrlib
+from rpy2.rinterface_lib import strings
+from rpy2.rinterface import RTYPES
+from rpy2.robjects.vectors import get_timezone
+
+logger = logging.getLogger(__name__)
+
+_ARROW_C_DATA_INTERFACE = """
+struct ArrowSchema {
+  const char* format;
+  const char* name;
+  const char* metadata;
+  int64_t flags;
+  int64_t n_children;
+  struct ArrowSchema** children;
+  struct ArrowSchema* dictionary;
+  void (*release)(struct ArrowSchema*);
+  void* private_data;
+};
+
+struct ArrowArray {
+  int64_t length;
+  int64_t null_count;
+  int64_t offset;
+  int64_t n_buffers;
+  int64_t n_children;
+  const void** buffers;
+  struct ArrowArray** children;
+  struct ArrowArray* dictionary;
+  void (*release)(struct ArrowArray*);
+  void* private_data;
+};
+"""
+
+ffi = cffi.FFI()
+ffi.cdef(_ARROW_C_DATA_INTERFACE)
+
+ARROW_FLAG_DICTIONARY_ORDERED = 1
+ARROW_FLAG_NULLABLE = 2
+
+# Let Arrow arrays exported from R vectors of integers or floats use
+# the memory of the R vectors rather than copies of it. The R objects
+# are kept alive until the Arrow arrays are released, but changes made
+# to the R vectors in place would be visible in the Arrow arrays (which
+# are meant to be immutable). This is opt-in, as for numpy2ri.
+zerocopy_rpy2py = False
+
+# Let R vectors imported from Arrow arrays (of 32-bit integers or
+# 64-bit floats, and without nulls) use the memory of the Arrow arrays
+# rather than copies of it. R copies the data the first time it needs
+# to write to the vector.
+zerocopy_py2rpy = True
+
+_NA_INTEGER = numpy.iinfo('int32').min
+# Low word of the bit pattern for R's NA_real_ (a NaN).
+_NA_REAL_LOW_WORD = 1954
+_NA_REAL = numpy.array([0x7FF00000000007A2], dtype='uint64').view('float64')[0]
+
+# Python objects to keep alive for exported C structures, by the handle
+# in the field `private_data` of the structures. The entry for a
+# structure is removed when its consumer calls its release callback.
+_EXPORTED: typing.Dict[int, list] = {}
+_HANDLES = itertools.count(1)
+
+
+class _ArrowData(typing.NamedTuple):
+    """An Arrow array (with its type) to export.
+
+    Buffers are None (a NULL pointer), an address (int), or objects with
+    the buffer protocol."""
+    format: str
+    length: int
+    buffers: typing.Sequence[typing.Any]
+    null_count: int = 0
+    children: typing.Sequence['_ArrowData'] = ()
+    dictionary: typing.Optional['_ArrowData'] = None
+    flags: int = ARROW_FLAG_NULLABLE
+    name: str = ''
+    keep: typing.Sequence[typing.Any] = ()
+
+
+def _release(c_struct) -> None:
+    try:
+        for i in range(c_struct.n_children):
+            child = c_struct.children[i]
+            if child.release != ffi.NULL:
+                child.release(child)
+        dictionary = c_struct.dictionary
+        if dictionary != ffi.NULL and dictionary.release != ffi.NULL:
+            dictionary.release(dictionary)
+        _EXPORTED.pop(int(ffi.cast('uintptr_t', c_struct.private_data)),
+                      None)
+    except Exception as e:
+        logger.error('Error while releasing an Arrow structure: %s', str(e))
+    c_struct.release = ffi.NULL
+
+
+@ffi.callback('void(struct ArrowSchema *)')
+def _release_schema(c_schema):
+    _release(c_schema)
+
+
+@ffi.callback('void(struct ArrowArray *)')
+def _release_array(c_array):
+    _release(c_array)
+
+
+def _private_data(keep: list):
+    handle = next(_HANDLES)
+    _EXPORTED[handle] = keep
+    return ffi.cast('void *', handle)
+
+
+def _export(data: _ArrowData, c_schema, c_array) -> None:
+    """Fill C structures for an Arrow array (and its type)."""
+    schema_keep: typing.List[typing.Any] = []
+    array_keep: typing.List[typing.Any] = list(data.keep)
+
+    c_format = ffi.new('char[]', data.format.encode('utf-8'))
+    c_name = ffi.new('char[]', data.name.encode('utf-8'))
+    schema_keep.extend((c_format, c_name))
+    c_schema.format = c_format
+    c_schema.name = c_name
+    c_schema.metadata = ffi.NULL
+    c_schema.flags = data.flags
+
+    n_children = len(data.children)
+    c_schema.n_children = n_children
+    c_array.n_children = n_children
+    if n_children:
+        schema_children = ffi.new('struct ArrowSchema *[]', n_children)
+        array_children = ffi.new('struct ArrowArray *[]', n_children)
+        for i, child in enumerate(data.children):
+            child_schema = ffi.new('struct ArrowSchema *')
+            child_array = ffi.new('struct ArrowArray *')
+            _export(child, child_schema, child_array)
+            schema_children[i] = child_schema
+            array_children[i] = child_array
+            schema_keep.append(child_schema)
+            array_keep.append(child_array)
+        schema_keep.append(schema_children)
+        array_keep.append(array_children)
+        c_schema.children = schema_children
+        c_array.children = array_children
+    else:
+        c_schema.children = ffi.NULL
+        c_array.children = ffi.NULL
+
+    if data.dictionary is None:
+        c_schema.dictionary = ffi.NULL
+        c_array.dictionary = ffi.NULL
+    else:
+        dictionary_schema = ffi.new('struct ArrowSchema *')
+        dictionary_array = ffi.new('struct ArrowArray *')
+        _export(data.dictionary, dictionary_schema, dictionary_array)
+        schema_keep.append(dictionary_schema)
+        array_keep.append(dictionary_array)
+        c_schema.dictionary = dictionary_schema
+        c_array.dictionary = dictionary_array
+
+    c_buffers = ffi.new('void *[]', max(len(data.buffers), 1))
+    for i, buf in enumerate(data.buffers):
+        if buf is None:
+            c_buffers[i] = ffi.NULL
+        elif isinstance(buf, int):
+            c_buffers[i] = ffi.cast('void *', buf)
+        else:
+            c_buf = ffi.from_buffer(buf)
+            array_keep.append(c_buf)
+            c_buffers[i] = c_buf
+    array_keep.append(c_buffers)
+    c_array.length = data.length
+    c_array.null_count = data.null_count
+    c_array.offset = 0
+    c_array.n_buffers = len(data.buffers)
+    c_array.buffers = c_buffers
+
+    c_schema.private_data = _private_data(schema_keep)
+    c_array.private_data = _private_data(array_keep)
+    c_schema.release = _release_schema
+    c_array.release = _release_array
+
+
+def _r_values(obj, dtype) -> 'numpy.ndarray':
+    """Read-only numpy array on the memory of an R vector."""
+    res = numpy.asarray(obj).ravel(order='F').view(dtype)
+    res.flags.writeable = False
+    return res
+
+
+def _r_data(obj, values: 'numpy.ndarray') -> typing.Tuple[typing.Any, list]:
+    """Data buffer for an R vector (and objects to keep alive for it)."""
+    if zerocopy_rpy2py and len(values):
+        ptr = obj._R_GET_PTR(obj.__sexp__._cdata)
+        return int(openrlib.ffi.cast('uintptr_t', ptr)), [obj]
+    else:
+        return values.copy(), []
+
+
+def _validity(valid: 'numpy.ndarray') -> typing.Tuple[typing.Any, int]:
+    """Validity bitmap (None if no nulls) and number of nulls."""
+    null_count = len(valid) - int(numpy.count_nonzero(valid))
+    if null_count == 0:
+        return None, 0
+    return numpy.packbits(valid, bitorder='little'), null_count
+
+
+def _int_to_arrow(obj) -> _ArrowData:
+    values = _r_values(obj, 'int32')
+    bitmap, null_count = _validity(values != _NA_INTEGER)
+    data, keep = _r_data(obj, values)
+    return _ArrowData('i', len(values), (bitmap, data), null_count,
+                      keep=keep)
+
+
+def _float_to_arrow(obj) -> _ArrowData:
+    values = _r_values(obj, 'float64')
+    na = (numpy.isnan(values) &
+          ((values.view('uint64') & 0xFFFFFFFF) == _NA_REAL_LOW_WORD))
+    bitmap, null_count = _validity(~na)
+    data, keep = _r_data(obj, values)
+    return _ArrowData('g', len(values), (bitmap, data), null_count,
+                      keep=keep)
+
+
+def _bool_to_arrow(obj) -> _ArrowData:
+    values = _r_values(obj, 'int32')
+    bitmap, null_count = _validity(values != _NA_INTEGER)
+    data = numpy.packbits(values == 1, bitorder='little')
+    return _ArrowData('b', len(values), (bitmap, data), null_count)
+
+
+def _str_to_arrow(obj) -> _ArrowData:
+    buffers = strings.to_buffers(obj.__sexp__._cdata)
+    n = len(buffers.na)
+    bitmap, null_count = _validity(
+        numpy.frombuffer(buffers.na, dtype='uint8') == 0
+    )
+    offsets = numpy.frombuffer(buffers.offsets, dtype='int64')
+    if len(buffers.data) < 2**31:
+        fmt = 'u'
+        offsets = offsets.astype('int32')
+    else:
+        fmt = 'U'
+    return _ArrowData(fmt, n, (bitmap, offsets, buffers.data), null_count)
+
+
+def _factor_to_arrow(obj) -> _ArrowData:
+    codes = _r_values(obj, 'int32')
+    valid = codes != _NA_INTEGER
+    bitmap, null_count = _validity(valid)
+    indices = numpy.where(valid, codes - 1, 0).astype('int32')
+    levels = _str_to_arrow(obj.do_slot('levels'))
+    flags = ARROW_FLAG_NULLABLE
+    if 'ordered' in obj.rclass:
+        flags |= ARROW_FLAG_DICTIONARY_ORDERED
+    return _ArrowData('i', len(codes), (bitmap, indices), null_count,
+                      dictionary=levels, flags=flags)
+
+
+def _date_to_arrow(obj) -> _ArrowData:
+    values = _r_values(obj, 'float64')
+    valid = numpy.isfinite(values)
+    bitmap, null_count = _validity(valid)
+    days = numpy.where(valid, numpy.floor(values), 0).astype('int32')
+    return _ArrowData('tdD', len(values), (bitmap, days), null_count)
+
+
+def _local_timezone_name() -> str:
+    """IANA name of the local time zone (empty if unknown)."""
+    tz = get_timezone()
+    # ZoneInfo (key) or pytz (zone) objects. Others, for example fixed
+    # offsets, have no name Arrow knows.
+    name = getattr(tz, 'key', None) or getattr(tz, 'zone', None)
+    if name is None:
+        res = rinterface.baseenv['Sys.timezone']()
+        if res[0] is not rinterface.NA_Character:
+            name = res[0]
+    return name or ''
+
+
+def _posixct_to_arrow(obj) -> _ArrowData:
+    values = _r_values(obj, 'float64')
+    valid = numpy.isfinite(values)
+    bitmap, null_count = _validity(valid)
+    microseconds = numpy.where(
+        valid, numpy.round(values * 1e6), 0
+    ).astype('int64')
+    try:
+        tzone = obj.do_slot('tzone')
+        tz = tzone[0] if len(tzone) else ''
+    except LookupError:
+        tz = ''
+    if not tz:
+        # The times are in the local time zone for R. Arrow timestamps
+        # without a time zone would be times in UTC.
+        tz = _local_timezone_name()
+    return _ArrowData(f'tsu:{tz}', len(values), (bitmap, microseconds),
+                      null_count)
+
+
+def _dataframe_to_arrow(obj) -> _ArrowData:
+    names = obj.do_slot('names')
+    children = tuple(
+        _to_arrow_data(column)._replace(name=name)
+        for name, column in zip(names, rinterface.ListSexpVector(obj))
+    )
+    nrow = rinterface.baseenv['nrow'](obj)[0]
+    return _ArrowData('+s', nrow, (None, ), children=children, flags=0)
+
+
+def _to_arrow_data(obj) -> _ArrowData:
+    rclass = obj.rclass
+    if obj.typeof == RTYPES.INTSXP:
+        if 'factor' in rclass:
+            return _factor_to_arrow(obj)
+        return _int_to_arrow(obj)
+    elif obj.typeof == RTYPES.REALSXP:
+        if 'POSIXct' in rclass:
+            return _posixct_to_arrow(obj)
+        elif 'Date' in rclass:
+            return _date_to_arrow(obj)
+        return _float_to_arrow(obj)
+    elif obj.typeof == RTYPES.LGLSXP:
+        return _bool_to_arrow(obj)
+    elif obj.typeof == RTYPES.STRSXP:
+        return _str_to_arrow(obj)
+    elif obj.typeof == RTYPES.VECSXP and 'data.frame' in rclass:
+        return _dataframe_to_arrow(obj)
+    raise ValueError(
+        f'R objects of type {obj.typeof} and class {tuple(rclass)} '
+        'cannot be converted to Arrow arrays.'
+    )
+
+
+def export_to_c(obj, array_address: int, schema_address: int) -> None:
+    """Export an R object to the C structures of the Arrow C Data Interface.
+
+    The structures ArrowArray and ArrowSchema at the addresses are
+    filled, and the consumer is then responsible for calling their
+    release callbacks. Data frames are exported as struct arrays (as
+    record batches are)."""
+    _export(_to_arrow_data(obj),
+            ffi.cast('struct ArrowSchema *', schema_address),
+            ffi.cast('struct ArrowArray *', array_address))
+
+
+def rpy2arrow(obj):
+    """Convert an R object to a pyarrow Array (RecordBatch for a data frame).
+    """
+    data = _to_arrow_data(obj)
+    c_schema = ffi.new('struct ArrowSchema *')
+    c_array = ffi.new('struct ArrowArray *')
+    _export(data, c_schema, c_array)
+    array_address = int(ffi.cast('uintptr_t', c_array))
+    schema_address = int(ffi.cast('uintptr_t', c_schema))
+    if data.format == '+s':
+        return pyarrow.RecordBatch._import_from_c(array_address,
+                                                  schema_address)
+    return pyarrow.Array._import_from_c(array_address, schema_address)
+
+
+class _ImportedArray(object):
+    """C structures imported from a producer.
+
+    They are released when this object is garbage collected, which is
+    after all R vectors using the memory of the Arrow buffers are."""
+
+    __slots__ = ('c_schema', 'c_array')
+
+    def __init__(self):
+        self.c_schema = ffi.new('struct ArrowSchema *')
+        self.c_array = ffi.new('struct ArrowArray *')
+
+    def __del__(self):
+        for c_struct in (self.c_array, self.c_schema):
+            if c_struct.release != ffi.NULL:
+                c_struct.release(c_struct)
+
+
+def _buffer_values(c_array, i: int, dtype, n: int) -> 'numpy.ndarray':
+    """numpy array on the memory of an Arrow buffer (from the offset)."""
+    dtype = numpy.dtype(dtype)
+    start = c_array.offset
+    if n == 0 or c_array.buffers[i] == ffi.NULL:
+        return numpy.zeros(n, dtype=dtype)
+    buf = ffi.buffer(ffi.cast('char *', c_array.buffers[i]),
+                     (start + n) * dtype.itemsize)
+    return numpy.frombuffer(buf, dtype=dtype)[start:]
+
+
+def _buffer_bits(c_array, i: int) -> 'numpy.ndarray':
+    start = c_array.offset
+    n = c_array.length
+    buf = ffi.buffer(ffi.cast('char *', c_array.buffers[i]),
+                     (start + n + 7) // 8)
+    bits = numpy.unpackbits(numpy.frombuffer(buf, dtype='uint8'),
+                            count=start + n, bitorder='little')
+    return bits[start:].astype(bool)
+
+
+def _valid(c_array) -> typing.Optional['numpy.ndarray']:
+    """Array of booleans (False for nulls), or None if no nulls."""
+    if (c_array.null_count == 0 or c_array.n_buffers == 0 or
+            c_array.buffers[0] == ffi.NULL):
+        return None
+    return _buffer_bits(c_array, 0)
+
+
+def _new_vector(cls, values: 'numpy.ndarray', owner=None):
+    if owner is not None:
+        # Values are on the memory of the Arrow buffer.
+        return _conversion._cdata_to_rinterface(
+            altrep.new_buffer_vector(cls._R_TYPE, memoryview(values),
+                                     owner=owner)
+        )
+    return cls.from_memoryview(memoryview(values))
+
+
+_INT_FORMATS = {'c': 'int8', 'C': 'uint8', 's': 'int16', 'S': 'uint16',
+                'i': 'int32'}
+_FLOAT_FORMATS = {'I': 'uint32', 'l': 'int64', 'L': 'uint64',
+                  'e': 'float16', 'f': 'float32', 'g': 'float64'}
+_TIME_UNITS = {'s': 1, 'm': 1e-3, 'u': 1e-6, 'n': 1e-9}
+
+
+def _import_numeric(fmt: str, c_array, owner):
+    valid = _valid(c_array)
+    n = c_array.length
+    if fmt in _INT_FORMATS:
+        values = _buffer_values(c_array, 1, _INT_FORMATS[fmt], n)
+        if zerocopy_py2rpy and fmt == 'i' and valid is None:
+            return _new_vector(rinterface.IntSexpVector, values, owner)
+        res = values.astype('int32')
+        if valid is not None:
+            res[~valid] = _NA_INTEGER
+        return _new_vector(rinterface.IntSexpVector, res)
+    else:
+        values = _buffer_values(c_array, 1, _FLOAT_FORMATS[fmt], n)
+        if zerocopy_py2rpy and fmt == 'g' and valid is None:
+            return _new_vector(rinterface.FloatSexpVector, values, owner)
+        res = values.astype('float64')
+        if valid is not None:
+            res[~valid] = _NA_REAL
+        return _new_vector(rinterface.FloatSexpVector, res)
+
+
+def _import_bool(c_array):
+    valid = _valid(c_array)
+    if c_array.length == 0:
+        res = numpy.zeros(0, dtype='int32')
+    else:
+        res = _buffer_bits(c_array, 1).astype('int32')
+    if valid is not None:
+        res[~valid] = _NA_INTEGER
+    return _new_vector(rinterface.BoolSexpVector, res)
+
+
+def _import_str(fmt: str, c_array):
+    valid = _valid(c_array)
+    n = c_array.length
+    offsets = _buffer_values(c_array, 1, 'int32' if fmt == 'u' else 'int64',
+                             n + 1)
+    size = int(offsets[-1]) if n else 0
+    if size:
+        data = ffi.buffer(ffi.cast('char *', c_array.buffers[2]), size)
+    else:
+        data = b''
+    na = None if valid is None else ~valid
+    return rinterface.StrSexpVector.from_buffers(offsets, data, na)
+
+
+def _import_temporal(fmt: str, c_array):
+    valid = _valid(c_array)
+    n = c_array.length
+    if fmt == 'tdD':
+        res = _buffer_values(c_array, 1, 'int32', n).astype('float64')
+        rclass: typing.Tuple[str, ...] = ('Date', )
+    elif fmt == 'tdm':
+        res = _buffer_values(c_array, 1, 'int64', n) / 86400000
+        rclass = ('Date', )
+    else:
+        unit, tz = fmt[2], fmt[4:]
+        res = (_buffer_values(c_array, 1, 'int64', n) *
+               _TIME_UNITS[unit])
+        rclass = ('POSIXct', 'POSIXt')
+    if valid is not None:
+        res[~valid] = _NA_REAL
+    res = _new_vector(rinterface.FloatSexpVector, res)
+    res.rclass = rinterface.StrSexpVector(rclass)
+    if rclass[0] == 'POSIXct':
+        res.do_slot_assign('tzone', rinterface.StrSexpVector([tz]))
+    return res
+
+
+def _import(c_schema, c_array, owner):
+    fmt = ffi.string(c_schema.format).decode('utf-8')
+    if c_schema.dictionary != ffi.NULL:
+        if fmt not in _INT_FORMATS and fmt not in ('l', 'L', 'I'):
+            raise ValueError(f'Invalid Arrow format for indices: {fmt}')
+        valid = _valid(c_array)
+        codes = _buffer_values(
+            c_array, 1, _INT_FORMATS.get(fmt) or _FLOAT_FORMATS[fmt],
+            c_array.length
+        ).astype('int32') + 1
+        if valid is not None:
+            codes[~valid] = _NA_INTEGER
+        levels = _import(c_schema.dictionary, c_array.dictionary, owner)
+        if levels.typeof != RTYPES.STRSXP:
+            levels = rinterface.baseenv['as.character'](levels)
+        res = _new_vector(rinterface.IntSexpVector, codes)
+        res.do_slot_assign('levels', levels)
+        if c_schema.flags & ARROW_FLAG_DICTIONARY_ORDERED:
+            res.rclass = rinterface.StrSexpVector(('ordered', 'factor'))
+        else:
+            res.rclass = rinterface.StrSexpVector(('factor', ))
+        return res
+    elif fmt == 'n':
+        res = numpy.full(c_array.length, _NA_INTEGER, dtype='int32')
+        return _new_vector(rinterface.BoolSexpVector, res)
+    elif fmt == 'b':
+        return _import_bool(c_array)
+    elif fmt in _INT_FORMATS or fmt in _FLOAT_FORMATS:
+        return _import_numeric(fmt, c_array, owner)
+    elif fmt in ('u', 'U'):
+        return _import_str(fmt, c_array)
+    elif fmt in ('tdD', 'tdm') or fmt.startswith('ts'):
+        return _import_temporal(fmt, c_array)
+    elif fmt == '+s':
+        if c_array.offset != 0:
+            raise ValueError('Struct arrays with an offset are not supported.')
+        names = []
+        columns = []
+        for i in range(c_schema.n_children):
+            names.append(
+                ffi.string(c_schema.children[i].name).decode('utf-8')
+            )
+            columns.append(
+                _import(c_schema.children[i], c_array.children[i], owner)
+            )
+        return rinterface.dataframe_from_columns(columns, names)
+    raise ValueError(f'Arrow arrays of format "{fmt}" cannot be '
+                     'converted to R objects.')
+
+
+def import_from_c(array_address: int, schema_address: int):
+    """Import an R object from C structures of the Arrow C Data Interface.
+
+    The structures at the addresses are moved (the producer no longer
+    needs to release them). Struct arrays (for example record batches)
+    are imported as data frames."""
+    imported = _ImportedArray()
+    ffi.memmove(imported.c_schema,
+                ffi.cast('struct ArrowSchema *', schema_address),
+                ffi.sizeof('struct ArrowSchema'))
+    ffi.cast('struct ArrowSchema *', schema_address).release = ffi.NULL
+    ffi.memmove(imported.c_array,
+                ffi.cast('struct ArrowArray *', array_address),
+                ffi.sizeof('struct ArrowArray'))
+    ffi.cast('struct ArrowArray *', array_address).release = ffi.NULL
+    return _import(imported.c_schema, imported.c_array, imported)
+
+
+def arrow2rpy(obj):
+    """Convert a pyarrow Array, ChunkedArray, RecordBatch, or Table
+    to an R vector or data frame."""
+    if isinstance(obj, pyarrow.ChunkedArray):
+        obj = obj.combine_chunks()
+    elif isinstance(obj, pyarrow.Table):
+        columns = [arrow2rpy(column) for column in obj.columns]
+        return rinterface.dataframe_from_columns(columns, obj.column_names)
+    imported = _ImportedArray()
+    array_address = int(ffi.cast('uintptr_t', imported.c_array))
+    schema_address = int(ffi.cast('uintptr_t', imported.c_schema))
+    obj._export_to_c(array_address, schema_address)
+    return _import(imported.c_schema, imported.c_array, imported)
+
+
+converter = conversion.Converter('original arrow conversion')
+py2rpy = converter.py2rpy
+rpy2py = converter.rpy2py
+
+
+@py2rpy.register(pyarrow.Array)
+@py2rpy.register(pyarrow.ChunkedArray)
+@py2rpy.register(pyarrow.RecordBatch)
+@py2rpy.register(pyarrow.Table)
+def py2rpy_arrow(obj):
+    return arrow2rpy(obj)
+
+
+@rpy2py.register(rinterface.BoolSexpVector)
+@rpy2py.register(rinterface.FloatSexpVector)
+@rpy2py.register(rinterface.StrSexpVector)
+def rpy2py_vector(obj):
+    return rpy2arrow(obj)
+
+
+converter._rpy2py_nc_map.update(
+    {
+        rinterface.IntSexpVector: conversion.NameClassMap(
+            rpy2arrow
+        ),
+        rinterface.ListSexpVector: conversion.NameClassMap(
+            ro.vectors.ListVector,
+            {'data.frame': rpy2arrow}
+        )
+    }
+)
@@ -0,0 +1,283 @@
+"""Fork server for processes starting with an initialized embedded R.
+
+Initializing the embedded R and importing R packages can take seconds.
+A :class:`ForkServer` is a process that does it once, and then creates
+new processes with :func:`os.fork`. The new processes start with the
+R session of the server (shared copy-on-write with the server until
+modified), with its packages imported and its conversion rules active::
+
+  from rpy2.robjects.forkserver import ForkServer
+
+  def task(conn, n):
+      import rpy2.robjects as robjects
+      conn.send(tuple(robjects.r['rnorm'](n)))
+
+  with ForkServer(packages=('stats', )) as server:
+      process = server.fork(task, 10)
+      res = process.conn.recv()
+
+The server is started with the "spawn" method of :mod:`multiprocessing`,
+and has no other threads than its main thread when it forks. Forking
+is only available on POSIX systems.
+
+A :class:`ForkServer` can also start the processes of a
+:class:`rpy2.robjects.pool.WorkerPool`.
+"""
+
+import importlib
+import multiprocessing
+import multiprocessing.connection
+import os
+import pickle
+import signal
+import sys
+import threading
+import time
+import traceback
+import typing
+from multiprocessing import reduction
+
+
+def _resolve(name: str) -> typing.Any:
+    """Get an object from its name ("module.name:attribute")."""
+    modname, _, attr = name.partition(':')
+    res = importlib.import_module(modname)
+    if attr:
+        for x in attr.split('.'):
+            res = getattr(res, x)
+    return res
+
+
+def _picklable_exception(e: BaseException) -> BaseException:
+    try:
+        pickle.dumps(e)
+        return e
+    except Exception:
+        return RuntimeError(f'{type(e).__name__}: {e}')
+
+
+def _child_main(fd: int, target: typing.Callable, args: tuple) -> None:
+    """Run the target in a process forked by the server."""
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    status = 0
+    try:
+        import rpy2.rinterface as rinterface
+        # Without a seed, R seeds its random number generator with the
+        # time and the process ID. Otherwise all processes would draw the
+        # same random numbers.
+        rinterface.evalr(
+            'if (exists(".Random.seed", envir=globalenv(), inherits=FALSE)) '
+            'rm(".Random.seed", envir=globalenv())'
+        )
+        conn = multiprocessing.connection.Connection(fd)
+        target(conn, *args)
+    except BaseException:
+        traceback.print_exc()
+        status = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # The child exits without R's cleanup at exit (R's temporary
+        # directory for example is the one of the server).
+        os._exit(status)
+
+
+def _server_main(conn, packages: typing.Sequence[str],
+                 preload: typing.Sequence[str],
+                 converter: typing.Optional[str]) -> None:
+    """Main loop for the server process."""
+    try:
+        import rpy2.robjects
+        from rpy2.robjects import conversion
+        from rpy2.robjects.packages import importr
+        for name in preload:
+            importlib.import_module(name)
+        for name in packages:
+            importr(name)
+        if converter is not None:
+            conversion.set_conversion(
+                rpy2.robjects.default_converter + _resolve(converter)
+            )
+    except BaseException as e:
+        conn.send(('error', _picklable_exception(e)))
+        return
+    conn.send(('ok', os.getpid()))
+    # Forked processes are reaped by the system.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    while True:
+        try:
+            msg = conn.recv()
+        except EOFError:
+            break
+        if msg is None:
+            break
+        target, args = msg
+        fd = reduction.recv_handle(conn)
+        # This is the only thread using R in the server, and R's memory
+        # is in a coherent state when forking (no need for R's lock).
+        try:
+            pid = os.fork()
+        except OSError as e:
+            os.close(fd)
+            conn.send(('error', e))
+            continue
+        if pid == 0:
+            conn.close()
+            _child_main(fd, target, args)
+        os.close(fd)
+        conn.send(('ok', pid))
+
+
+class ForkedProcess(object):
+    """Process forked by a :class:`ForkServer`.
+
+    The process is a child of the server, and not of the process that
+    requested it. :meth:`join` waits by polling whether it still exists.
+    """
+
+    __slots__ = ('pid', 'conn')
+
+    def __init__(self, pid: int, conn: multiprocessing.connection.Connection):
+        self.pid = pid
+        self.conn = conn
+
+    def is_alive(self) -> bool:
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def join(self, timeout: typing.Optional[float] = None,
+             interval: float = .01) -> None:
+        """Wait until the process has exited, or until timeout (seconds)."""
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        while self.is_alive():
+            if timeout is not None and time.monotonic() > deadline:
+                break
+            time.sleep(interval)
+
+
+class ForkServer(object):
+    """Process with an embedded R, forking new processes on request.
+
+    :param packages: names of R packages imported (with
+      :func:`rpy2.robjects.packages.importr`) in the server.
+    :param preload: names of Python modules imported in the server
+      (for example `"rpy2.robjects.pandas2ri"`).
+    :param converter: name of conversion rules added to the default
+      conversion rules in the server, as "module.name:attribute" (for
+      example `"rpy2.robjects.pandas2ri:converter"`).
+    """
+
+    def __init__(self, packages: typing.Sequence[str] = (),
+                 preload: typing.Sequence[str] = (),
+                 converter: typing.Optional[str] = None):
+        if not hasattr(os, 'fork'):
+            raise NotImplementedError(
+                'A fork server requires os.fork() (POSIX systems).'
+            )
+        self._packages = tuple(packages)
+        self._preload = tuple(preload)
+        self._converter = converter
+        self._mp_context = multiprocessing.get_context('spawn')
+        self._process: typing.Optional[
+            multiprocessing.process.BaseProcess
+        ] = None
+        self._conn: typing.Optional[
+            multiprocessing.connection.Connection
+        ] = None
+        self._lock = threading.Lock()
+
+    @property
+    def process(self) -> typing.Optional[multiprocessing.process.BaseProcess]:
+        """The server process (None until started)."""
+        return self._process
+
+    def _start(self) -> None:
+        # The caller must hold self._lock.
+        parent_conn, child_conn = self._mp_context.Pipe()
+        process = self._mp_context.Process(
+            target=_server_main,
+            args=(child_conn, self._packages, self._preload,
+                  self._converter),
+            name='rpy2-forkserver',
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        try:
+            status, value = parent_conn.recv()
+        except EOFError:
+            status, value = ('error', None)
+        if status != 'ok':
+            parent_conn.close()
+            process.join()
+            raise RuntimeError(
+                f'The fork server failed to start: {value}'
+            ) from value
+        self._process = process
+        self._conn = parent_conn
+
+    def start(self) -> None:
+        """Start the server (if not already started).
+
+        This is done by the first call to :meth:`fork` otherwise."""
+        with self._lock:
+            if self._process is None:
+                self._start()
+
+    def fork(self, target: typing.Callable, *args) -> ForkedProcess:
+        """Fork a process running `target(conn, *args)`.
+
+        `target` and `args` must be picklable, and `conn` is a
+        :class:`multiprocessing.connection.Connection` to the
+        :attr:`ForkedProcess.conn` returned."""
+        parent_conn, child_conn = multiprocessing.Pipe()
+        with self._lock:
+            if self._process is None:
+                self._start()
+            process, conn = self._process, self._conn
+            assert process is not None and conn is not None
+            try:
+                conn.send((target, args))
+                reduction.send_handle(conn, child_conn.fileno(), process.pid)
+                status, value = conn.recv()
+            except (EOFError, OSError) as e:
+                parent_conn.close()
+                raise RuntimeError('The fork server has exited.') from e
+            finally:
+                child_conn.close()
+        if status != 'ok':
+            parent_conn.close()
+            raise value
+        return ForkedProcess(value, parent_conn)
+
+    def shutdown(self) -> None:
+        """Stop the server.
+
+        Processes already forked keep running."""
+        with self._lock:
+            process, conn = self._process, self._conn
+            if process is None:
+                return
+            assert conn is not None
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+            conn.close()
+            process.join()
+            self._process = None
+            self._conn = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        return False
@@ -1,3 +1,4 @@
+import concurrent.futures
 import inspect
 import os
 import re
@@ -9,6 +10,8 @@ from collections import OrderedDict
 from rpy2.robjects.robject import RObjectMixin
 import rpy2.rinterface as rinterface
 import rpy2.rinterface_lib.sexp
+import rpy2.rinterface_lib._rinterface_capi as _rinterface_capi
+from rpy2.rinterface_lib import executor
 from rpy2.robjects import help
 from rpy2.robjects import conversion
 from rpy2.robjects.vectors import Vector
@@ -27,6 +30,19 @@ __args = baseenv_ri.find('args')
 __is_null = baseenv_ri.find('is.null')
 
 
+def _py2rpy_arguments(args, kwargs):
+    cv = conversion.get_conversion()
+    new_args = [cv.py2rpy(a) for a in args]
+    new_kwargs = {}
+    for k, v in kwargs.items():
+        # TODO: shouldn't this be handled by the conversion itself ?
+        if isinstance(v, rinterface.Sexp):
+            new_kwargs[k] = v
+        else:
+            new_kwargs[k] = cv.py2rpy(v)
+    return new_args, new_kwargs
+
+
 def _formals_fixed(func):
     if func.typeof in (rpy2.rinterface_lib.sexp.RTYPES.SPECIALSXP,
                        rpy2.rinterface_lib.sexp.RTYPES.BUILTINSXP):
@@ -41,20 +57,33 @@ def _formals_fixed(func):
 # docstring_property and DocstringProperty
 # from Bradley Froehle
 # https://gist.github.com/bfroehle/4041015
-def docstring_property(class_doc):
+def docstring_property(class_doc, cached=False):
     def wrapper(fget):
-        return DocstringProperty(class_doc, fget)
+        return DocstringProperty(class_doc, fget, cached=cached)
     return wrapper
 
 
 class DocstringProperty(object):
-    def __init__(self, class_doc, fget):
+    """ Docstring computed on access for instances.
+
+    With `cached` true, the docstring is computed on the first access
+    and stored in the instance. """
+
+    def __init__(self, class_doc, fget, cached=False):
         self.fget = fget
         self.class_doc = class_doc
+        self.cached = cached
 
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self.class_doc
+        elif self.cached:
+            try:
+                return obj.__dict__['_docstring']
+            except KeyError:
+                res = self.fget(obj)
+                obj.__dict__['_docstring'] = res
+                return res
         else:
             return self.fget(obj)
 
@@ -88,6 +117,21 @@ def _repr_argval(obj):
     return s
 
 
+class PreparedCall(rinterface.PreparedCall):
+    """ Call to an R function prepared for repeated evaluation,
+    with the conversion of its arguments and result. """
+
+    __slots__ = ()
+
+    def __call__(self, *values):
+        cv = conversion.get_conversion()
+        new_values = [v if isinstance(v, rinterface.Sexp) else cv.py2rpy(v)
+                      for v in values]
+        res = self.rcall(new_values)
+        res = cv.rpy2py(res)
+        return res
+
+
 class Function(RObjectMixin, rinterface.SexpClosure):
     """ Python representation of an R function.
     """
@@ -96,13 +140,17 @@ class Function(RObjectMixin, rinterface.SexpClosure):
     __assymbol = baseenv_ri.find('as.symbol')
     __newenv = baseenv_ri.find('new.env')
 
-    _local_env = None
+    __local_env = None
 
-    def __init__(self, *args, **kwargs):
-        super(Function, self).__init__(*args, **kwargs)
-        self._local_env = self.__newenv(
-            hash=rinterface.BoolSexpVector((True, ))
-        )
+    @property
+    def _local_env(self) -> rinterface.SexpEnvironment:
+        # Created on first access rather than for each instance, as
+        # creating it requires an evaluation in R.
+        if self.__local_env is None:
+            self.__local_env = self.__newenv(
+                hash=rinterface.BoolSexpVector((True, ))
+            )
+        return self.__local_env
 
     @docstring_property(__doc__)
     def __doc__(self) -> str:
@@ -120,18 +168,24 @@ class Function(RObjectMixin, rinterface.SexpClosure):
 
     def __call__(self, *args, **kwargs):
         cv = conversion.get_conversion()
-        new_args = [cv.py2rpy(a) for a in args]
-        new_kwargs = {}
-        for k, v in kwargs.items():
-            # TODO: shouldn't this be handled by the conversion itself ?
-            if isinstance(v, rinterface.Sexp):
-                new_kwargs[k] = v
-            else:
-                new_kwargs[k] = cv.py2rpy(v)
+        new_args, new_kwargs = _py2rpy_arguments(args, kwargs)
         res = super(Function, self).__call__(*new_args, **new_kwargs)
         res = cv.rpy2py(res)
         return res
 
+    def submit(self, *args, **kwargs) -> concurrent.futures.Future:
+        """ Call the R function in the thread running R.
+
+        The arguments and the result are converted in the conversion
+        thread of the executor for R, so that the conversions for a call
+        overlap with the evaluation in R of the previous call. See
+        rpy2.rinterface_lib.executor.RExecutor.submit_call(). """
+        return executor.get_executor().submit_call(
+            super(Function, self).__call__, args, kwargs,
+            prepare=_py2rpy_arguments,
+            finish=lambda res: conversion.get_conversion().rpy2py(res)
+        )
+
     def formals(self):
         """ Return the signature of the underlying R function
         (as the R function 'formals()' would).
@@ -150,64 +204,139 @@ class Function(RObjectMixin, rinterface.SexpClosure):
         res = super(Function, self).rcall(keyvals, environment=environment)
         return res
 
+    def prepare(
+            self,
+            names: typing.Sequence[typing.Optional[str]] = ()
+    ) -> PreparedCall:
+        """ Prepare a call to the R function for repeated evaluation.
+
+        The arguments and the result of the prepared call are converted
+        like for a call to the function. See
+        rpy2.rinterface.SexpClosure.prepare(). """
+        return PreparedCall(self, names)
+
+
+# Translated signatures of R functions (mapping of R parameter names
+# to Python names), indexed by the R ID of the function and then by the
+# arguments used for the translation. Building a translation requires
+# calling R's `formals()`, and functions returned from R or exposed by
+# R packages are often translated several times. Entries are dropped when
+# rpy2 no longer protects the R function since R may then collect it and
+# reuse its address.
+_SIGNATURE_CACHE: typing.Dict[int, typing.Dict[tuple, OrderedDict]] = {}
+
+
+def _evict_signature(rid: int) -> None:
+    _SIGNATURE_CACHE.pop(rid, None)
+
+
+_rinterface_capi._RELEASE_HOOKS.append(_evict_signature)
+
 
 class SignatureTranslatedFunction(Function):
     """ Python representation of an R function, where
     the names in named argument are translated to valid
     argument names in Python. """
     _prm_translate: Union[OrderedDict, dict] = {}
+    # Whether the translation of the signature had conflicts.
+    _prm_translate_conflicts = False
 
     def __init__(self, sexp: rinterface.SexpClosure,
                  init_prm_translate=None,
                  on_conflict='warn',
                  symbol_r2python=default_symbol_r2python,
-                 symbol_resolve=default_symbol_resolve):
+                 symbol_resolve=default_symbol_resolve,
+                 prm_translate=None):
+        """ The signature of the R function is translated, unless its
+        translation is given as `prm_translate` (for example from a cache
+        - see rpy2.robjects.packages_cache). `init_prm_translate` is a
+        translation to start from. """
         super(SignatureTranslatedFunction, self).__init__(sexp)
-        if init_prm_translate is None:
-            self._prm_translate = OrderedDict()
+        if prm_translate is not None:
+            self._prm_translate = OrderedDict(prm_translate)
+        elif init_prm_translate is None:
+            cache_key = (on_conflict, symbol_r2python, symbol_resolve)
+            cached = _SIGNATURE_CACHE.get(self.rid, {}).get(cache_key)
+            if cached is not None:
+                self._prm_translate = OrderedDict(cached)
+            else:
+                self._prm_translate = OrderedDict()
+                if self._translate_signature(on_conflict, symbol_r2python,
+                                             symbol_resolve):
+                    (_SIGNATURE_CACHE.setdefault(self.rid, {})
+                     [cache_key]) = OrderedDict(self._prm_translate)
+                else:
+                    self._prm_translate_conflicts = True
         else:
             assert isinstance(init_prm_translate, dict)
             self._prm_translate = init_prm_translate
-
-        formals = self.formals()
-        if formals.__sexp__._cdata != rinterface.NULL.__sexp__._cdata:
-            (symbol_mapping,
-             conflicts,
-             resolutions) = _map_symbols(
-                 formals.names,
-                 translation=self._prm_translate,
-                 symbol_r2python=symbol_r2python,
-                 symbol_resolve=symbol_resolve)
-
-            msg_prefix = ('Conflict when converting R symbols'
-                          ' in the function\'s signature:\n- ')
-            exception = ValueError
-            _fix_map_symbols(symbol_mapping,
-                             conflicts,
-                             on_conflict,
-                             msg_prefix,
-                             exception)
-            symbol_mapping.update(resolutions)
-            # TODO: Why was this done?
-            # reserved_pynames = set(dir(self))
-
-            self._prm_translate.update((k, v[0])
-                                       for k, v in symbol_mapping.items())
+            if not self._translate_signature(on_conflict, symbol_r2python,
+                                             symbol_resolve):
+                self._prm_translate_conflicts = True
         if hasattr(sexp, '__rname__'):
             # TODO: mypy does not use the line above and trips on
             # __rname__ being not always present.
             self.__rname__ = sexp.__rname__  # type: ignore
 
-    def __call__(self, *args, **kwargs):
+    def _translate_signature(self, on_conflict, symbol_r2python,
+                             symbol_resolve) -> bool:
+        """ Add the translation of the R function's signature to
+        `_prm_translate`. Return False if there were conflicts. """
+        formals = self.formals()
+        if formals.__sexp__._cdata == rinterface.NULL.__sexp__._cdata:
+            return True
+        (symbol_mapping,
+         conflicts,
+         resolutions) = _map_symbols(
+             formals.names,
+             translation=self._prm_translate,
+             symbol_r2python=symbol_r2python,
+             symbol_resolve=symbol_resolve)
+
+        msg_prefix = ('Conflict when converting R symbols'
+                      ' in the function\'s signature:\n- ')
+        exception = ValueError
+        _fix_map_symbols(symbol_mapping,
+                         conflicts,
+                         on_conflict,
+                         msg_prefix,
+                         exception)
+        symbol_mapping.update(resolutions)
+        # TODO: Why was this done?
+        # reserved_pynames = set(dir(self))
+
+        self._prm_translate.update((k, v[0])
+                                   for k, v in symbol_mapping.items())
+        return not conflicts
+
+    def _translate_kwargs(self, kwargs: dict) -> dict:
         prm_translate = self._prm_translate
         for k in tuple(kwargs.keys()):
             r_k = prm_translate.get(k, None)
             if r_k is not None:
                 v = kwargs.pop(k)
                 kwargs[r_k] = v
+        return kwargs
+
+    def __call__(self, *args, **kwargs):
+        kwargs = self._translate_kwargs(kwargs)
         return (super(SignatureTranslatedFunction, self)
                 .__call__(*args, **kwargs))
 
+    def submit(self, *args, **kwargs) -> concurrent.futures.Future:
+        kwargs = self._translate_kwargs(kwargs)
+        return (super(SignatureTranslatedFunction, self)
+                .submit(*args, **kwargs))
+
+    def prepare(
+            self,
+            names: typing.Sequence[typing.Optional[str]] = ()
+    ) -> PreparedCall:
+        prm_translate = self._prm_translate
+        return (super(SignatureTranslatedFunction, self)
+                .prepare([prm_translate.get(k, k) if k is not None else None
+                          for k in names]))
+
 
 pattern_link = re.compile(r'\\link\{(.+?)\}')
 pattern_code = re.compile(r'\\code\{(.+?)\}')
@@ -218,15 +347,17 @@ class DocumentedSTFunction(SignatureTranslatedFunction):
 
     def __init__(self, sexp: rinterface.SexpClosure,
                  init_prm_translate=None,
-                 packagename: typing.Optional[str] = None):
+                 packagename: typing.Optional[str] = None,
+                 prm_translate=None):
         super(DocumentedSTFunction,
               self).__init__(sexp,
-                             init_prm_translate=init_prm_translate)
+                             init_prm_translate=init_prm_translate,
+                             prm_translate=prm_translate)
         self.__rpackagename__ = packagename
 
-    @docstring_property(__doc__)
+    @docstring_property(__doc__, cached=True)
     def __doc__(self):
-        package = help.Package(self.__rpackagename__)
+        package = help.get_package(self.__rpackagename__)
         page = package.fetch(self.__rname__)
 
         doc = ['Wrapper around an R function.',
@@ -2,14 +2,17 @@
 R help system.
 
 """
+import logging
 import os
 from collections import namedtuple
 import re
 import sqlite3
+import threading
 import typing
 import warnings
 
 import rpy2.rinterface as rinterface
+import rpy2.situation
 from rpy2.rinterface import StrSexpVector
 
 from rpy2.robjects.packages_utils import (get_packagepath,
@@ -17,6 +20,10 @@ from rpy2.robjects.packages_utils import (get_packagepath,
                                           _packages)
 from collections import OrderedDict
 
+logger = logging.getLogger(__name__)
+
+ENVVAR_HELP_INDEX: str = 'RPY2_HELP_INDEX'
+
 tmp = rinterface.baseenv['R.Version']()
 tmp_major = int(tmp[tmp.do_slot('names').index('major')][0])
 tmp_minor = float(tmp[tmp.do_slot('names').index('minor')][0])
@@ -73,63 +80,135 @@ def _Rd2txt(section_doc):
     return section_rows
 
 
-def create_metaRd_db(dbcon) -> None:
-    """ Create an database to store R help pages.
+def create_metaRd_db(dbcon) -> bool:
+    """ Create an database to store R help pages (if not already existing).
 
     dbcon: database connection (assumed to be SQLite - may or may not work
            with other databases)
+
+    Returns whether the database has a table for full-text search (this
+    requires the extension FTS5 for SQLite).
     """
     dbcon.execute('''
-CREATE TABLE package (
-name TEXT UNIQUE,
+CREATE TABLE IF NOT EXISTS package (
+name TEXT,
+path TEXT UNIQUE,
 title TEXT,
 version TEXT,
-description TEXT
+description TEXT,
+stamp TEXT
 );
 ''')
     dbcon.execute('''
-CREATE TABLE rd_meta (
-id INTEGER, file TEXT UNIQUE, name TEXT, type TEXT, title TEXT, encoding TEXT,
+CREATE TABLE IF NOT EXISTS rd_meta (
+id INTEGER, file TEXT, name TEXT, type TEXT, title TEXT, encoding TEXT,
 package_rowid INTEGER
 );
 ''')
     dbcon.execute('''
-CREATE INDEX type_idx ON rd_meta (type);
+CREATE INDEX IF NOT EXISTS rd_meta_idx ON rd_meta (package_rowid, id);
 ''')
     dbcon.execute('''
-CREATE TABLE rd_alias_meta (
-rd_meta_rowid INTEGER, alias TEXT
+CREATE INDEX IF NOT EXISTS type_idx ON rd_meta (type);
+''')
+    dbcon.execute('''
+CREATE TABLE IF NOT EXISTS rd_alias_meta (
+package_rowid INTEGER, rd_meta_id INTEGER, alias TEXT
 );
 ''')
     dbcon.execute('''
-CREATE INDEX alias_idx ON rd_alias_meta (alias);
+CREATE INDEX IF NOT EXISTS alias_idx ON rd_alias_meta (alias);
+''')
+    try:
+        dbcon.execute('''
+CREATE VIRTUAL TABLE IF NOT EXISTS rd_fts USING fts5 (
+package_rowid UNINDEXED, rd_meta_id UNINDEXED, title, aliases, keywords
+);
 ''')
-    dbcon.commit()
+        has_fts = True
+    except sqlite3.OperationalError:
+        # SQLite without FTS5.
+        has_fts = False
+    return has_fts
+
+
+def _has_fts(dbcon) -> bool:
+    return dbcon.execute(
+        "SELECT 1 FROM sqlite_master WHERE name='rd_fts'"
+    ).fetchone() is not None
+
+
+def _package_stamp(package_path: str) -> typing.Optional[str]:
+    """ Stamp for the installation of a package (version and time of
+    installation of its help pages), or None if it has no help pages. """
+    try:
+        mtime = os.stat(os.path.join(package_path, __rd_meta)).st_mtime_ns
+    except OSError:
+        return None
+    version = None
+    try:
+        with open(os.path.join(package_path, 'DESCRIPTION'),
+                  encoding='utf-8', errors='replace') as fh:
+            for row in fh:
+                if row.startswith('Version:'):
+                    version = row[len('Version:'):].strip()
+                    break
+    except OSError:
+        pass
+    return f'{version}:{mtime}'
+
+
+def _sql_str(x) -> typing.Optional[str]:
+    return None if x is rinterface.NA_Character else x
+
+
+def _delete_package(dbcon, package_rowid: int) -> None:
+    dbcon.execute('DELETE FROM rd_meta WHERE package_rowid=?',
+                  (package_rowid, ))
+    dbcon.execute('DELETE FROM rd_alias_meta WHERE package_rowid=?',
+                  (package_rowid, ))
+    if _has_fts(dbcon):
+        dbcon.execute('DELETE FROM rd_fts WHERE package_rowid=?',
+                      (package_rowid, ))
+    dbcon.execute('DELETE FROM package WHERE rowid=?', (package_rowid, ))
 
 
 def populate_metaRd_db(package_name: str, dbcon,
-                       package_path: typing.Optional[str] = None) -> None:
+                       package_path: typing.Optional[str] = None) -> int:
     """ Populate a database with the meta-information
     associated with an R package: version, description, title, and
     aliases (those are what the R help system is organised around).
 
+    Entries already in the database for the package (installed at the
+    same path) are replaced.
+
     - package_name: a string
     - dbcon: a database connection
     - package_path: path the R package installation (default: None)
+
+    Returns the rowid of the package in the table "package".
     """
     if package_path is None:
         package_path = get_packagepath(package_name)
+    stamp = _package_stamp(package_path)
 
     rpath = StrSexpVector((os.path.join(package_path,
                                         __package_meta),))
 
     rds = readRDS(rpath)
     desc = rds[rds.do_slot('names').index('DESCRIPTION')]
-    db_res = dbcon.execute('insert into package values (?,?,?,?)',
-                           (desc[desc.do_slot('names').index('Package')],
-                            desc[desc.do_slot('names').index('Title')],
-                            desc[desc.do_slot('names').index('Version')],
-                            desc[desc.do_slot('names').index('Description')],
+    desc_names = desc.do_slot('names')
+    row = dbcon.execute('SELECT rowid FROM package WHERE path=?',
+                        (package_path, )).fetchone()
+    if row is not None:
+        _delete_package(dbcon, row[0])
+    db_res = dbcon.execute('INSERT INTO package VALUES (?,?,?,?,?,?)',
+                           (desc[desc_names.index('Package')],
+                            package_path,
+                            desc[desc_names.index('Title')],
+                            desc[desc_names.index('Version')],
+                            desc[desc_names.index('Description')],
+                            stamp
                             ))
     package_rowid = db_res.lastrowid
 
@@ -137,25 +216,287 @@ def populate_metaRd_db(package_name: str, dbcon,
                                         __rd_meta),))
 
     rds = readRDS(rpath)
-    FILE_I = rds.do_slot("names").index('File')
-    NAME_I = rds.do_slot("names").index('Name')
-    TYPE_I = rds.do_slot("names").index('Type')
-    TITLE_I = rds.do_slot("names").index('Title')
-    ENCODING_I = rds.do_slot("names").index('Encoding')
-    ALIAS_I = rds.do_slot("names").index('Aliases')
-    for row_i in range(len(rds[0])):
-        db_res = dbcon.execute('insert into rd_meta values (?,?,?,?,?,?,?)',
-                               (row_i,
-                                rds[FILE_I][row_i],
-                                rds[NAME_I][row_i],
-                                rds[TYPE_I][row_i],
-                                rds[TITLE_I][row_i],
-                                rds[ENCODING_I][row_i],
-                                package_rowid))
-        rd_rowid = db_res.lastrowid
-        for alias in rds[ALIAS_I][row_i]:
-            dbcon.execute('insert into rd_alias_meta values (?,?)',
-                          (rd_rowid, alias))
+    columns = dict(zip(rds.do_slot('names'), rds))
+    files = tuple(columns['File'])
+    names = tuple(columns['Name'])
+    types = tuple(columns['Type'])
+    titles = tuple(_sql_str(x) for x in columns['Title'])
+    encodings = tuple(_sql_str(x) for x in columns['Encoding'])
+    aliases = tuple(tuple(x) for x in columns['Aliases'])
+    dbcon.executemany(
+        'INSERT INTO rd_meta VALUES (?,?,?,?,?,?,?)',
+        ((row_i, files[row_i], names[row_i], types[row_i], titles[row_i],
+          encodings[row_i], package_rowid)
+         for row_i in range(len(files)))
+    )
+    dbcon.executemany(
+        'INSERT INTO rd_alias_meta VALUES (?,?,?)',
+        ((package_rowid, row_i, alias)
+         for row_i, row_aliases in enumerate(aliases)
+         for alias in row_aliases)
+    )
+    if _has_fts(dbcon):
+        keywords: typing.List[typing.List[str]] = [
+            [] for row_i in range(len(files))
+        ]
+        for column in ('Keywords', 'Concepts'):
+            for row_i, x in enumerate(columns.get(column, ())):
+                if isinstance(x, StrSexpVector):
+                    keywords[row_i].extend(str(y) for y in x
+                                           if _sql_str(y) is not None)
+        dbcon.executemany(
+            'INSERT INTO rd_fts VALUES (?,?,?,?,?)',
+            ((package_rowid, row_i, titles[row_i],
+              ' '.join(aliases[row_i]), ' '.join(keywords[row_i]))
+             for row_i in range(len(files)))
+        )
+    return package_rowid
+
+
+class HelpIndex(object):
+    """ Index of the help pages in installed R packages.
+
+    The index is an SQLite database (see :func:`create_metaRd_db`), and
+    the entries for a package are updated when it is installed again (for
+    example with a new version).
+
+    :param path: path to the database (":memory:" for a database in
+      memory).
+    """
+
+    # Version of the schema for the database. Databases with an other
+    # version are emptied.
+    _SCHEMA_VERSION = 1
+
+    def __init__(self, path: str = ':memory:'):
+        self.path = path
+        self._lock = threading.RLock()
+        self._dbcon: typing.Optional[sqlite3.Connection] = None
+        self._fts = False
+
+    def _connect(self) -> sqlite3.Connection:
+        # The caller must hold self._lock.
+        if self._dbcon is None:
+            try:
+                self._dbcon = self._open(self.path)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f'Unable to use the help index {self.path} '
+                               f'({e}). Using an index in memory.')
+                self.path = ':memory:'
+                self._dbcon = self._open(self.path)
+        return self._dbcon
+
+    def _open(self, path: str) -> sqlite3.Connection:
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Transactions are started explicitly.
+        dbcon = sqlite3.connect(path, timeout=30, isolation_level=None,
+                                check_same_thread=False)
+        try:
+            if path != ':memory:':
+                dbcon.execute('PRAGMA journal_mode=WAL')
+                dbcon.execute('PRAGMA synchronous=NORMAL')
+            dbcon.execute('BEGIN IMMEDIATE')
+            schema_version = dbcon.execute(
+                'PRAGMA user_version'
+            ).fetchone()[0]
+            if schema_version != self._SCHEMA_VERSION:
+                for table in ('package', 'rd_meta', 'rd_alias_meta',
+                              'rd_fts'):
+                    dbcon.execute(f'DROP TABLE IF EXISTS {table}')
+                dbcon.execute(
+                    f'PRAGMA user_version = {self._SCHEMA_VERSION}'
+                )
+            self._fts = create_metaRd_db(dbcon)
+            dbcon.execute('COMMIT')
+        except BaseException:
+            dbcon.close()
+            raise
+        return dbcon
+
+    def _stale(self, dbcon, package_path: str,
+               stamp: typing.Optional[str]) -> typing.Optional[int]:
+        """ Rowid of a package if up to date in the index, else None. """
+        row = dbcon.execute('SELECT rowid, stamp FROM package WHERE path=?',
+                            (package_path, )).fetchone()
+        if row is not None and row[1] == stamp:
+            return row[0]
+        return None
+
+    def update(
+            self,
+            packages: typing.Iterable[typing.Tuple[str, str]]
+    ) -> typing.List[int]:
+        """ Index packages that are not in the index or were installed
+        again since they were indexed.
+
+        :param packages: pairs (name, path) of installed packages.
+        Returns the rowids of the packages in the index, in the same
+        order."""
+        packages = tuple((name, os.path.normpath(path))
+                         for name, path in packages)
+        stamps = tuple(_package_stamp(path) for name, path in packages)
+        with self._lock:
+            dbcon = self._connect()
+            res = [self._stale(dbcon, path, stamp)
+                   for (name, path), stamp in zip(packages, stamps)]
+            if None not in res:
+                return typing.cast(typing.List[int], res)
+            dbcon.execute('BEGIN IMMEDIATE')
+            try:
+                for i, ((name, path), stamp) in enumerate(zip(packages,
+                                                              stamps)):
+                    # An other process may have indexed the package.
+                    res[i] = self._stale(dbcon, path, stamp)
+                    if res[i] is None:
+                        res[i] = populate_metaRd_db(name, dbcon,
+                                                    package_path=path)
+                dbcon.execute('COMMIT')
+            except BaseException:
+                dbcon.execute('ROLLBACK')
+                raise
+        assert None not in res
+        return typing.cast(typing.List[int], res)
+
+    def update_installed(self) -> typing.List[typing.Tuple[str, str, int]]:
+        """ Index the packages installed (with help pages) in R's library
+        paths.
+
+        Returns triplets (name, path, rowid) for the installed packages,
+        in the order R finds them."""
+        packages = []
+        for libpath in _libpaths():
+            for name in _packages(**{'all.available': True,
+                                     'lib.loc': StrSexpVector((libpath,))}):
+                path = os.path.join(libpath, name)
+                if _package_stamp(path) is not None:
+                    packages.append((name, path))
+        rowids = self.update(packages)
+        with self._lock:
+            dbcon = self._connect()
+            # Packages removed since indexed.
+            removed = [
+                rowid for rowid, path in dbcon.execute(
+                    'SELECT rowid, path FROM package'
+                ) if not os.path.isdir(path)
+            ]
+            if removed:
+                dbcon.execute('BEGIN IMMEDIATE')
+                try:
+                    for rowid in removed:
+                        _delete_package(dbcon, rowid)
+                    dbcon.execute('COMMIT')
+                except BaseException:
+                    dbcon.execute('ROLLBACK')
+                    raise
+        return [(name, path, rowid)
+                for (name, path), rowid in zip(packages, rowids)]
+
+    def find(self, alias: str,
+             package_rowid: typing.Optional[int] = None
+             ) -> typing.List[typing.Tuple[int, str, str, str]]:
+        """ Find the help pages for an alias.
+
+        Returns tuples (package rowid, file, name, type)."""
+        sql = ('SELECT a.package_rowid, r.file, r.name, r.type '
+               'FROM rd_alias_meta a JOIN rd_meta r '
+               'ON r.package_rowid=a.package_rowid AND r.id=a.rd_meta_id '
+               'WHERE a.alias=?')
+        params: typing.Tuple = (alias, )
+        if package_rowid is not None:
+            sql += ' AND a.package_rowid=?'
+            params += (package_rowid, )
+        sql += ' ORDER BY a.rowid'
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def search(self, query: str,
+               package: typing.Optional[str] = None
+               ) -> typing.List[typing.Tuple[str, str, str]]:
+        """ Full-text search of the titles, aliases, keywords, and
+        concepts of the help pages in the index.
+
+        :param query: a query for SQLite's FTS5 (or a string to look for
+          if SQLite does not have FTS5).
+        :param package: only search the help pages in a package.
+        Returns tuples (package, name, title), the best matches first."""
+        with self._lock:
+            dbcon = self._connect()
+            if self._fts:
+                sql = ('SELECT p.name, r.name, r.title FROM rd_fts f '
+                       'JOIN rd_meta r ON r.package_rowid=f.package_rowid '
+                       'AND r.id=f.rd_meta_id '
+                       'JOIN package p ON p.rowid=f.package_rowid '
+                       'WHERE rd_fts MATCH ?')
+            else:
+                query = f'%{query}%'
+                sql = ('SELECT DISTINCT p.name, r.name, r.title '
+                       'FROM rd_meta r JOIN rd_alias_meta a '
+                       'ON r.package_rowid=a.package_rowid '
+                       'AND r.id=a.rd_meta_id '
+                       'JOIN package p ON p.rowid=r.package_rowid '
+                       'WHERE (r.title LIKE ? OR a.alias LIKE ?)')
+            params: typing.Tuple = ((query, ) if self._fts
+                                    else (query, query))
+            if package is not None:
+                sql += ' AND p.name=?'
+                params += (package, )
+            if self._fts:
+                sql += ' ORDER BY f.rank'
+            return dbcon.execute(sql, params).fetchall()
+
+    def _after_fork_in_child(self) -> None:
+        # SQLite connections cannot be used across fork().
+        self._lock = threading.RLock()
+        self._dbcon = None
+
+
+_index: typing.Optional[HelpIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> HelpIndex:
+    """ Get the index of help pages.
+
+    The index is in rpy2's cache directory
+    (see :func:`rpy2.situation.get_cache_dir`), or in memory when the
+    environment variable RPY2_HELP_INDEX is "0", "false", "no", or
+    "off"."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            value = os.environ.get(ENVVAR_HELP_INDEX, '')
+            if value.lower() in ('0', 'false', 'no', 'off'):
+                _index = HelpIndex()
+            else:
+                _index = HelpIndex(
+                    os.path.join(rpy2.situation.get_cache_dir(),
+                                 'help.sqlite3')
+                )
+        return _index
+
+
+def set_index(index: typing.Optional[HelpIndex]) -> None:
+    """ Set the index of help pages.
+
+    With None, the default index is used the next time one is needed."""
+    global _index
+    with _index_lock:
+        _index = index
+    with _packages_help_lock:
+        _packages_help.clear()
+
+
+def _after_fork_in_child() -> None:
+    global _index_lock, _packages_help_lock
+    _index_lock = threading.Lock()
+    _packages_help_lock = threading.Lock()
+    if _index is not None:
+        _index._after_fork_in_child()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
 
 
 Item = namedtuple('Item', 'name value')
@@ -331,15 +672,21 @@ class Package(object):
             package_path = get_packagepath(package_name)
         self.__package_path = package_path
 
-        rd_meta_dbcon = sqlite3.connect(':memory:')
-        create_metaRd_db(rd_meta_dbcon)
-        populate_metaRd_db(package_name,
-                           rd_meta_dbcon,
-                           package_path=package_path)
-        self._dbcon = rd_meta_dbcon
-
-        path = os.path.join(package_path, 'help', package_name + '.rdx')
-        self._rdx = readRDS(StrSexpVector((path, )))
+        self._index = get_index()
+        self._package_rowid = self._index.update(
+            ((package_name, package_path), )
+        )[0]
+        self.__rdx = None
+
+    @property
+    def _rdx(self):
+        # The index of the help pages in the lazy-load database is only
+        # read when a page is fetched.
+        if self.__rdx is None:
+            path = os.path.join(self.__package_path, 'help',
+                                self.__package_name + '.rdx')
+            self.__rdx = readRDS(StrSexpVector((path, )))
+        return self.__rdx
 
     def fetch(self, alias: str) -> Page:
         """ Fetch the documentation page associated with a given alias.
@@ -350,26 +697,16 @@ class Package(object):
         'AnnotatedDataFrame-class'.
         """
 
-        c = self._dbcon.execute(
-            'SELECT rd_meta_rowid, alias FROM rd_alias_meta WHERE alias=?',
-            (alias, )
-        )
-        res_alias = c.fetchall()
+        res_alias = self._index.find(alias,
+                                     package_rowid=self._package_rowid)
         if len(res_alias) == 0:
             raise HelpNotFoundError(
                 'No help could be fetched',
                 topic=alias, package=self.__package_name
             )
 
-        c = self._dbcon.execute(
-            'SELECT file, name, type FROM rd_meta WHERE rowid=?',
-            (res_alias[0][0], )
-        )
-        # since the selection is on a verified rowid we are sure to
-        # exactly get one row
-        res_all = c.fetchall()
-        rkey = StrSexpVector((res_all[0][0][:-3], ))
-        _type = res_all[0][2]
+        _, rd_file, _, _type = res_alias[0]
+        rkey = StrSexpVector((rd_file[:-3], ))
         rpath = StrSexpVector(
             (os.path.join(self.package_path,
                           'help',
@@ -401,6 +738,24 @@ class Package(object):
         return r
 
 
+_packages_help: typing.Dict[str, Package] = {}
+_packages_help_lock = threading.Lock()
+
+
+def get_package(package_name: str) -> Package:
+    """ Get the documentation for an R package.
+
+    The :class:`Package` is created the first time this function is called
+    for a package, and then shared (for example by the docstrings of the R
+    functions and classes in the package). """
+    with _packages_help_lock:
+        res = _packages_help.get(package_name)
+        if res is None:
+            res = Package(package_name)
+            _packages_help[package_name] = res
+        return res
+
+
 class HelpNotFoundError(KeyError):
     """ Exception raised when an help topic cannot be found. """
     def __init__(self, msg, topic=None, package=None):
@@ -413,21 +768,31 @@ def pages(topic):
     """ Get help pages corresponding to a given topic. """
     res = list()
 
-    for path in _libpaths():
-        for name in _packages(**{'all.available': True,
-                                 'lib.loc': StrSexpVector((path,))}):
-            # TODO: what if the same package is installed
-            #       at different locations ?
-            pack = Package(name)
-            try:
-                page = pack.fetch(topic)
-                res.append(page)
-            except HelpNotFoundError:
-                pass
+    index = get_index()
+    packages = index.update_installed()
+    found = set(x[0] for x in index.find(topic))
+    for name, path, rowid in packages:
+        if rowid not in found:
+            continue
+        pack = Package(name, package_path=path)
+        try:
+            page = pack.fetch(topic)
+            res.append(page)
+        except HelpNotFoundError:
+            pass
 
     return tuple(res)
 
 
+def search(query: str, package: typing.Optional[str] = None
+           ) -> typing.List[typing.Tuple[str, str, str]]:
+    """ Search the help pages of installed R packages (see
+    :meth:`HelpIndex.search`). """
+    index = get_index()
+    index.update_installed()
+    return index.search(query, package=package)
+
+
 def docstring(
         package: Package, alias: str,
         sections: typing.Tuple[str, ...] = (r'\usage',
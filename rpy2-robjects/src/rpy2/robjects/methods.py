@@ -148,6 +148,39 @@ class RS4_Type(abc.ABCMeta):
 
 # playground to experiment with more metaclass-level automation
 
+class RS4ClassDoc(object):
+    """ Docstring for a Python class mapping an R S4 class, copied from
+    the R documentation page for the class on first access. """
+
+    def __init__(self, rname: str, rpackagename: str):
+        self.rname = rname
+        self.rpackagename = rpackagename
+        self._doc: typing.Optional[str] = None
+
+    def __get__(self, obj, objtype=None) -> str:
+        if self._doc is None:
+            self._doc = self._fetch()
+        return self._doc
+
+    def _fetch(self) -> str:
+        pack_help = rhelp.get_package(self.rpackagename)
+        page_help = None
+        try:
+            # R's classes are sometimes documented with a prefix 'class.'
+            page_help = pack_help.fetch('%s-class' % self.rname)
+        except rhelp.HelpNotFoundError:
+            pass
+        if page_help is None:
+            try:
+                page_help = pack_help.fetch(self.rname)
+            except rhelp.HelpNotFoundError:
+                pass
+        if page_help is None:
+            return 'Unable to fetch R documentation for the class'
+        else:
+            return ''.join(page_help.to_docstring())
+
+
 class RS4Auto_Type(abc.ABCMeta):
     """ This type (metaclass) takes an R S4 class
     and create a Python class out of it,
@@ -182,23 +215,9 @@ class RS4Auto_Type(abc.ABCMeta):
         if cls_rpackagename is None:
             cls_dict['__doc__'] = "Undocumented class from the R workspace."
         else:
-            pack_help = rhelp.Package(cls_rpackagename)
-            page_help = None
-            try:
-                # R's classes are sometimes documented with a prefix 'class.'
-                page_help = pack_help.fetch('%s-class' % cls_def.__rname__)
-            except rhelp.HelpNotFoundError:
-                pass
-            if page_help is None:
-                try:
-                    page_help = pack_help.fetch(cls_def.__rname__)
-                except rhelp.HelpNotFoundError:
-                    pass
-            if page_help is None:
-                cls_dict['__doc__'] = ('Unable to fetch R documentation '
-                                       'for the class')
-            else:
-                cls_dict['__doc__'] = ''.join(page_help.to_docstring())
+            # Fetched from the R documentation on first access.
+            cls_dict['__doc__'] = RS4ClassDoc(cls_def.__rname__,
+                                              cls_rpackagename)
 
         for slt_name in cls_def.slots:
             # TODO: sanity check on the slot name
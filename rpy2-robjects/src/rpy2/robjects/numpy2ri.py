@@ -2,6 +2,7 @@ import rpy2.robjects as ro
 import rpy2.robjects.conversion as conversion
 import rpy2.rinterface as rinterface
 import rpy2.rlike.container as rlc
+from rpy2.rinterface_lib import strings
 from rpy2.rinterface import (Sexp,
                              StrSexpVector, ByteSexpVector,
                              RTYPES)
@@ -57,14 +58,46 @@ def numpy_O_py2rpy(o):
     return res
 
 
+# Numpy dtypes (kind, itemsize) for which R vectors can use the memory
+# of the numpy array rather than a copy of it.
+_zerocopy_types = {
+    ('f', 8): rinterface.FloatSexpVector,
+    ('i', 4): rinterface.IntSexpVector,
+}
+
+# Let R vectors use the memory of numpy arrays (with compatible dtypes)
+# rather than copies of it. R copies the data when it modifies such a
+# vector, but changes to the numpy array made from Python are visible in R
+# (for example in fitted models or results already computed), unlike
+# with R's usual value semantics. This is opt-in.
+zerocopy_py2rpy = False
+
+# Let numpy arrays converted from R vectors of booleans, integers, or
+# floats be read-only views on the memory of the R vectors
+# rather than copies of it. The R objects are kept alive as long as the
+# numpy arrays are. This is opt-in.
+zerocopy_rpy2py = False
+
+
+def _flatarray_to_r(a, func):
+    """Convert a 1D numpy array to an R vector, without copying
+    the data when possible."""
+    zerocopy_cls = _zerocopy_types.get((a.dtype.kind, a.dtype.itemsize))
+    if zerocopy_py2rpy and zerocopy_cls is not None:
+        try:
+            return func(
+                zerocopy_cls.from_memoryview(memoryview(a), copy=False)
+            )
+        except ValueError:
+            pass
+    return func(a)
+
+
 def _numpyarray_to_r(a, func):
     # "F" means "use column-major order"
-    vec = func(numpy.ravel(a, order='F'))
+    res = _flatarray_to_r(numpy.ravel(a, order='F'), func)
     # TODO: no dimnames ?
-    # TODO: optimize what is below needed/possible ?
-    #  (other ways to create R arrays ?)
-    dim = ro.vectors.IntVector(a.shape)
-    res = rinterface.baseenv['array'](vec, dim=dim)
+    res.do_slot_assign('dim', ro.vectors.IntVector(a.shape))
     return res
 
 
@@ -214,9 +247,24 @@ def rpy2py_list(obj: rinterface.ListSexpVector):
     return res
 
 
+def _rvector_to_numpy(obj):
+    """Convert an R vector with a numpy interface to a numpy array.
+
+    The array is a read-only view on the R vector's memory if
+    `zerocopy_rpy2py` is True, and a copy otherwise."""
+    if zerocopy_rpy2py:
+        # The base for the array is obj, which keeps the R object
+        # alive.
+        res = numpy.asarray(obj)
+        res.flags.writeable = False
+    else:
+        res = numpy.array(obj)
+    return res
+
+
 @rpy2py.register(rinterface.FloatSexpVector)
 def rpy2py_floatvector(obj):
-    return numpy.array(obj)
+    return _rvector_to_numpy(obj)
 
 
 @rpy2py.register(rinterface.CharSexp)
@@ -229,15 +277,18 @@ def rpy2py_charvector(obj):
 
 @rpy2py.register(rinterface.StrSexpVector)
 def rpy2py_strvector(obj):
-    res = numpy.array(obj)
-    res[res == rinterface.NA_Character] = None
-    return res
+    # The strings are fetched in bulk. NA strings are None, making the
+    # dtype of the array object.
+    return strings.to_numpy(obj.__sexp__._cdata, dtype=None)
 
 
 @rpy2py.register(Sexp)
 def rpy2py_sexp(obj):
     if (obj.typeof in _vectortypes) and (obj.typeof != RTYPES.VECSXP):
-        res = numpy.array(obj)
+        if isinstance(obj, rinterface.SexpVectorWithNumpyInterface):
+            res = _rvector_to_numpy(obj)
+        else:
+            res = numpy.array(obj)
     else:
         res = ro.default_converter.rpy2py(obj)
     return res
@@ -246,7 +297,7 @@ def rpy2py_sexp(obj):
 converter._rpy2py_nc_map.update(
     {
         rinterface.IntSexpVector: conversion.NameClassMap(
-            numpy.array,
+            _rvector_to_numpy,
             {'factor': _factor_to_numpy_string_array}
         ),
         rinterface.ListSexpVector: conversion.NameClassMap(
@@ -16,6 +16,7 @@ from rpy2.robjects.packages_utils import (
                                           _fix_map_symbols
 )
 import rpy2.robjects.help as rhelp
+from rpy2.robjects import packages_cache
 
 _require = rinterface.baseenv['require']
 _library = rinterface.baseenv['library']
@@ -160,11 +161,12 @@ class Package(ModuleType):
      """
 
     _env = None
-    __rname__ = None
-    _translation = None
+    __rname__: typing.Optional[str] = None
+    _translation: typing.Optional[typing.Mapping[str, str]] = None
     _rpy2r = None
     _exported_names = None
-    _symbol_r2python = None
+    _symbol_r2python: typing.Optional[typing.Callable] = None
+    _lazy = False
     __version__: typing.Optional[str] = None
     __rdata__: typing.Optional[PackageData] = None
 
@@ -172,7 +174,8 @@ class Package(ModuleType):
                  exported_names=None, on_conflict='fail',
                  version=None,
                  symbol_r2python=default_symbol_r2python,
-                 symbol_resolve=default_symbol_resolve):
+                 symbol_resolve=default_symbol_resolve,
+                 lazy=False):
         """ Create a Python module-like object from an R environment,
         using the specified translation if defined.
 
@@ -187,6 +190,8 @@ class Package(ModuleType):
                            The default translate `.` into `_`.
         - symbol_resolve: function to check the Python symbols obtained
                           from `symbol_r2python`.
+        - lazy: only map the R symbols to Python symbols, and get and
+                convert the R objects on first access (default: False)
         """
 
         super(Package, self).__init__(name)
@@ -200,17 +205,80 @@ class Package(ModuleType):
         self._exported_names = exported_names
         self._symbol_r2python = symbol_r2python
         self._symbol_resolve = symbol_resolve
+        self._on_conflict = on_conflict
+        self._lazy = lazy
+        self.__version__ = version
         self.__fill_rpy2r__(on_conflict=on_conflict)
         self._exported_names = self._exported_names.difference(mynames)
-        self.__version__ = version
 
     def __update_dict__(self, on_conflict='fail'):
         """ Update the __dict__ according to what is in the R environment """
         for elt in self._rpy2r:
-            del self.__dict__[elt]
+            # Not in the __dict__ if lazy and never accessed.
+            self.__dict__.pop(elt, None)
         self._rpy2r.clear()
+        self._on_conflict = on_conflict
         self.__fill_rpy2r__(on_conflict=on_conflict)
 
+    def __getattr__(self, name):
+        # Only called when the attribute is not found otherwise, that
+        # is for R objects not yet accessed in lazy packages.
+        rpy2r = self._rpy2r
+        if rpy2r is None or name not in rpy2r:
+            raise AttributeError(
+                'module %r has no attribute %r' % (self.__name__, name)
+            )
+        rpyobj = self._rpy2py_symbol(rpy2r[name],
+                                     conversion.get_conversion())
+        self.__dict__[name] = rpyobj
+        self._flush_cache()
+        return rpyobj
+
+    def __dir__(self):
+        res = set(super(Package, self).__dir__())
+        if self._rpy2r is not None:
+            res.update(self._rpy2r)
+        return sorted(res)
+
+    def _rpy2py_symbol(self, rname, cv):
+        """ Get and convert the R object for an R symbol. """
+        try:
+            riobj = self._env[rname]
+        except rinterface.embedded.RRuntimeError as rre:
+            warn(str(rre))
+        rpyobj = cv.rpy2py(riobj)
+        if hasattr(rpyobj, '__rname__'):
+            rpyobj.__rname__ = rname
+        return self._wrap_rpyobj(rname, rpyobj)
+
+    def _wrap_rpyobj(self, rname, rpyobj):
+        """ Wrap an R object converted to Python (for example R functions
+        in classes translating their signature). """
+        return rpyobj
+
+    def _packages_cache(self) -> typing.Optional[
+            typing.Tuple[packages_cache.PackagesCache, str]
+    ]:
+        """ Persistent cache and key for the translation settings, or
+        None if the translation of this package cannot be cached. """
+        if self.__version__ is None or self._translation is None or \
+           self._symbol_r2python is None:
+            return None
+        cache = packages_cache.get_cache()
+        if cache is None:
+            return None
+        settings = packages_cache.settings_key(
+            self._translation, self._on_conflict,
+            self._symbol_r2python, self._symbol_resolve
+        )
+        if settings is None:
+            return None
+        return cache, settings
+
+    def _flush_cache(self) -> None:
+        """ Write new entries to the persistent cache. """
+        pass
+
     def __fill_rpy2r__(self, on_conflict='fail'):
         """ Fill the attribute _rpy2r.
 
@@ -220,14 +288,25 @@ class Package(ModuleType):
 
         name = self.__rname__
 
+        cached = self._packages_cache()
+        mapping = None
+        if cached is not None:
+            cache, settings = cached
+            mapping = cache.get_symbols(name, self.__version__, settings)
+        if mapping is None:
+            mapping = _map_symbols(
+                self._env,
+                translation=self._translation,
+                symbol_r2python=self._symbol_r2python,
+                symbol_resolve=self._symbol_resolve
+            )
+            if cached is not None:
+                # Cached before the conflicts are fixed (this modifies
+                # the mapping).
+                cache.set_symbols(name, self.__version__, settings, mapping)
         (symbol_mapping,
          conflicts,
-         resolutions) = _map_symbols(
-             self._env,
-             translation=self._translation,
-             symbol_r2python=self._symbol_r2python,
-             symbol_resolve=self._symbol_resolve
-         )
+         resolutions) = mapping
         msg_prefix = ('Conflict when converting R symbols'
                       ' in the package "%s"'
                       ' to Python symbols: \n-' % self.__rname__)
@@ -257,15 +336,11 @@ class Package(ModuleType):
             if (rpyname != rname) and (rname in self._exported_names):
                 self._exported_names.remove(rname)
                 self._exported_names.add(rpyname)
-            try:
-                riobj = self._env[rname]
-            except rinterface.embedded.RRuntimeError as rre:
-                warn(str(rre))
-            rpyobj = cv.rpy2py(riobj)
-            if hasattr(rpyobj, '__rname__'):
-                rpyobj.__rname__ = rname
+            if self._lazy:
+                continue
             # TODO: shouldn't the original R name be also in the __dict__ ?
-            self.__dict__[rpyname] = rpyobj
+            self.__dict__[rpyname] = self._rpy2py_symbol(rname, cv)
+        self._flush_cache()
 
     def __repr__(self):
         s = super(Package, self).__repr__()
@@ -280,18 +355,76 @@ class SignatureTranslatedPackage(Package):
     """ R package in which the R functions had their signatures
     'translated' (that this the named parameters were made to
     to conform Python's rules for vaiable names)."""
+
+    # Persistent cache, key for the translation settings, and translated
+    # signatures in the cache (None if not cached).
+    _signatures: typing.Optional[tuple] = None
+    # Translated signatures not yet in the cache.
+    _new_signatures: typing.Optional[dict] = None
+
     def __fill_rpy2r__(self, on_conflict='fail'):
+        self._load_signatures()
         (super(SignatureTranslatedPackage, self)
          .__fill_rpy2r__(on_conflict=on_conflict))
-        for name, robj in self.__dict__.items():
-            if isinstance(robj, rinterface.Sexp) and \
-               robj.typeof == rinterface.RTYPES.CLOSXP:
-                self.__dict__[name] = STF(
-                    self.__dict__[name],
-                    on_conflict=on_conflict,
-                    symbol_r2python=self._symbol_r2python,
-                    symbol_resolve=self._symbol_resolve
-                )
+
+    def _signature_settings(self):
+        """ Settings for the translation of the signatures. """
+        return (self._on_conflict, self._symbol_r2python,
+                self._symbol_resolve)
+
+    def _new_function(self, rpyobj, prm_translate=None):
+        on_conflict, symbol_r2python, symbol_resolve = \
+            self._signature_settings()
+        return STF(
+            rpyobj,
+            on_conflict=on_conflict,
+            symbol_r2python=symbol_r2python,
+            symbol_resolve=symbol_resolve,
+            prm_translate=prm_translate
+        )
+
+    def _load_signatures(self) -> None:
+        self._signatures = None
+        self._new_signatures = {}
+        cached = self._packages_cache()
+        rname, version = self.__rname__, self.__version__
+        if cached is None or rname is None or version is None:
+            return
+        cache = cached[0]
+        settings = packages_cache.settings_key({},
+                                               *self._signature_settings())
+        if settings is None:
+            return
+        self._signatures = (
+            cache, settings,
+            cache.get_signatures(rname, version, settings)
+        )
+
+    def _flush_cache(self) -> None:
+        if self._new_signatures and self._signatures is not None:
+            cache, settings, signatures = self._signatures
+            cache.set_signatures(self.__rname__, self.__version__, settings,
+                                 self._new_signatures)
+            signatures.update(self._new_signatures)
+            self._new_signatures = {}
+
+    def _wrap_rpyobj(self, rname, rpyobj):
+        if isinstance(rpyobj, rinterface.Sexp) and \
+           rpyobj.typeof == rinterface.RTYPES.CLOSXP:
+            if self._signatures is None:
+                rpyobj = self._new_function(rpyobj)
+            else:
+                prm_translate = self._signatures[2].get(rname)
+                rpyobj = self._new_function(rpyobj,
+                                            prm_translate=prm_translate)
+                # Translations with conflicts are not cached (warnings or
+                # errors would then be missing when using the cache).
+                if prm_translate is None and \
+                   not rpyobj._prm_translate_conflicts:
+                    self._new_signatures[rname] = list(
+                        rpyobj._prm_translate.items()
+                    )
+        return rpyobj
 
 
 # alias
@@ -325,16 +458,16 @@ class InstalledSTPackage(SignatureTranslatedPackage):
                 doc.append('[R help was not found]')
         return os.linesep.join(doc)
 
-    def __fill_rpy2r__(self, on_conflict='fail'):
-        (super(SignatureTranslatedPackage, self)
-         .__fill_rpy2r__(on_conflict=on_conflict))
-        for name, robj in self.__dict__.items():
-            if isinstance(robj, rinterface.Sexp) and \
-               robj.typeof == rinterface.RTYPES.CLOSXP:
-                self.__dict__[name] = DocumentedSTFunction(
-                    self.__dict__[name],
-                    packagename=self.__rname__
-                )
+    def _signature_settings(self):
+        # Default settings of DocumentedSTFunction.
+        return ('warn', default_symbol_r2python, default_symbol_resolve)
+
+    def _new_function(self, rpyobj, prm_translate=None):
+        return DocumentedSTFunction(
+            rpyobj,
+            packagename=self.__rname__,
+            prm_translate=prm_translate
+        )
 
 
 class InstalledPackage(Package):
@@ -362,12 +495,13 @@ class WeakPackage(Package):
     """
 
     def __getattr__(self, name):
-        res = self.__dict__.get(name)
-        if res is None:
+        try:
+            return super(WeakPackage, self).__getattr__(name)
+        except AttributeError:
             warnings.warn(
                 "The symbol '%s' is not in this R namespace/package." % name
             )
-        return res
+            return None
 
 
 class LibraryError(ImportError):
@@ -436,7 +570,8 @@ def importr(name: str,
             on_conflict='fail',
             symbol_r2python=default_symbol_r2python,
             symbol_resolve=default_symbol_resolve,
-            data=True):
+            data=True,
+            lazy=False):
     """ Import an R package.
 
     Arguments:
@@ -462,6 +597,10 @@ def importr(name: str,
     - data: embed a PackageData objects under the attribute
       name __rdata__ (default: True)
 
+    - lazy: only map the R symbols in the package to Python symbols,
+      and get and convert R objects when first accessed (default: False).
+      This makes importing packages with many symbols faster.
+
     Return:
 
     - an instance of class SignatureTranslatedPackage, or of class Package
@@ -499,14 +638,16 @@ def importr(name: str,
                                   on_conflict=on_conflict,
                                   version=version,
                                   symbol_r2python=symbol_r2python,
-                                  symbol_resolve=symbol_resolve)
+                                  symbol_resolve=symbol_resolve,
+                                  lazy=lazy)
     else:
         pack = InstalledPackage(env, name, translation=robject_translations,
                                 exported_names=exported_names,
                                 on_conflict=on_conflict,
                                 version=version,
                                 symbol_r2python=symbol_r2python,
-                                symbol_resolve=symbol_resolve)
+                                symbol_resolve=symbol_resolve,
+                                lazy=lazy)
     if data:
         if pack.__rdata__ is not None:
             warn('While importing the R package "%s", the rpy2 Package object '
@@ -0,0 +1,242 @@
+"""Persistent cache for the translation of R symbols in R packages.
+
+Importing an R package with :func:`rpy2.robjects.packages.importr` maps
+the R symbols in the package to Python symbols, and translates the
+signature of each R function (which requires calling R's `formals()`).
+The result only depends on the package, its version, and the translation
+settings, and it is cached in an SQLite database in rpy2's cache directory
+(see :func:`rpy2.situation.get_cache_dir`).
+
+Entries are for a package name and version (R's `getNamespaceVersion()`),
+and entries for other versions of a package are deleted when a new version
+is cached. Only the translations with rpy2's default functions to translate
+R symbols are cached. The cache is disabled when the environment variable
+RPY2_PACKAGES_CACHE is "0", "false", "no", or "off".
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import typing
+import rpy2.situation
+from rpy2.robjects.packages_utils import (default_symbol_r2python,
+                                          default_symbol_resolve)
+from rpy2.robjects.version import __version__
+
+logger = logging.getLogger(__name__)
+
+ENVVAR_PACKAGES_CACHE: str = 'RPY2_PACKAGES_CACHE'
+
+# Version of the schema for the database. Databases with an other version
+# are emptied.
+_SCHEMA_VERSION = 1
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS symbols (
+      package TEXT NOT NULL,
+      version TEXT NOT NULL,
+      settings TEXT NOT NULL,
+      mapping TEXT NOT NULL,
+      PRIMARY KEY (package, version, settings)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS signatures (
+      package TEXT NOT NULL,
+      version TEXT NOT NULL,
+      settings TEXT NOT NULL,
+      rname TEXT NOT NULL,
+      prm_translate TEXT NOT NULL,
+      PRIMARY KEY (package, version, settings, rname)
+    )
+    """
+)
+
+
+def settings_key(translation: typing.Mapping[str, str],
+                 on_conflict: str,
+                 symbol_r2python: typing.Callable,
+                 symbol_resolve: typing.Callable) -> typing.Optional[str]:
+    """Key for translation settings, or None if they cannot be cached.
+
+    Translations with functions to translate R symbols other than the
+    default ones are not cached (their result cannot be known from their
+    name)."""
+    if symbol_r2python is not default_symbol_r2python or \
+       symbol_resolve is not default_symbol_resolve:
+        return None
+    return json.dumps([__version__, on_conflict,
+                       sorted(translation.items())])
+
+
+class PackagesCache(object):
+    """Cache of translated R symbols in an SQLite database."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._dbcon: typing.Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # The caller must hold self._lock.
+        if self._dbcon is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            dbcon = sqlite3.connect(self.path, timeout=10,
+                                    check_same_thread=False)
+            # Commits do not wait for the data to be on disk (losing
+            # recent entries of a cache is harmless).
+            dbcon.execute('PRAGMA journal_mode=WAL')
+            dbcon.execute('PRAGMA synchronous=NORMAL')
+            schema_version = dbcon.execute('PRAGMA user_version').fetchone()[0]
+            with dbcon:
+                if schema_version != _SCHEMA_VERSION:
+                    dbcon.execute('DROP TABLE IF EXISTS symbols')
+                    dbcon.execute('DROP TABLE IF EXISTS signatures')
+                for sql in _SCHEMA:
+                    dbcon.execute(sql)
+                dbcon.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+            self._dbcon = dbcon
+        return self._dbcon
+
+    def _execute(self, func: typing.Callable[[sqlite3.Connection],
+                                             typing.Any]) -> typing.Any:
+        """Run a function with the database, logging and ignoring errors."""
+        with self._lock:
+            try:
+                return func(self._connect())
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f'Error with the packages cache {self.path}: '
+                               f'{e}')
+                return None
+
+    def get_symbols(self, package: str, version: str,
+                    settings: str) -> typing.Optional[tuple]:
+        """Get the mapping of R symbols for a package.
+
+        Returns None if not cached, and otherwise a tuple (symbol_mapping,
+        conflicts, resolutions) like
+        :func:`rpy2.robjects.packages_utils._map_symbols`."""
+        row = self._execute(
+            lambda dbcon: dbcon.execute(
+                'SELECT mapping FROM symbols '
+                'WHERE package=? AND version=? AND settings=?',
+                (package, version, settings)
+            ).fetchone()
+        )
+        if row is None:
+            return None
+        return tuple(json.loads(row[0]))
+
+    def set_symbols(self, package: str, version: str, settings: str,
+                    mapping: tuple) -> None:
+        """Cache the mapping of R symbols for a package (see get_symbols)."""
+        data = json.dumps(mapping)
+
+        def func(dbcon):
+            with dbcon:
+                for table in ('symbols', 'signatures'):
+                    dbcon.execute(
+                        f'DELETE FROM {table} WHERE package=? AND version!=?',
+                        (package, version)
+                    )
+                dbcon.execute(
+                    'INSERT OR REPLACE INTO symbols VALUES (?, ?, ?, ?)',
+                    (package, version, settings, data)
+                )
+        self._execute(func)
+
+    def get_signatures(
+            self, package: str, version: str, settings: str
+    ) -> typing.Dict[str, typing.List[typing.Tuple[str, str]]]:
+        """Get the translated signatures of the R functions in a package.
+
+        Returns a dict with the R names of functions as keys and their
+        translation (pairs of Python and R parameter names) as values."""
+        rows = self._execute(
+            lambda dbcon: dbcon.execute(
+                'SELECT rname, prm_translate FROM signatures '
+                'WHERE package=? AND version=? AND settings=?',
+                (package, version, settings)
+            ).fetchall()
+        )
+        return {rname: [tuple(x) for x in json.loads(prm_translate)]
+                for rname, prm_translate in (rows or ())}
+
+    def set_signatures(
+            self, package: str, version: str, settings: str,
+            signatures: typing.Mapping[str, typing.Sequence[
+                typing.Tuple[str, str]]]
+    ) -> None:
+        """Cache translated signatures of R functions (see get_signatures)."""
+        rows = [(package, version, settings, rname, json.dumps(list(items)))
+                for rname, items in signatures.items()]
+
+        def func(dbcon):
+            with dbcon:
+                dbcon.executemany(
+                    'INSERT OR REPLACE INTO signatures '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    rows
+                )
+        self._execute(func)
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        def func(dbcon):
+            with dbcon:
+                dbcon.execute('DELETE FROM symbols')
+                dbcon.execute('DELETE FROM signatures')
+        self._execute(func)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._dbcon is not None:
+                self._dbcon.close()
+                self._dbcon = None
+
+    def _after_fork_in_child(self) -> None:
+        # SQLite connections cannot be used across fork().
+        self._lock = threading.Lock()
+        self._dbcon = None
+
+
+_cache: typing.Optional[PackagesCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> typing.Optional[PackagesCache]:
+    """Get the cache for R packages (None if disabled)."""
+    global _cache
+    value = os.environ.get(ENVVAR_PACKAGES_CACHE, '')
+    if value.lower() in ('0', 'false', 'no', 'off'):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = PackagesCache(
+                os.path.join(rpy2.situation.get_cache_dir(),
+                             'packages.sqlite3')
+            )
+        return _cache
+
+
+def set_cache(cache: typing.Optional[PackagesCache]) -> None:
+    """Set the cache for R packages.
+
+    With None, the default cache is used the next time one is needed."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def _after_fork_in_child() -> None:
+    global _cache_lock
+    _cache_lock = threading.Lock()
+    if _cache is not None:
+        _cache._after_fork_in_child()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -4,6 +4,8 @@ between R objects handled by rpy2 and pandas objects."""
 import rpy2.robjects.conversion as conversion
 import rpy2.rinterface as rinterface
 from rpy2.rinterface_lib import na_values
+from rpy2.rinterface_lib import sexp
+from rpy2.rinterface_lib import strings
 from rpy2.rinterface import IntSexpVector
 from rpy2.rinterface import ListSexpVector
 from rpy2.rinterface import SexpVector
@@ -28,14 +30,14 @@ from rpy2.robjects.vectors import (BoolVector,
                                    FloatSexpVector,
                                    StrVector,
                                    IntVector,
-                                   POSIXct)
+                                   POSIXct,
+                                   get_timezone)
 
 # The pandas converter requires numpy.
 import rpy2.robjects.numpy2ri as numpy2ri
 
 original_converter = None
 
-ISOdatetime = rinterface.baseenv['ISOdatetime']
 as_vector = rinterface.baseenv['as.vector']
 
 converter = conversion.Converter('original pandas conversion')
@@ -45,6 +47,10 @@ rpy2py = converter.rpy2py
 # numpy types for Pandas columns that require (even more) special handling
 dt_O_type = numpy.dtype('O')
 
+# Number of threads used to convert the columns of a pandas
+# DataFrame (None means no threads).
+dataframe_max_workers = None
+
 # pandas types for series of integer (optional missing) values.
 integer_array_types = ('Int8', 'Int16', 'Int32', 'Int64', 'UInt8',
                        'UInt16', 'UInt32', 'UInt64')
@@ -56,21 +62,30 @@ def py2rpy_pandasdataframe(obj):
         warnings.warn('DataFrame contains duplicated elements in the index, '
                       'which will lead to loss of the row names in the '
                       'resulting data.frame')
+        rownames = None
+    elif obj.shape[1] == 0:
+        rownames = None
+    else:
+        rownames = [str(x) for x in obj.index]
 
-    od = OrderedDict()
-    for name, values in obj.items():
+    cv = conversion.converter_ctx.get()
+
+    def py2rpy_column(values):
         try:
-            od[name] = conversion.converter_ctx.get().py2rpy(values)
+            res = cv.py2rpy(values)
         except Exception as e:
             warnings.warn('Error while trying to convert '
                           'the column "%s". Fall back to string conversion. '
                           'The error is: %s'
-                          % (name, str(e)))
-            od[name] = conversion.converter_ctx.get().py2rpy(
-                values.astype('string')
-            )
+                          % (values.name, str(e)))
+            res = cv.py2rpy(values.astype('string'))
+        return res
 
-    return DataFrame(od)
+    return DataFrame.from_columns(obj.items(),
+                                  rownames=rownames,
+                                  py2rpy=py2rpy_column,
+                                  max_workers=dataframe_max_workers,
+                                  drop_column_names=True)
 
 
 @py2rpy.register(pandas.Index)
@@ -125,20 +140,45 @@ def _populate_r_vector_with_na(na_value):
     return f
 
 
-_str_populate_r_vector = _populate_r_vector_with_na(na_values.NA_Character)
-_bool_populate_r_vector = _populate_r_vector_with_na(na_values.NA_Logical)
-_float_populate_r_vector = _populate_r_vector_with_na(na_values.NA_Real)
-
-
-def _int_populate_r_vector(iterable, r_vector,
+def _str_populate_r_vector(iterable, r_vector,
                            set_elt,
                            cast_value):
+    # Missing values are mapped to None in a vectorized step, and the
+    # strings are then encoded once for each distinct value.
+    values = numpy.array(iterable, dtype=object)
+    values[numpy.asarray(pandas.isna(values), dtype=bool)] = None
+    strings.populate_r_vector(values, r_vector, set_elt, cast_value)
+
+
+def _int_populate_r_vector_iter(iterable, r_vector,
+                                set_elt,
+                                cast_value):
     for i, v in enumerate(iterable):
         if v is None or v is pandas.NA:
             v = math.nan
         set_elt(r_vector, i, cast_value(v))
 
 
+# Numerical and boolean vectors are populated in bulk (with a vectorized
+# write of NAs) whenever possible, falling back to a per-element
+# population otherwise.
+_bool_populate_r_vector = functools.partial(
+    sexp._populate_r_vector_bulk,
+    fallback=_populate_r_vector_with_na(na_values.NA_Logical),
+    na_aware=True
+)
+_float_populate_r_vector = functools.partial(
+    sexp._populate_r_vector_bulk,
+    fallback=_populate_r_vector_with_na(na_values.NA_Real),
+    na_aware=True
+)
+_int_populate_r_vector = functools.partial(
+    sexp._populate_r_vector_bulk,
+    fallback=_int_populate_r_vector_iter,
+    na_aware=True
+)
+
+
 _PANDASTYPE2RPY2 = {
     datetime.date: DateVector,
     int: functools.partial(
@@ -185,17 +225,25 @@ def py2rpy_pandasseries(obj):
                 tzname = obj.dt.tz.key
             else:
                 warnings.warn('Unable to get time zone from ZoneInfo object.')
+                tzname = ''
+            utc = obj.dt.tz_convert('UTC')
         else:
             tzname = ''
-        d = [IntVector([x.year for x in obj]),
-             IntVector([x.month for x in obj]),
-             IntVector([x.day for x in obj]),
-             IntVector([x.hour for x in obj]),
-             IntVector([x.minute for x in obj]),
-             FloatSexpVector([x.second + x.microsecond * 1e-6 for x in obj])]
-        res = ISOdatetime(*d, tz=StrSexpVector([tzname]))
-        # TODO: can the POSIXct be created from the POSIXct constructor ?
-        # (is '<M8[ns]' mapping to Python datetime.datetime ?)
+            # Times without a time zone are local times for R. Times
+            # repeated when DST ends are the first ones (in DST), and
+            # times skipped when DST starts are NA, as with R's
+            # as.POSIXct().
+            utc = obj.dt.tz_localize(
+                get_timezone(),
+                ambiguous=numpy.ones(len(obj), dtype=bool),
+                nonexistent='NaT'
+            ).dt.tz_convert('UTC')
+        seconds = _datetime64_to_seconds(
+            utc.dt.tz_localize(None).to_numpy(dtype='datetime64[ns]')
+        )
+        res = numpy2ri._flatarray_to_r(seconds, FloatVector)
+        res.do_slot_assign('class', StrSexpVector(['POSIXct', 'POSIXt']))
+        res.do_slot_assign('tzone', StrSexpVector([tzname]))
         res = POSIXct(res)
     elif obj.dtype.type is str:
         res = _PANDASTYPE2RPY2[str](obj)
@@ -227,6 +275,12 @@ def py2rpy_pandasseries(obj):
         res = _PANDASTYPE2RPY2[homogeneous_type](obj)
     elif type(obj.dtype) in (pandas.Float64Dtype, pandas.BooleanDtype):
         res = _PANDASTYPE2RPY2[type(obj.dtype)](obj)
+    elif (obj.ndim == 1 and isinstance(obj.dtype, numpy.dtype) and
+          obj.dtype.kind in numpy2ri._kinds):
+        # converted directly into an R vector (without copy
+        # when possible)
+        res = numpy2ri._flatarray_to_r(obj.values,
+                                       numpy2ri._kinds[obj.dtype.kind])
     else:
         # converted as a numpy array
         func = numpy2ri.converter.py2rpy.registry[numpy.ndarray]
@@ -259,14 +313,49 @@ def ri2py_vector(obj):
 def rpy2py_floatvector(obj):
     if POSIXct.isrinstance(obj):
         return rpy2py(POSIXct(obj))
+    elif DateVector.isrinstance(obj):
+        return rpy2py(DateVector(obj))
     else:
         return numpy2ri.rpy2py(obj)
 
 
+# Largest absolute number of microseconds from the epoch that
+# datetime64[ns] can represent.
+_DATETIME64_NS_MAX_US = numpy.iinfo('int64').max // 1000
+
+
+def _datetime64_to_seconds(values):
+    """Seconds since the epoch (NaN for NaT) for an array of datetime64."""
+    return (values - numpy.datetime64(0, 's')) / numpy.timedelta64(1, 's')
+
+
+def _microseconds_to_datetime64(values):
+    """Array of datetime64[ns] for an array of microseconds since the epoch.
+
+    Values that are NaN or out of the bounds of datetime64[ns] are NaT."""
+    values = numpy.round(values)
+    invalid = ~(numpy.abs(values) < _DATETIME64_NS_MAX_US)
+    values[invalid] = 0
+    res = (values.astype('int64')
+           .astype('datetime64[us]')
+           .astype('datetime64[ns]'))
+    res[invalid] = numpy.datetime64('NaT')
+    return res
+
+
 @rpy2py.register(POSIXct)
 def rpy2py_posixct(obj):
-    return pandas.to_datetime(tuple(obj.iter_localized_datetime()),
-                              errors='coerce')
+    seconds = numpy.asarray(obj, dtype='float64')
+    res = pandas.DatetimeIndex(_microseconds_to_datetime64(seconds * 1e6))
+    return res.tz_localize('UTC').tz_convert(obj._get_tzinfo())
+
+
+@rpy2py.register(DateVector)
+def rpy2py_datevector(obj):
+    days = numpy.floor(numpy.asarray(obj, dtype='float64'))
+    return pandas.DatetimeIndex(
+        _microseconds_to_datetime64(days * (86400 * 1e6))
+    )
 
 
 def _records_to_columns(obj):
@@ -338,7 +427,12 @@ def rpy2py_dataframe(obj):
         for i, col in enumerate(_flatten_dataframe(obj, colnames_lst))
     )
 
-    res = pandas.DataFrame.from_dict(od)
+    if numpy2ri.zerocopy_rpy2py:
+        # Avoid the consolidation of columns into blocks (a copy) to keep
+        # numerical columns as views on the R vectors.
+        res = pandas.DataFrame(od, copy=False)
+    else:
+        res = pandas.DataFrame.from_dict(od)
     res.columns = tuple('.'.join(_) if isinstance(_, list) else _ for _ in colnames_lst)
     res.index = obj.rownames
     return res
@@ -0,0 +1,414 @@
+"""Pool of worker processes, each with its own embedded R.
+
+R evaluates code in one thread, and CPU-bound work in R cannot use
+several cores from one Python process. A :class:`WorkerPool` starts
+processes with their own embedded R and dispatches calls to R functions,
+or R code to evaluate, to them::
+
+  from rpy2.robjects.pool import WorkerPool
+
+  with WorkerPool(4, packages=('stats', )) as pool:
+      futures = [pool.submit('stats::median', x) for x in vectors]
+      results = [f.result() for f in futures]
+
+Vectors of booleans, integers, or floats (including the columns of data
+frames) above a size threshold are moved between processes through
+shared memory (:mod:`multiprocessing.shared_memory`) rather than pickled.
+The worker processes use the shared memory directly as the data for the
+R vectors (see :mod:`rpy2.rinterface_lib.altrep`). Other R objects are
+pickled (with R's serialization).
+
+Arguments and results are converted with the conversion rules active
+when calls are submitted.
+"""
+
+import concurrent.futures
+import concurrent.futures.process
+import contextvars
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import typing
+from multiprocessing import shared_memory
+
+import rpy2.rinterface as rinterface
+from rpy2.rinterface_lib import altrep
+from rpy2.rinterface_lib import conversion as _conversion
+from rpy2.robjects import conversion
+
+# R vectors with at least this number of bytes are moved between
+# processes through shared memory.
+shared_memory_threshold = 2 ** 16
+
+# Formats for the memoryviews on shared memory, by R type.
+_SHARED_FORMATS: typing.Dict[rinterface.RTYPES,
+                             typing.Literal['i', 'd']] = {
+    rinterface.RTYPES.LGLSXP: 'i',
+    rinterface.RTYPES.INTSXP: 'i',
+    rinterface.RTYPES.REALSXP: 'd',
+}
+
+_SHARED_CLASSES = {
+    rinterface.RTYPES.LGLSXP: rinterface.BoolSexpVector,
+    rinterface.RTYPES.INTSXP: rinterface.IntSexpVector,
+    rinterface.RTYPES.REALSXP: rinterface.FloatSexpVector,
+}
+
+
+class _SharedVector(typing.NamedTuple):
+    """R vector with its data in a shared memory segment."""
+    name: str
+    rtype: rinterface.RTYPES
+    length: int
+    attributes: typing.Any
+
+
+class _SharedList(typing.NamedTuple):
+    """R list (for example a data frame) with items in shared memory."""
+    items: typing.List[typing.Any]
+    attributes: typing.Any
+
+
+def _attributes(obj) -> typing.Any:
+    res = rinterface.baseenv['attributes'](obj)
+    return None if res is rinterface.NULL else res
+
+
+def _set_attributes(obj, attributes) -> None:
+    if attributes is not None:
+        # Set at the C level: a call to R's `attributes<-` could duplicate
+        # a vector using shared memory.
+        for name, value in zip(attributes.names, attributes):
+            obj.do_slot_assign(name, value)
+
+
+def _encode(obj, segments: list, threshold: int) -> typing.Any:
+    """Picklable representation of an R object.
+
+    Shared memory segments created are appended to `segments`."""
+    rtype = obj.typeof if isinstance(obj, rinterface.Sexp) else None
+    if rtype is not None and rtype in _SHARED_FORMATS:
+        mview = obj.memoryview()
+        if mview.nbytes >= threshold:
+            shm = shared_memory.SharedMemory(create=True, size=mview.nbytes)
+            segments.append(shm)
+            assert shm.buf is not None
+            shm.buf[:mview.nbytes] = mview.cast('B')
+            return _SharedVector(shm.name, rtype, len(mview),
+                                 _attributes(obj))
+    elif rtype == rinterface.RTYPES.VECSXP:
+        obj = rinterface.ListSexpVector(obj)
+        items = [_encode(x, segments, threshold) for x in obj]
+        if any(isinstance(x, (_SharedVector, _SharedList)) for x in items):
+            return _SharedList(items, _attributes(obj))
+    return obj
+
+
+def _decode(enc, segments: typing.Optional[list]) -> typing.Any:
+    """R object from its picklable representation.
+
+    With `segments` None, the data in shared memory is copied and the
+    segments are unlinked. Otherwise the R vectors use the shared memory
+    and the segments are appended to `segments`."""
+    if isinstance(enc, _SharedVector):
+        shm = shared_memory.SharedMemory(name=enc.name)
+        cls = _SHARED_CLASSES[enc.rtype]
+        assert shm.buf is not None
+        mview = shm.buf[:enc.length * cls._R_SIZEOF_ELT].cast(
+            _SHARED_FORMATS[enc.rtype]
+        )
+        if segments is None:
+            try:
+                res = cls.from_memoryview(mview)
+            finally:
+                mview.release()
+                shm.close()
+                shm.unlink()
+        else:
+            segments.append(shm)
+            res = _conversion._cdata_to_rinterface(
+                altrep.new_buffer_vector(enc.rtype, mview, owner=shm)
+            )
+        _set_attributes(res, enc.attributes)
+        return res
+    elif isinstance(enc, _SharedList):
+        res = rinterface.ListSexpVector(
+            [_decode(x, segments) for x in enc.items]
+        )
+        _set_attributes(res, enc.attributes)
+        return res
+    return enc
+
+
+def _unlink(enc) -> None:
+    """Unlink the shared memory segments in an encoded R object."""
+    if isinstance(enc, _SharedVector):
+        try:
+            shm = shared_memory.SharedMemory(name=enc.name)
+        except FileNotFoundError:
+            return
+        shm.close()
+        shm.unlink()
+    elif isinstance(enc, _SharedList):
+        for x in enc.items:
+            _unlink(x)
+
+
+def _picklable_exception(e: BaseException) -> BaseException:
+    try:
+        pickle.dumps(e)
+        return e
+    except Exception:
+        return RuntimeError(f'{type(e).__name__}: {e}')
+
+
+def _worker_main(conn, packages: typing.Sequence[str],
+                 threshold: int) -> None:
+    """Main loop for a worker process."""
+    from rpy2.robjects.packages import importr
+    if not rinterface.embedded.isready():
+        rinterface.initr()
+    try:
+        for name in packages:
+            importr(name)
+    except Exception as e:
+        conn.send(('error', _picklable_exception(e)))
+        return
+    conn.send(('ok', os.getpid()))
+    result_segments: typing.List[shared_memory.SharedMemory] = []
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        # The parent process sends a task once it has copied the previous
+        # result.
+        for shm in result_segments:
+            shm.close()
+        result_segments = []
+        if task is None:
+            break
+        kind, func, args, kwargs = task
+        try:
+            if kind == 'eval':
+                res = rinterface.evalr(func)
+            else:
+                if isinstance(func, str):
+                    func = rinterface.evalr(func)
+                keyvals = [(None, _decode(x, [])) for x in args]
+                keyvals.extend((k, _decode(v, [])) for k, v in kwargs.items())
+                res = rinterface.SexpClosure.rcall(func, keyvals,
+                                                   rinterface.globalenv)
+            msg = ('ok', _encode(res, result_segments, threshold))
+        except BaseException as e:
+            msg = ('error', _picklable_exception(e))
+        try:
+            conn.send(msg)
+        except Exception as e:
+            conn.send(('error', _picklable_exception(e)))
+
+
+class _WorkItem(object):
+
+    __slots__ = ('future', 'context', 'task')
+
+    def __init__(self, future, task):
+        self.future = future
+        self.context = contextvars.copy_context()
+        self.task = task
+
+
+class WorkerPool(concurrent.futures.Executor):
+    """Pool of processes, each with an embedded R.
+
+    :param processes: number of worker processes (the number of CPUs by
+      default).
+    :param packages: names of R packages imported (with
+      :func:`rpy2.robjects.packages.importr`) in each worker process
+      when it starts.
+    :param mp_context: multiprocessing context (the default is "spawn",
+      as forking a process with an embedded R is not safe).
+    :param forkserver: a :class:`rpy2.robjects.forkserver.ForkServer`
+      forking the worker processes (which then start with the R session
+      of the server). `mp_context` is then ignored.
+    """
+
+    def __init__(self, processes: typing.Optional[int] = None,
+                 packages: typing.Sequence[str] = (),
+                 mp_context=None, forkserver=None):
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if processes < 1:
+            raise ValueError('The number of processes must be at least 1.')
+        if mp_context is None:
+            mp_context = multiprocessing.get_context('spawn')
+        self._tasks: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._broken: typing.Optional[str] = None
+        self._processes = []
+        self._threads = []
+        for i in range(processes):
+            if forkserver is None:
+                parent_conn, child_conn = mp_context.Pipe()
+                process = mp_context.Process(
+                    target=_worker_main,
+                    args=(child_conn, tuple(packages),
+                          shared_memory_threshold),
+                    name=f'rpy2-worker-{i}',
+                    daemon=True
+                )
+                process.start()
+                child_conn.close()
+            else:
+                process = forkserver.fork(_worker_main, tuple(packages),
+                                          shared_memory_threshold)
+                parent_conn = process.conn
+            self._processes.append(process)
+            thread = threading.Thread(
+                target=self._serve, args=(process, parent_conn),
+                name=f'rpy2-worker-{i}-feeder', daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def processes(self) -> typing.Tuple[typing.Any, ...]:
+        """The worker processes."""
+        return tuple(self._processes)
+
+    def _serve(self, process, conn) -> None:
+        """Send tasks to one worker process and set their results."""
+        try:
+            status, value = conn.recv()
+        except EOFError:
+            status, value = ('error', RuntimeError('The worker exited.'))
+        if status != 'ok':
+            self._break(f'A worker process failed to start: {value}')
+        while True:
+            item = self._tasks.get()
+            if item is None:
+                try:
+                    conn.send(None)
+                except OSError:
+                    pass
+                break
+            if self._broken is not None:
+                item.future.set_exception(
+                    concurrent.futures.process.BrokenProcessPool(self._broken)
+                )
+                continue
+            if not item.future.set_running_or_notify_cancel():
+                self._unlink_task(item.task)
+                continue
+            try:
+                conn.send(item.task)
+                status, value = conn.recv()
+            except (EOFError, OSError) as e:
+                self._break(f'A worker process terminated abruptly: {e}')
+                item.future.set_exception(
+                    concurrent.futures.process.BrokenProcessPool(self._broken)
+                )
+                continue
+            finally:
+                self._unlink_task(item.task)
+            if status == 'ok':
+                try:
+                    res = item.context.run(self._finish, value)
+                except BaseException as e:
+                    item.future.set_exception(e)
+                else:
+                    item.future.set_result(res)
+            else:
+                item.future.set_exception(value)
+        conn.close()
+
+    @staticmethod
+    def _finish(value):
+        return conversion.get_conversion().rpy2py(_decode(value, None))
+
+    @staticmethod
+    def _unlink_task(task) -> None:
+        _, _, args, kwargs = task
+        for x in args:
+            _unlink(x)
+        for x in kwargs.values():
+            _unlink(x)
+
+    def _break(self, reason: str) -> None:
+        with self._lock:
+            if self._broken is None:
+                self._broken = reason
+
+    def _submit_task(self, task) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            if self._broken is not None:
+                self._unlink_task(task)
+                raise concurrent.futures.process.BrokenProcessPool(
+                    self._broken
+                )
+            if self._shutdown:
+                self._unlink_task(task)
+                raise RuntimeError('Cannot submit calls after shutdown.')
+            self._tasks.put(_WorkItem(future, task))
+        return future
+
+    def submit(self, fn, /, *args, **kwargs) -> concurrent.futures.Future:
+        """Call an R function in a worker process.
+
+        `fn` is an R function (it is pickled, with R's serialization), or
+        a string with R code evaluating to a function in the worker (for
+        example "stats::median" or "function(x) x + 1"). The arguments
+        are converted to R objects with the current conversion rules,
+        and so is the result (once returned to this process)."""
+        cv = conversion.get_conversion()
+        segments: typing.List[shared_memory.SharedMemory] = []
+        try:
+            new_args = [_encode(cv.py2rpy(x), segments,
+                                shared_memory_threshold)
+                        for x in args]
+            new_kwargs = {k: _encode(cv.py2rpy(v), segments,
+                                     shared_memory_threshold)
+                          for k, v in kwargs.items()}
+        except BaseException:
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+            raise
+        for shm in segments:
+            shm.close()
+        return self._submit_task(('call', fn, new_args, new_kwargs))
+
+    def submit_eval(self, source: str) -> concurrent.futures.Future:
+        """Evaluate a string of R code in a worker process."""
+        return self._submit_task(('eval', source, [], {}))
+
+    def shutdown(self, wait: bool = True, *,
+                 cancel_futures: bool = False) -> None:
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_futures:
+                pending = []
+                while True:
+                    try:
+                        item = self._tasks.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item.future.cancel():
+                        self._unlink_task(item.task)
+                    else:
+                        pending.append(item)
+                for item in pending:
+                    self._tasks.put(item)
+            for _ in self._threads:
+                self._tasks.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+            for process in self._processes:
+                process.join()
@@ -0,0 +1,38 @@
+import os
+import shutil
+import sys
+import tempfile
+
+from rpy2 import situation
+
+_cache_dir = None
+_cache_dir_env = None
+
+
+def pytest_configure(config):
+    # The tests must not read or write the user's cache (R situation,
+    # translations of R packages, and index of help pages). The variable
+    # is set before rpy2.rinterface is imported.
+    global _cache_dir, _cache_dir_env
+    _cache_dir_env = os.environ.get(situation.ENVVAR_CACHE_DIR)
+    _cache_dir = tempfile.mkdtemp(prefix='rpy2-tests-cache-')
+    os.environ[situation.ENVVAR_CACHE_DIR] = _cache_dir
+
+
+def pytest_unconfigure(config):
+    # Forget the caches in the temporary directory before removing it.
+    packages_cache = sys.modules.get('rpy2.robjects.packages_cache')
+    if packages_cache is not None:
+        cache = packages_cache._cache
+        packages_cache.set_cache(None)
+        if cache is not None:
+            cache.close()
+    help = sys.modules.get('rpy2.robjects.help')
+    if help is not None:
+        help.set_index(None)
+    if _cache_dir_env is None:
+        os.environ.pop(situation.ENVVAR_CACHE_DIR, None)
+    else:
+        os.environ[situation.ENVVAR_CACHE_DIR] = _cache_dir_env
+    if _cache_dir is not None:
+        shutil.rmtree(_cache_dir, ignore_errors=True)
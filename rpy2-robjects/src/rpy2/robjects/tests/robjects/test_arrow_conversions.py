@@ -0,0 +1,182 @@
+import datetime
+import pytest
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+from rpy2 import rinterface
+from rpy2 import robjects
+from rpy2.rinterface_lib import altrep
+from rpy2.rinterface_lib import openrlib
+from rpy2.robjects import default_converter
+from rpy2.robjects.conversion import localconverter
+
+pyarrow = pytest.importorskip('pyarrow')
+numpy = pytest.importorskip('numpy')
+
+import rpy2.robjects.arrow2ri as arrow2ri  # noqa: E402
+
+
+def _rpy2py(obj):
+    with localconverter(default_converter + arrow2ri.converter) as cv:
+        return cv.rpy2py(obj)
+
+
+def _py2rpy(obj):
+    with localconverter(default_converter + arrow2ri.converter) as cv:
+        return cv.py2rpy(obj)
+
+
+@pytest.mark.parametrize(
+    'rcode,arrow_type,values',
+    (('c(1L, NA, 3L)', pyarrow.int32(), [1, None, 3]),
+     ('c(1.5, NA, 3.5)', pyarrow.float64(), [1.5, None, 3.5]),
+     ('c(TRUE, NA, FALSE)', pyarrow.bool_(), [True, None, False]),
+     ('c("a", NA, "cé")', pyarrow.string(), ['a', None, 'cé']),
+     ('as.Date(c("2020-01-02", NA))', pyarrow.date32(),
+      [datetime.date(2020, 1, 2), None]))
+)
+def test_rpy2py_vector(rcode, arrow_type, values):
+    res = _rpy2py(robjects.r(rcode))
+    assert isinstance(res, pyarrow.Array)
+    assert res.type == arrow_type
+    assert res.to_pylist() == values
+
+
+@pytest.mark.parametrize('zerocopy', (True, False))
+def test_rpy2py_zerocopy(zerocopy, monkeypatch):
+    monkeypatch.setattr(arrow2ri, 'zerocopy_rpy2py', zerocopy)
+    rvec = robjects.FloatVector([1.0, 2.0, 3.0])
+    res = _rpy2py(rvec)
+    ptr = rvec._R_GET_PTR(rvec.__sexp__._cdata)
+    address = int(openrlib.ffi.cast('uintptr_t', ptr))
+    assert (res.buffers()[1].address == address) is zerocopy
+    del rvec
+    assert res.to_pylist() == [1.0, 2.0, 3.0]
+
+
+def test_rpy2py_factor():
+    res = _rpy2py(robjects.r('factor(c("b", "a", NA, "b"))'))
+    assert isinstance(res, pyarrow.DictionaryArray)
+    assert res.dictionary.to_pylist() == ['a', 'b']
+    assert res.to_pylist() == ['b', 'a', None, 'b']
+    assert not res.type.ordered
+    res = _rpy2py(robjects.r('factor(c("b", "a"), ordered=TRUE)'))
+    assert res.type.ordered
+
+
+def test_rpy2py_posixct():
+    res = _rpy2py(
+        robjects.r('as.POSIXct(c(0.5, NA), origin="1970-01-01", tz="UTC")')
+    )
+    assert res.type == pyarrow.timestamp('us', tz='UTC')
+    assert res.cast(pyarrow.int64()).to_pylist() == [500000, None]
+
+
+@pytest.mark.parametrize(
+    'tz',
+    (ZoneInfo('Europe/Paris'),
+     # No name for Arrow: R's time zone is used.
+     datetime.timezone(datetime.timedelta(hours=2)))
+)
+def test_posixct_local_roundtrip(monkeypatch, tz):
+    monkeypatch.setattr(robjects.vectors, 'default_timezone', tz)
+    x = robjects.r('structure(c(0.5, NA), class=c("POSIXct", "POSIXt"))')
+    res = _rpy2py(x)
+    if isinstance(tz, ZoneInfo):
+        assert res.type == pyarrow.timestamp('us', tz='Europe/Paris')
+    x_back = _py2rpy(res)
+    assert tuple(x_back.rclass) == ('POSIXct', 'POSIXt')
+    assert x_back[0] == 0.5
+    assert robjects.baseenv['is.na'](x_back)[1]
+    # A valid time zone for R.
+    tzone = x_back.do_slot('tzone')[0]
+    assert tzone == '' or tzone in tuple(robjects.baseenv['OlsonNames']())
+
+
+def test_rpy2py_dataframe():
+    res = _rpy2py(
+        robjects.r('data.frame(a=1:3, b=c("x", "y", NA), '
+                   'c=factor(c("u", "v", "u")))')
+    )
+    assert isinstance(res, pyarrow.RecordBatch)
+    assert res.num_rows == 3
+    assert res.schema.names == ['a', 'b', 'c']
+    assert res.column(1).to_pylist() == ['x', 'y', None]
+
+
+@pytest.mark.parametrize(
+    'values,rcls',
+    (([1, None, 3], rinterface.IntSexpVector),
+     ([1.5, None, 3.5], rinterface.FloatSexpVector),
+     ([True, None, False], rinterface.BoolSexpVector),
+     (['a', None, 'cé'], rinterface.StrSexpVector))
+)
+def test_py2rpy_array(values, rcls):
+    res = _py2rpy(pyarrow.array(values))
+    assert isinstance(res, rcls)
+    assert robjects.baseenv['is.na'](res)[1]
+    assert res[0] == values[0]
+    assert res[2] == values[2]
+
+
+def test_py2rpy_int64():
+    res = _py2rpy(pyarrow.array([1, 2, 3], type=pyarrow.int64()))
+    assert isinstance(res, rinterface.FloatSexpVector)
+    assert tuple(res) == (1.0, 2.0, 3.0)
+
+
+def test_py2rpy_zerocopy():
+    a = pyarrow.array([1.0, 2.0, 3.0]).slice(1)
+    res = _py2rpy(a)
+    assert altrep.is_buffer_backed(res.__sexp__._cdata)
+    del a
+    assert tuple(res) == (2.0, 3.0)
+
+
+def test_py2rpy_dictionary():
+    a = pyarrow.array(['b', 'a', None, 'b']).dictionary_encode()
+    res = robjects.vectors.FactorVector(_py2rpy(a))
+    assert tuple(res.levels) == ('b', 'a')
+    assert tuple(robjects.baseenv['as.character'](res))[:2] == ('b', 'a')
+    assert robjects.baseenv['is.na'](res)[2]
+
+
+def test_py2rpy_timestamp():
+    a = pyarrow.array([1500000, None],
+                      type=pyarrow.timestamp('us', tz='UTC'))
+    res = _py2rpy(a)
+    assert tuple(res.rclass) == ('POSIXct', 'POSIXt')
+    assert tuple(res.do_slot('tzone')) == ('UTC', )
+    assert res[0] == 1.5
+
+
+def test_py2rpy_table():
+    table = pyarrow.table(
+        {'a': pyarrow.chunked_array([[1, 2], [3]], type=pyarrow.int32()),
+         'b': ['x', None, 'z']}
+    )
+    res = robjects.vectors.DataFrame(_py2rpy(table))
+    assert res.nrow == 3
+    assert tuple(res.names) == ('a', 'b')
+    assert tuple(res.rx2('a')) == (1, 2, 3)
+
+
+def test_roundtrip_dataframe():
+    rdf = robjects.r('data.frame(a=c(1.5, NA), b=c(TRUE, FALSE), '
+                     'd=as.Date(c("2020-01-02", "2021-03-04")))')
+    res = robjects.vectors.DataFrame(_py2rpy(_rpy2py(rdf)))
+    assert robjects.baseenv['identical'](rdf, res)[0]
+
+
+def test_c_interface():
+    c_schema = arrow2ri.ffi.new('struct ArrowSchema *')
+    c_array = arrow2ri.ffi.new('struct ArrowArray *')
+    array_address = int(arrow2ri.ffi.cast('uintptr_t', c_array))
+    schema_address = int(arrow2ri.ffi.cast('uintptr_t', c_schema))
+    arrow2ri.export_to_c(robjects.IntVector([1, 2]),
+                         array_address, schema_address)
+    res = arrow2ri.import_from_c(array_address, schema_address)
+    assert tuple(res) == (1, 2)
+    assert c_array.release == arrow2ri.ffi.NULL
@@ -2,6 +2,7 @@ import pytest
 import sys
 from rpy2 import robjects
 from rpy2 import rinterface
+from rpy2.rinterface_lib import altrep
 import rpy2.rlike.container
 import rpy2.robjects.conversion as conversion
 r = robjects.r
@@ -237,6 +238,35 @@ class TestNumpyConversions(object):
             a = robjects.r('c(1.0, 2.0, 3.0)')
         assert isinstance(a, numpy.ndarray)
 
+    def test_float_py2rpy_copy(self):
+        a = numpy.array([1.0, 2.0, 3.0])
+        with (robjects.default_converter + rpyn.converter).context() as cv:
+            a_r = cv.py2rpy(a)
+        assert not altrep.is_buffer_backed(a_r.__sexp__._cdata)
+        # Changes from Python are not visible in R.
+        a[0] = 4.0
+        assert r['sum'](a_r)[0] == 6.0
+
+    def test_float_py2rpy_zerocopy(self, monkeypatch):
+        monkeypatch.setattr(rpyn, 'zerocopy_py2rpy', True)
+        a = numpy.array([1.0, 2.0, 3.0])
+        with (robjects.default_converter + rpyn.converter).context() as cv:
+            a_r = cv.py2rpy(a)
+        assert altrep.is_buffer_backed(a_r.__sexp__._cdata)
+        assert r['sum'](a_r)[0] == 6.0
+
+    @pytest.mark.parametrize('rcode',
+                             ('c(1.0, 2.0, 3.0)', 'c(1L, 2L, 3L)',
+                              'matrix(c(1.0, 2.0, 3.0, 4.0), nrow=2)'))
+    def test_rpy2py_zerocopy(self, monkeypatch, rcode):
+        monkeypatch.setattr(rpyn, 'zerocopy_rpy2py', True)
+        with (robjects.default_converter + rpyn.converter).context() as cv:
+            a = robjects.r(rcode)
+        assert isinstance(a, numpy.ndarray)
+        assert not a.flags.writeable
+        assert isinstance(a.base, rinterface.SexpVector)
+        assert tuple(a.ravel(order='F')) == (1, 2, 3, 4)[:a.size]
+
 
 @pytest.mark.skipif(not has_numpy,
                     reason='package numpy cannot be imported')
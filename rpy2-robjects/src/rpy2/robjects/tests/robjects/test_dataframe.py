@@ -54,6 +54,52 @@ def test_init_from_dict():
     assert dataf.rx2('a')[0] == 1
 
 
+@pytest.mark.parametrize('max_workers', (None, 2))
+def test_from_columns(max_workers):
+    od = {
+        'a': robjects.IntVector((1, 2)),
+        'b': robjects.StrVector(('c', 'd')),
+        'c c': robjects.BoolVector((True, False))
+    }
+    dataf = robjects.DataFrame.from_columns(od, max_workers=max_workers)
+    assert dataf.rclass[0] == 'data.frame'
+    assert tuple(dataf.names) == ('a', 'b', 'c c')
+    assert dataf.nrow == 2
+    assert tuple(dataf.rownames) == ('1', '2')
+    assert tuple(dataf.rx2('b')) == ('c', 'd')
+    assert robjects.r['identical'](
+        dataf,
+        robjects.r('data.frame(a=1:2, b=c("c", "d"), "c c"=c(TRUE, FALSE), '
+                   'check.names=FALSE)')
+    )[0]
+
+
+def test_from_columns_rownames():
+    dataf = robjects.DataFrame.from_columns(
+        [('a', robjects.IntVector((1, 2)))],
+        rownames=('x', 'y')
+    )
+    assert tuple(dataf.rownames) == ('x', 'y')
+
+
+def test_from_columns_drop_column_names():
+    col = robjects.r('c(x=1L, y=2L)')
+    dataf = robjects.DataFrame.from_columns(
+        [('a', col)], drop_column_names=True
+    )
+    assert robjects.r('function(x) is.null(names(x$a))')(dataf)[0]
+    # The vector passed is not modified.
+    assert tuple(col.names) == ('x', 'y')
+
+
+def test_from_columns_length_mismatch():
+    with pytest.raises(ValueError):
+        robjects.DataFrame.from_columns(
+            {'a': robjects.IntVector((1, 2)),
+             'b': robjects.IntVector((1, 2, 3))}
+        )
+
+
 def test_init_stringsasfactors():
     od = {'a': robjects.IntVector((1,2)),
           'b': robjects.StrVector(('c', 'd'))}
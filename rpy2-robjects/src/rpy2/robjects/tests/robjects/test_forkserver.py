@@ -0,0 +1,98 @@
+import os
+import pytest
+
+from rpy2 import robjects
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'),
+                                reason='Requires os.fork().')
+
+from rpy2.robjects import forkserver  # noqa: E402
+from rpy2.robjects import pool  # noqa: E402
+
+
+def _send_pid(conn):
+    conn.send((os.getpid(), os.getppid()))
+
+
+def _send_attached(conn):
+    conn.send(tuple(robjects.r('search()')))
+
+
+def _send_random(conn):
+    conn.send(tuple(robjects.r('runif(3)')))
+
+
+def _send_converted(conn):
+    res = robjects.conversion.get_conversion().rpy2py(
+        robjects.rinterface.IntSexpVector([1, 2])
+    )
+    conn.send(type(res).__name__)
+
+
+def _fail(conn):
+    raise ValueError('boom')
+
+
+@pytest.fixture(scope='module')
+def server():
+    with forkserver.ForkServer(packages=('tools', )) as s:
+        yield s
+
+
+def test_fork(server):
+    process = server.fork(_send_pid)
+    pid, ppid = process.conn.recv()
+    assert pid == process.pid
+    assert ppid == server.process.pid
+    assert pid != os.getpid()
+    process.join(timeout=10)
+    assert not process.is_alive()
+
+
+def test_fork_packages(server):
+    process = server.fork(_send_attached)
+    assert 'package:tools' in process.conn.recv()
+
+
+def test_fork_random(server):
+    p1 = server.fork(_send_random)
+    p2 = server.fork(_send_random)
+    assert p1.conn.recv() != p2.conn.recv()
+
+
+def test_fork_error(server):
+    process = server.fork(_fail)
+    with pytest.raises(EOFError):
+        process.conn.recv()
+    # The server is still usable.
+    assert server.fork(_send_pid).conn.recv()[1] == server.process.pid
+
+
+def test_converter():
+    pytest.importorskip('numpy')
+    with forkserver.ForkServer(
+            converter='rpy2.robjects.numpy2ri:converter'
+    ) as server:
+        assert server.fork(_send_converted).conn.recv() == 'ndarray'
+
+
+def test_start_error():
+    server = forkserver.ForkServer(packages=('notapackage_rpy2', ))
+    with pytest.raises(RuntimeError):
+        server.start()
+
+
+def test_shutdown():
+    server = forkserver.ForkServer()
+    server.start()
+    process = server.process
+    server.shutdown()
+    assert server.process is None
+    assert not process.is_alive()
+
+
+def test_workerpool(server):
+    with pool.WorkerPool(2, forkserver=server) as p:
+        res = p.submit_eval('Sys.getpid()').result()
+        assert res[0] in tuple(x.pid for x in p.processes)
+        assert 'package:tools' in tuple(p.submit_eval('search()').result())
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import inspect
 import rpy2.robjects as robjects
@@ -31,6 +32,20 @@ def test_call_with_sexp():
     assert s[0] == 6
 
 
+def test_submit():
+    ro_f = robjects.baseenv['sum']
+    future = ro_f.submit(robjects.IntVector([1, 2, 3]))
+    s = future.result()
+    assert isinstance(s, robjects.vectors.IntVector)
+    assert s[0] == 6
+
+
+def test_acall():
+    ro_f = robjects.r('function(x, y) x - y')
+    s = asyncio.run(ro_f.acall(3, y=1))
+    assert s[0] == 2
+
+
 @pytest.mark.parametrize(
     'rcode,funcnames',
     (('function(x, y) TRUE', ('x', 'y')),
@@ -70,6 +85,8 @@ def test_documentedstfunction(name):
     dstf = robjects.functions.DocumentedSTFunction(robjects.baseenv[name],
                                                    packagename='base')
     assert isinstance(dstf.__doc__, str)
+    # The docstring is built on first access.
+    assert dstf.__doc__ is dstf.__doc__
 
 
 @pytest.mark.parametrize(
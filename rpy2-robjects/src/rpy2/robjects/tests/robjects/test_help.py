@@ -2,6 +2,7 @@ import os
 import pytest
 import rpy2.robjects as robjects
 import rpy2.robjects.help as rh
+from rpy2.robjects.packages_utils import get_packagepath
 rinterface = robjects.rinterface
 
 
@@ -16,6 +17,41 @@ class TestPackage(object):
         assert isinstance(repr(base_help), str)
 
 
+def test_get_package():
+    base_help = rh.get_package('base')
+    assert base_help.name == 'base'
+    assert rh.get_package('base') is base_help
+
+
+class TestHelpIndex(object):
+
+    def test_update(self, tmp_path):
+        index = rh.HelpIndex(str(tmp_path / 'help.sqlite3'))
+        packages = (('base', get_packagepath('base')), )
+        rowids = index.update(packages)
+        assert len(rowids) == 1
+        assert index.update(packages) == rowids
+        res = index.find('print', package_rowid=rowids[0])
+        assert len(res) == 1
+        assert index.find('_not_an_alias_') == []
+
+    def test_update_persistent(self, tmp_path, monkeypatch):
+        path = str(tmp_path / 'help.sqlite3')
+        packages = (('base', get_packagepath('base')), )
+        rowids = rh.HelpIndex(path).update(packages)
+
+        def populate(*args, **kwargs):
+            raise AssertionError('The package should already be indexed.')
+        monkeypatch.setattr(rh, 'populate_metaRd_db', populate)
+        assert rh.HelpIndex(path).update(packages) == rowids
+
+    def test_search(self, tmp_path):
+        index = rh.HelpIndex(str(tmp_path / 'help.sqlite3'))
+        index.update((('base', get_packagepath('base')), ))
+        res = index.search('print', package='base')
+        assert 'print' in set(name for package, name, title in res)
+
+
 class TestPage(object):
     
     def test_init(self):
@@ -84,3 +120,9 @@ def test_pages():
     pages = rh.pages('plot')
     assert isinstance(pages, tuple)
     assert all(isinstance(elt, rh.Page) for elt in pages)
+
+
+def test_search():
+    res = rh.search('print')
+    assert isinstance(res, list)
+    assert ('base', 'print') in set(x[:2] for x in res)
@@ -2,6 +2,7 @@ import pytest
 import sys
 import textwrap
 import rpy2.robjects as robjects
+import rpy2.robjects.help as rhelp
 import rpy2.robjects.methods as methods
 rinterface = robjects.rinterface
 
@@ -98,6 +99,27 @@ def test_RS4Auto_Type():
     # TODO: test ?
 
 
+def test_RS4Auto_Type_lazydoc(monkeypatch):
+    robjects.r('library(stats4)')
+    fetched = []
+    get_package = rhelp.get_package
+
+    def get_package_logged(name):
+        fetched.append(name)
+        return get_package(name)
+    monkeypatch.setattr(rhelp, 'get_package', get_package_logged)
+
+    class MLE(object,
+              metaclass=robjects.methods.RS4Auto_Type):
+        __rname__ = 'mle'
+        __rpackagename__ = 'stats4'
+    assert fetched == []
+    assert isinstance(MLE.__doc__, str)
+    assert len(MLE.__doc__) > 0
+    assert MLE.__doc__ is MLE.__doc__
+    assert fetched == ['stats4']
+
+
 def test_RS4Auto_Type_nopackname():
     robjects.r('library(stats4)')
 
@@ -51,6 +51,20 @@ class TestPackage(object):
         with pytest.raises(packages.LibraryError):
             robjects.packages.Package(env, "dummy_package")
 
+    def test_lazy(self):
+        env = robjects.Environment()
+        env['a.a'] = robjects.StrVector('abcd')
+        env['c'] = robjects.r(''' function(x) x^2''')
+        pck = robjects.packages.Package(env, "dummy_package", lazy=True)
+        assert 'a_a' not in pck.__dict__
+        assert 'a_a' in dir(pck)
+        assert 'c' in dir(pck)
+        assert isinstance(pck.a_a, robjects.Vector)
+        assert 'a_a' in pck.__dict__
+        assert pck.c.__rname__ == 'c'
+        with pytest.raises(AttributeError):
+            pck.b
+
     def tests_package_repr(self):
         env = robjects.Environment()
         pck = robjects.packages.Package(env, "dummy_package")
@@ -95,6 +109,26 @@ class TestImportr(object):
                                           on_conflict='warn')
         assert isinstance(stats, robjects.packages.Package)
 
+    def test_importr_stats_lazy(self):
+        stats = robjects.packages.importr('stats',
+                                          on_conflict='warn',
+                                          lazy=True)
+        assert 'rnorm' not in stats.__dict__
+        assert isinstance(stats.rnorm,
+                          robjects.functions.DocumentedSTFunction)
+        assert 'rnorm' in stats.__dict__
+        assert set(dir(stats)) >= set(
+            dir(robjects.packages.importr('stats', on_conflict='warn'))
+        )
+
+    def test_importr_lazy_weakpackage(self):
+        env = robjects.Environment()
+        env['a'] = robjects.IntVector((1, 2))
+        pck = robjects.packages.WeakPackage(env, "dummy_package", lazy=True)
+        assert tuple(pck.a) == (1, 2)
+        with pytest.warns(UserWarning):
+            assert pck.b is None
+
     def test_import_stats_with_libloc(self):
         path = os.path.dirname(
             robjects.packages_utils.get_packagepath('stats')
@@ -0,0 +1,69 @@
+import pytest
+import rpy2.robjects as robjects
+from rpy2.robjects import packages_cache
+from rpy2.robjects import packages_utils
+
+
+@pytest.fixture
+def cache(tmp_path):
+    res = packages_cache.PackagesCache(str(tmp_path / 'packages.sqlite3'))
+    packages_cache.set_cache(res)
+    yield res
+    packages_cache.set_cache(None)
+    res.close()
+
+
+def _settings(translation={}):
+    return packages_cache.settings_key(
+        translation, 'warn',
+        packages_utils.default_symbol_r2python,
+        packages_utils.default_symbol_resolve
+    )
+
+
+def test_settings_key():
+    assert _settings() == _settings()
+    assert _settings() != _settings({'a': 'b'})
+    assert packages_cache.settings_key(
+        {}, 'warn', lambda x: x, packages_utils.default_symbol_resolve
+    ) is None
+
+
+def test_symbols(cache):
+    mapping = ({'a_b': ['a.b', 'a_b']}, {'a_b': ['a.b', 'a_b']}, {})
+    assert cache.get_symbols('foo', '1.0', _settings()) is None
+    cache.set_symbols('foo', '1.0', _settings(), mapping)
+    assert cache.get_symbols('foo', '1.0', _settings()) == mapping
+    assert cache.get_symbols('foo', '1.0', _settings({'a': 'b'})) is None
+    cache.set_symbols('foo', '1.1', _settings(), mapping)
+    assert cache.get_symbols('foo', '1.0', _settings()) is None
+    assert cache.get_symbols('foo', '1.1', _settings()) == mapping
+
+
+def test_signatures(cache):
+    signatures = {'f': [('x', 'x'), ('na_rm', 'na.rm')], 'g': []}
+    assert cache.get_signatures('foo', '1.0', _settings()) == {}
+    cache.set_signatures('foo', '1.0', _settings(), signatures)
+    assert cache.get_signatures('foo', '1.0', _settings()) == signatures
+    cache.clear()
+    assert cache.get_signatures('foo', '1.0', _settings()) == {}
+
+
+def test_get_cache_disabled(monkeypatch):
+    monkeypatch.setenv(packages_cache.ENVVAR_PACKAGES_CACHE, 'false')
+    assert packages_cache.get_cache() is None
+
+
+@pytest.mark.parametrize('lazy', (False, True))
+def test_importr_cached(cache, lazy):
+    stats = robjects.packages.importr('stats', on_conflict='warn')
+    version = stats.__version__
+    settings = _settings()
+    assert cache.get_symbols('stats', version, settings) is not None
+    assert 'rnorm' in cache.get_signatures('stats', version, settings)
+    stats_cached = robjects.packages.importr('stats', on_conflict='warn',
+                                             lazy=lazy)
+    assert set(dir(stats_cached)) == set(dir(stats))
+    assert (tuple(stats_cached.rnorm._prm_translate.items()) ==
+            tuple(stats.rnorm._prm_translate.items()))
+    assert len(stats_cached.rnorm(3)) == 3
@@ -306,6 +306,50 @@ class TestPandasConversions(object):
             assert int(rp_c[0]) == 1483228800
             assert math.isnan(rp_c[1])
 
+    @pytest.mark.parametrize('tz', (None, 'UTC', 'America/New_York'))
+    def test_datetime2posixct_roundtrip(self, tz):
+        datetime = pandas.Series(
+            pandas.date_range('2017-01-12 00:00:00.5',
+                              periods=5, freq='h', tz=tz)
+        )
+        datetime[2] = pandas.NaT
+        with localconverter(default_converter + rpyp.converter) as cv:
+            rp_c = cv.py2rpy(datetime)
+            assert tuple(rp_c.rclass) == ('POSIXct', 'POSIXt')
+            assert rp_c.do_slot('tzone')[0] == (tz if tz else '')
+            py_c = cv.rpy2py(rp_c)
+        assert py_c[2] is pandas.NaT
+        if tz is None:
+            py_c = py_c.tz_convert(
+                robjects.vectors.get_timezone()
+            ).tz_localize(None)
+        for expected, obtained in zip(datetime, py_c):
+            if expected is pandas.NaT:
+                continue
+            assert expected == obtained
+
+    def test_datetime2posixct_dst(self, monkeypatch):
+        monkeypatch.setattr(vectors, 'default_timezone',
+                            ZoneInfo('America/New_York'))
+        # 01:30 is repeated when DST ends, and 02:30 is skipped when it
+        # starts.
+        datetime = pandas.Series(
+            pandas.to_datetime(['2021-11-07 01:30', '2021-03-14 02:30'])
+        )
+        with localconverter(default_converter + rpyp.converter) as cv:
+            rp_c = cv.py2rpy(datetime)
+        # First occurrence, in DST (EDT).
+        assert rp_c[0] == 1636263000
+        assert math.isnan(rp_c[1])
+
+    def test_dateR2Pandas(self):
+        r_date = robjects.r('as.Date(c("1960-05-02", NA, "2012-07-01"))')
+        with localconverter(default_converter + rpyp.converter) as cv:
+            py_date = cv.rpy2py(r_date)
+        assert py_date[0] == pandas.Timestamp('1960-05-02')
+        assert py_date[1] is pandas.NaT
+        assert py_date[2] == pandas.Timestamp('2012-07-01')
+
     def test_date2posixct(self):
         today = datetime.now().date()
         date = pandas.Series([today])
@@ -429,6 +473,14 @@ class TestPandasConversions(object):
                               pandas.api.types.CategoricalDtype)
         assert tuple(pandas_df.index) == py_rownames
 
+    def test_ri2pandas_zerocopy(self, monkeypatch):
+        monkeypatch.setattr(rpyp.numpy2ri, 'zerocopy_rpy2py', True)
+        rdataf = robjects.r('data.frame(a=c(1.5, 2.5), b=1:2)')
+        with localconverter(default_converter + rpyp.converter) as cv:
+            pandas_df = cv.rpy2py(rdataf)
+        assert tuple(pandas_df['a']) == (1.5, 2.5)
+        assert tuple(pandas_df['b']) == (1, 2)
+
     @pytest.mark.parametrize(
         'rcode,names,values',
         (
@@ -0,0 +1,103 @@
+import concurrent.futures
+import concurrent.futures.process
+import os
+import pytest
+
+from rpy2 import rinterface
+from rpy2 import robjects
+from rpy2.robjects import pool
+
+
+@pytest.fixture(scope='module')
+def workerpool():
+    with pool.WorkerPool(2, packages=('stats', )) as p:
+        yield p
+
+
+def test_init_invalid():
+    with pytest.raises(ValueError):
+        pool.WorkerPool(0)
+
+
+def test_submit_eval(workerpool):
+    res = workerpool.submit_eval('Sys.getpid()').result()
+    assert res[0] != os.getpid()
+    assert res[0] in tuple(p.pid for p in workerpool.processes)
+
+
+def test_submit_str(workerpool):
+    res = workerpool.submit('stats::median',
+                            robjects.IntVector([1, 2, 3])).result()
+    assert tuple(res) == (2, )
+
+
+def test_submit_function(workerpool):
+    func = robjects.r('function(x, y) x * y')
+    res = workerpool.submit(func, robjects.FloatVector([1.5]),
+                            y=2).result()
+    assert tuple(res) == (3.0, )
+
+
+@pytest.mark.parametrize(
+    'rcode',
+    ('seq(1, 2, length.out=100000)',
+     '1:100000',
+     'rep(c(TRUE, NA, FALSE), 30000)')
+)
+def test_shared_memory_vector(workerpool, rcode):
+    vec = robjects.r(rcode)
+    res = workerpool.submit('identity', vec).result()
+    assert robjects.baseenv['identical'](vec, res)[0]
+
+
+def test_shared_memory_dataframe(workerpool):
+    rdf = robjects.r('data.frame(a=seq_len(100000), b=letters[1:4])')
+    res = workerpool.submit('function(x) { x$c <- x$a * 2; x }',
+                            rdf).result()
+    assert isinstance(res, robjects.vectors.DataFrame)
+    assert tuple(res.names) == ('a', 'b', 'c')
+    assert res.rx2('c')[99999] == 200000
+
+
+def test_encode_decode():
+    vec = rinterface.FloatSexpVector(range(100000))
+    vec.do_slot_assign('names', rinterface.StrSexpVector(['a'] * 100000))
+    segments = []
+    enc = pool._encode(vec, segments, 1024)
+    assert isinstance(enc, pool._SharedVector)
+    assert len(segments) == 1
+    segments[0].close()
+    res = pool._decode(enc, None)
+    assert robjects.baseenv['identical'](vec, res)[0]
+
+
+def test_encode_small():
+    vec = rinterface.IntSexpVector([1, 2, 3])
+    segments = []
+    assert pool._encode(vec, segments, 1024) is vec
+    assert segments == []
+
+
+def test_error(workerpool):
+    future = workerpool.submit_eval('stop("boom")')
+    with pytest.raises(rinterface.embedded.RRuntimeError):
+        future.result()
+    # The worker is still usable.
+    assert workerpool.submit_eval('1L').result()[0] == 1
+
+
+def test_worker_exit():
+    with pool.WorkerPool(1) as p:
+        future = p.submit_eval('quit(save="no")')
+        with pytest.raises(concurrent.futures.process.BrokenProcessPool):
+            future.result()
+        with pytest.raises(concurrent.futures.process.BrokenProcessPool):
+            p.submit_eval('1')
+
+
+def test_shutdown():
+    p = pool.WorkerPool(1)
+    p.shutdown()
+    assert not any(x.is_alive() for x in p.processes)
+    with pytest.raises(RuntimeError):
+        p.submit_eval('1')
@@ -36,3 +36,26 @@ def test_call():
 
     s = ro_f(ro_v)
     assert s[0] == 6
+
+
+def test_prepare():
+    ri_f = rinterface.baseenv.find('rank')
+    ro_f = SignatureTranslatedFunction(ri_f)
+    call = ro_f.prepare((None, 'ties_method'))
+    assert call.names == (None, 'ties.method')
+    res = call(robjects.IntVector([3, 1, 1]), 'first')
+    assert tuple(res) == (3, 1, 2)
+
+
+def test_signature_cache():
+    ri_f = rinterface.baseenv['eval'](
+        rinterface.parse('function(foo.bar, baz) NULL')
+    )
+    ro_f = SignatureTranslatedFunction(ri_f)
+    assert ro_f.rid in robjects.functions._SIGNATURE_CACHE
+    ro_f._prm_translate['spam'] = 'baz'
+    ro_f2 = SignatureTranslatedFunction(ri_f)
+    assert ro_f2._prm_translate == {'foo_bar': 'foo.bar', 'baz': 'baz'}
+    rid = ri_f.rid
+    del(ri_f, ro_f, ro_f2)
+    assert rid not in robjects.functions._SIGNATURE_CACHE
@@ -1,5 +1,7 @@
 import abc
 import collections.abc
+import concurrent.futures
+import contextvars
 from rpy2.robjects.robject import RObjectMixin
 import rpy2.rinterface as rinterface
 from rpy2.rinterface_lib import sexp
@@ -297,6 +299,23 @@ class Vector(RObjectMixin):
         value = conversion.get_conversion().py2rpy(value)
         super().__setitem__(i, value)
 
+    def take(self, indices):
+        """Get the items at the given indices in a Python list.
+
+        R objects in the vector are converted with the active
+        conversion rules, as with the indexing operator."""
+        cv = conversion.get_conversion()
+        return [cv.rpy2py(x) if isinstance(x, Sexp) else x
+                for x in super().take(indices)]
+
+    def put(self, indices, values):
+        """Set the items at the given indices.
+
+        Python objects are converted with the active conversion rules,
+        as with the indexing operator."""
+        cv = conversion.get_conversion()
+        super().put(indices, [cv.py2rpy(x) for x in values])
+
     @property
     def names(self):
         """Names for the items in the vector."""
@@ -887,6 +906,11 @@ class POSIXlt(POSIXt, ListVector):
              'tmp_gmtoff': aslist[idx['gmtoff']][i]}
         )
 
+    def __iter__(self):
+        # Items are not the elements of the underlying R list.
+        for i in range(len(self)):
+            yield self[i]
+
     def __repr__(self):
         return super(Sexp, self).__repr__()
 
@@ -1051,8 +1075,8 @@ class POSIXct(POSIXt, FloatVector):
             else:
                 return dt + offset
 
-    def iter_localized_datetime(self):
-        """Iterator yielding localized Python datetime objects."""
+    def _get_tzinfo(self):
+        """Python time zone for the R attribute "tzone"."""
         try:
             r_tzone_name = self.do_slot('tzone')[0]
         except LookupError:
@@ -1065,6 +1089,11 @@ class POSIXct(POSIXt, FloatVector):
             r_tzone = get_timezone()
         else:
             r_tzone = zoneinfo.ZoneInfo(r_tzone_name)
+        return r_tzone
+
+    def iter_localized_datetime(self):
+        """Iterator yielding localized Python datetime objects."""
+        r_tzone = self._get_tzinfo()
         for x in self:
             yield (
                 None if math.isnan(x)
@@ -1450,6 +1479,14 @@ class DataFrame(ListVector):
         else:
             return conversion.get_conversion().rpy2py(tmp)
 
+    def take(self, indices):
+        cv = conversion.get_conversion()
+        return [
+            DataFrame(x) if x.typeof == rinterface.RTYPES.VECSXP
+            else cv.rpy2py(x)
+            for x in rinterface.ListSexpVector.take(self, indices)
+        ]
+
     def cbind(self, *args, **kwargs):
         """ bind objects as supplementary columns """
         new_args = [self, ] + [conversion.get_conversion().rpy2py(x) for x in args]
@@ -1473,6 +1510,64 @@ class DataFrame(ListVector):
         res = utils_ri['head'](self, *args, **kwargs)
         return conversion.get_conversion().rpy2py(res)
 
+    @classmethod
+    def from_columns(cls, columns, rownames=None, py2rpy=None,
+                     max_workers=None, drop_column_names=False):
+        """ Create an instance directly from columns.
+
+        This is faster than the constructor, in particular for data frames
+        with many columns, because R's function `data.frame()` is not
+        called. Column names are used as they are (like with
+        `checknames=False`), vectors of strings are not turned to
+        factors, and columns that are data frames are not supported.
+
+        :param columns: a mapping name -> column, a
+            rpy2.rlike.container.NamedList, or a sequence of
+            (name, column) pairs
+        :param rownames: an optional sequence of row names
+        :param py2rpy: function to convert columns to R objects
+            (default: `py2rpy` in the current conversion rules)
+        :param max_workers: if not None, columns are converted using a
+            pool of threads of that size. The R data frame is assembled
+            once all columns are converted.
+        :param drop_column_names: Boolean indicating whether the
+            attribute "names" of the columns should be removed
+            (as R's `data.frame()` does)
+        """
+        if isinstance(columns, rlc.NamedList):
+            items = ((nitem.name, nitem.value) for nitem in columns.items())
+        elif hasattr(columns, 'items'):
+            items = columns.items()
+        else:
+            items = columns
+        names = []
+        values = []
+        for k, v in items:
+            names.append(str(k))
+            values.append(v)
+        if py2rpy is None:
+            py2rpy = conversion.get_conversion().py2rpy
+        if max_workers is None:
+            rcolumns = [py2rpy(v) for v in values]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers
+            ) as executor:
+                # Conversion rules are in a context variable. Each
+                # conversion runs in a copy of the current context.
+                futures = [
+                    executor.submit(contextvars.copy_context().run,
+                                    py2rpy, v)
+                    for v in values
+                ]
+                rcolumns = [f.result() for f in futures]
+        res = rinterface.dataframe_from_columns(
+            rcolumns, names,
+            rownames=rownames,
+            drop_column_names=drop_column_names
+        )
+        return cls(res)
+
     @classmethod
     def from_csvfile(cls, path, header=True, sep=',',
                      quote='"', dec='.',